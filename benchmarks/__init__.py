@@ -0,0 +1 @@
+"""Performance benchmarks for metaflow-argo-events; run with ``python -m benchmarks.run``."""
@@ -0,0 +1,46 @@
+"""Memory and serialization cost of pending events held as models vs one columnar EventBatch."""
+
+import uuid
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.models import ArgoEventPayload, EventBatch
+from metaflow_argo_events.models.trusted import dump_json_bytes, trusted_event_payload
+
+EVENTS = 100_000
+PAYLOAD = {"status": "success", "count": "42", "flow": "DataProcessingFlow"}
+
+
+def build_models() -> list[ArgoEventPayload]:
+    return [
+        trusted_event_payload("data_processed", str(uuid.uuid4()), 1684159845 + i, "20230515", PAYLOAD)
+        for i in range(EVENTS)
+    ]
+
+
+def build_batch() -> EventBatch:
+    batch = EventBatch()
+    for i in range(EVENTS):
+        batch.append("data_processed", str(uuid.uuid4()), 1684159845 + i, "20230515", PAYLOAD)
+    return batch
+
+
+@benchmark("pending.models_100k", "pending", items=EVENTS, repeat=3, memory=True)
+def bench_models() -> Callable[[], list[ArgoEventPayload]]:
+    return build_models
+
+
+@benchmark("pending.event_batch_100k", "pending", items=EVENTS, repeat=3, memory=True)
+def bench_batch() -> Callable[[], EventBatch]:
+    return build_batch
+
+
+@benchmark("pending.models_ndjson_100k", "pending", items=EVENTS, repeat=3)
+def bench_models_ndjson() -> Callable[[], bytes]:
+    models = build_models()
+    return lambda: b"".join(dump_json_bytes(model) + b"\n" for model in models)
+
+
+@benchmark("pending.event_batch_ndjson_100k", "pending", items=EVENTS, repeat=3)
+def bench_batch_ndjson() -> Callable[[], bytes]:
+    return build_batch().to_ndjson
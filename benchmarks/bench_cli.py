@@ -0,0 +1,14 @@
+"""Cold-start time of ``metaflow-events --version`` in a fresh interpreter."""
+
+import subprocess
+import sys
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+
+VERSION_COMMAND = [sys.executable, "-c", "from metaflow_argo_events.cli.main import app; app()", "--version"]
+
+
+@benchmark("cli.version_cold_start", "cli", repeat=10)
+def bench_version() -> Callable[[], None]:
+    return lambda: subprocess.run(VERSION_COMMAND, check=True, capture_output=True)  # noqa: S603
@@ -0,0 +1,68 @@
+"""Cost of ``format_output``, ``write_output`` and of the rich table renderers in ``cli.format``."""
+
+import io
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.cli import format as cli_format
+from metaflow_argo_events.cli.console import get_console
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+QUICK_MAX_SIZE = 100_000
+QUICK_MAX_YAML_SIZE = 10_000
+RENDER_ITEMS = 200
+
+
+def _records(count: int) -> list[dict[str, object]]:
+    return [{"name": f"param_{i}", "type": "int", "default": i, "required": i % 2 == 0} for i in range(count)]
+
+
+def _register_format(output_format: str, size: int) -> None:
+    # The largest inputs (and yaml past 10k items) take long enough to be opt-in via --full.
+    quick = size <= (QUICK_MAX_YAML_SIZE if output_format == "yaml" else QUICK_MAX_SIZE)
+
+    @benchmark(f"format.{output_format}_{size}", "format", items=size, repeat=3, quick=quick)
+    def bench() -> Callable[[], str]:
+        data = _records(size)
+        return lambda: cli_format.format_output(data, output_format)
+
+
+def _register_stream(output_format: str, size: int) -> None:
+    quick = size <= (QUICK_MAX_YAML_SIZE if output_format == "yaml" else QUICK_MAX_SIZE)
+
+    @benchmark(f"stream.{output_format}_{size}", "stream", items=size, repeat=3, quick=quick)
+    def bench() -> Callable[[], None]:
+        data = _records(size)
+        return lambda: cli_format.write_output(iter(data), output_format, io.StringIO())
+
+
+for _output_format in ("json", "ndjson", "yaml", "text"):
+    for _size in SIZES:
+        _register_format(_output_format, _size)
+        _register_stream(_output_format, _size)
+
+
+def _silenced(render: Callable[[], None]) -> Callable[[], None]:
+    console = get_console()
+
+    def run() -> None:
+        original = console.file
+        console.file = io.StringIO()
+        try:
+            render()
+        finally:
+            console.file = original
+
+    return run
+
+
+@benchmark("render.display_dict", "render", items=RENDER_ITEMS)
+def bench_display_dict() -> Callable[[], None]:
+    data = {f"key_{i}": {"value": i, "tags": ["a", "b"]} if i % 5 == 0 else f"value {i}" for i in range(RENDER_ITEMS)}
+    return _silenced(lambda: cli_format.display_dict(data, title="Benchmark"))
+
+
+@benchmark("render.display_list", "render", items=RENDER_ITEMS)
+def bench_display_list() -> Callable[[], None]:
+    data = [{"name": f"param_{i}", "type": "str"} if i % 2 else f"item {i}" for i in range(RENDER_ITEMS)]
+    return _silenced(lambda: cli_format.display_list(data, title="Benchmark"))
@@ -0,0 +1,39 @@
+"""Per-event cost of logging on the publish path for each sink mode in ``logger``."""
+
+import os
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.logger import configure_logging, flush_logs, get_context_logger
+
+EVENTS = 10_000
+
+# Mode name -> json_lines, enqueue and rate_limit settings.
+MODES = {
+    "text_sync": (False, False, 0.0),
+    "json_sync": (True, False, 0.0),
+    "json_enqueue": (True, True, 0.0),
+    "json_enqueue_rate_limited": (True, True, 100.0),
+}
+
+
+def _register(mode: str, json_lines: bool, enqueue: bool, rate_limit: float) -> None:
+    @benchmark(f"logging.{mode}_10k", "logging", items=EVENTS, repeat=3)
+    def bench() -> Callable[[], None]:
+        # Writing to /dev/null keeps terminal speed out of the numbers; the sink is left in place
+        # afterwards, which is harmless since benchmarks do not assert on log output.
+        stream = open(os.devnull, "w")  # noqa: PTH123, SIM115
+        configure_logging(json_lines=json_lines, enqueue=enqueue, rate_limit=rate_limit, stream=stream)
+        logger = get_context_logger("publish", flow="DataProcessingFlow", step="end")
+
+        def run() -> None:
+            for _ in range(EVENTS):
+                logger.warning("Argo Event (data_processed) failed to publish")
+            # Count the background writer too, so enqueue is not credited with work it only defers.
+            flush_logs()
+
+        return run
+
+
+for _mode, (_json_lines, _enqueue, _rate_limit) in MODES.items():
+    _register(_mode, _json_lines, _enqueue, _rate_limit)
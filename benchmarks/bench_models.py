@@ -0,0 +1,128 @@
+"""Validation throughput of the parameter and event models."""
+
+import json
+from collections.abc import Callable
+
+from pydantic import ValidationError
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.models import (
+    ArgoEventPayload,
+    FlowParameters,
+    JSONParameterModel,
+    LazyJSONParameterModel,
+    ParameterError,
+    ParameterListResponse,
+    ParameterModel,
+    ParameterResponse,
+    validate_parameters,
+)
+
+ITEMS = 10_000
+JSON_KEYS = 20_000
+
+
+def _parameter(i: int) -> dict[str, object]:
+    return {"name": f"param_{i}", "type": "str", "help": "Input path", "default": "/data/in.csv", "separator": ","}
+
+
+@benchmark("models.parameter_model", "models", items=ITEMS)
+def bench_parameter_model() -> Callable[[], None]:
+    raw = [_parameter(i) for i in range(ITEMS)]
+
+    def run() -> None:
+        for item in raw:
+            ParameterModel.model_validate(item)
+
+    return run
+
+
+def _mixed_parameter(i: int) -> dict[str, object]:
+    # Every fourth definition has an unsupported type and every tenth a reserved name.
+    parameter = {"name": "tags" if i % 10 == 0 else f"param_{i}", "type": "map" if i % 4 == 0 else "int"}
+    return {**parameter, "default": i, "required": i % 2 == 0}
+
+
+@benchmark("models.parameter_model_errors", "models", items=ITEMS)
+def bench_parameter_model_errors() -> Callable[[], None]:
+    # What collecting every problem costs with one model validation (and exception) per item.
+    raw = [_mixed_parameter(i) for i in range(ITEMS)]
+
+    def run() -> None:
+        parameters, errors = [], []
+        for item in raw:
+            try:
+                model = ParameterModel.model_validate(item)
+            except ValidationError as err:
+                errors.extend(
+                    ParameterError(error_code=detail["type"], message=detail["msg"], field=str(detail["loc"][0]))
+                    for detail in err.errors()
+                )
+                continue
+            parameters.append(ParameterResponse(**model.model_dump(), is_string_type=model.type == "str"))
+        ParameterListResponse(parameters=parameters, count=len(parameters))
+
+    return run
+
+
+@benchmark("models.validate_parameters_errors", "models", items=ITEMS)
+def bench_validate_parameters_errors() -> Callable[[], None]:
+    raw = [_mixed_parameter(i) for i in range(ITEMS)]
+    return lambda: validate_parameters(raw)
+
+
+@benchmark("models.flow_parameters", "models", items=ITEMS)
+def bench_flow_parameters() -> Callable[[], None]:
+    raw = {
+        "flow_name": "DataProcessingFlow",
+        "parameters": [{"name": f"param_{i}", "type": "int", "default": i} for i in range(ITEMS)],
+    }
+
+    def run() -> None:
+        FlowParameters.model_validate(raw)
+
+    return run
+
+
+@benchmark("models.argo_event_payload", "models", items=ITEMS)
+def bench_argo_event_payload() -> Callable[[], None]:
+    raw = [
+        {
+            "name": "data_processed",
+            "id": f"event-{i}",
+            "timestamp": 1684159845,
+            "utc_date": "20230515",
+            "status": "success",
+            "count": str(i),
+        }
+        for i in range(ITEMS)
+    ]
+
+    def run() -> None:
+        for item in raw:
+            ArgoEventPayload.model_validate(item)
+
+    return run
+
+
+def _large_json() -> str:
+    # About 3 MB, the size of a large config parameter.
+    return json.dumps({f"key_{i}": {"values": list(range(20)), "label": "x" * 50} for i in range(JSON_KEYS)})
+
+
+@benchmark("models.json_parameter_forward", "json", items=1, repeat=5)
+def bench_json_parameter_forward() -> Callable[[], None]:
+    raw = _large_json()
+    return lambda: JSONParameterModel(value=raw).model_dump_json()
+
+
+@benchmark("models.lazy_json_parameter_forward", "json", items=1, repeat=5)
+def bench_lazy_json_parameter_forward() -> Callable[[], None]:
+    raw = _large_json()
+    return lambda: LazyJSONParameterModel(value=raw).model_dump_json()
+
+
+@benchmark("models.lazy_json_parameter_read", "json", items=1, repeat=5)
+def bench_lazy_json_parameter_read() -> Callable[[], None]:
+    raw = _large_json()
+    return lambda: LazyJSONParameterModel(value=raw).value["key_0"]
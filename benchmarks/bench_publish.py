@@ -0,0 +1,32 @@
+"""End-to-end publish throughput against the in-process stand-in webhook."""
+
+import asyncio
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.models.argo_events import CreateArgoEventInput
+from metaflow_argo_events.publish.batch import BatchSettings
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.publisher import EventPublisher
+from metaflow_argo_events.publish.standin import StandInWebhook
+
+EVENTS = 2_000
+
+
+def _register(mode: str, batch: BatchSettings | None) -> None:
+    @benchmark(f"publish.{mode}_2k", "publish", items=EVENTS, repeat=3)
+    def bench() -> Callable[[], None]:
+        async def publish() -> None:
+            async with StandInWebhook() as standin:
+                event = CreateArgoEventInput(name="bench", url=standin.url, payload={"status": "ok"}, force=True)
+                async with EventPublisher(breaker=CircuitBreaker(), batch=batch) as publisher:
+                    await publisher.publish_many([event] * EVENTS)
+
+        def run() -> None:
+            asyncio.run(publish())
+
+        return run
+
+
+_register("single", None)
+_register("batched_gzip", BatchSettings(compression="gzip"))
@@ -0,0 +1,47 @@
+"""Per-event cost of validated vs trusted event construction and serialization."""
+
+import json
+from collections.abc import Callable
+
+from benchmarks.harness import benchmark
+from metaflow_argo_events.models import ArgoEventPayload, CreateArgoEventInput
+from metaflow_argo_events.models.trusted import (
+    encode_webhook_body,
+    trusted_create_event_input,
+    trusted_event_payload,
+)
+
+EVENTS = 100_000
+PAYLOAD = {"status": "success", "count": 42, "flow": "DataProcessingFlow"}
+
+
+def validated_event(i: int) -> bytes:
+    event = CreateArgoEventInput(name="data_processed", payload=PAYLOAD)
+    payload = ArgoEventPayload.model_validate(
+        {"name": event.name, "id": str(i), "timestamp": 1684159845, "utc_date": "20230515", **event.payload}
+    )
+    return json.dumps({"name": payload.name, "payload": payload.model_dump(mode="json")}).encode()
+
+
+def trusted_event(i: int) -> bytes:
+    event = trusted_create_event_input("data_processed", PAYLOAD)
+    payload = trusted_event_payload(event.name, str(i), 1684159845, "20230515", event.payload)
+    return encode_webhook_body(payload)
+
+
+def _loop(build: Callable[[int], bytes]) -> Callable[[], None]:
+    def run() -> None:
+        for i in range(EVENTS):
+            build(i)
+
+    return run
+
+
+@benchmark("events.validated_100k", "events", items=EVENTS, repeat=3)
+def bench_validated() -> Callable[[], None]:
+    return _loop(validated_event)
+
+
+@benchmark("events.trusted_100k", "events", items=EVENTS, repeat=3)
+def bench_trusted() -> Callable[[], None]:
+    return _loop(trusted_event)
@@ -0,0 +1,175 @@
+"""Benchmark registry, timing and result (de)serialization shared by all benchmark modules."""
+
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], object]]
+    items: int = 1
+    repeat: int = 5
+    quick: bool = True
+    memory: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    items: int
+    repeat: int
+    times: list[float]
+    retained_bytes: int | None = None
+    min: float = field(init=False)
+    median: float = field(init=False)
+    mean: float = field(init=False)
+    stdev: float = field(init=False)
+    per_item: float = field(init=False)
+    items_per_second: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.min = min(self.times)
+        self.median = statistics.median(self.times)
+        self.mean = statistics.fmean(self.times)
+        self.stdev = statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+        self.per_item = self.median / self.items
+        self.items_per_second = self.items / self.median if self.median else float("inf")
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(  # noqa: PLR0913
+    name: str,
+    group: str,
+    *,
+    items: int = 1,
+    repeat: int = 5,
+    quick: bool = True,
+    memory: bool = False,
+) -> Callable[[Callable[[], Callable[[], object]]], Callable[[], Callable[[], object]]]:
+    """
+    Register a benchmark.
+
+    The decorated function performs any setup and returns the zero-argument callable to time;
+    ``items`` is the number of logical operations one call performs, used for per-item cost.
+    Benchmarks with ``quick=False`` only run with ``--full``. With ``memory=True`` the memory
+    still allocated while the callable's return value is alive is also recorded.
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        REGISTRY.append(Benchmark(name, group, setup, items, repeat, quick, memory))
+        return setup
+
+    return register
+
+
+def run_benchmark(bench: Benchmark, repeat: int | None = None) -> BenchmarkResult:
+    target = bench.setup()
+    target()  # warm-up: populate caches, import lazily loaded modules
+    times: list[float] = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat or bench.repeat):
+            start = time.perf_counter()
+            target()
+            times.append(time.perf_counter() - start)
+            gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    retained = _retained_bytes(target) if bench.memory else None
+    return BenchmarkResult(bench.name, bench.group, bench.items, len(times), times, retained)
+
+
+def _retained_bytes(target: Callable[[], object]) -> int:
+    # Measured in a separate call: tracing allocations slows them down several times over.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = target()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "executable": sys.executable,
+        "package_version": __version__,
+        "git_revision": _git_revision(),
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+def results_document(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment(),
+        "benchmarks": [asdict(result) for result in results],
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    """
+    Pair up benchmarks present in both documents by name.
+
+    Runs are compared on their fastest repetition, which is far less sensitive to scheduler
+    noise than the median.
+    """
+    previous = {entry["name"]: entry["min"] / entry["items"] for entry in baseline.get("benchmarks", [])}
+    return [
+        Comparison(entry["name"], previous[entry["name"]], entry["min"] / entry["items"])
+        for entry in current["benchmarks"]
+        if entry["name"] in previous
+    ]
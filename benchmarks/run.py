@@ -0,0 +1,78 @@
+"""
+Run the benchmark suite and store the results as JSON.
+
+Examples::
+
+    python -m benchmarks.run                          # quick suite, writes .benchmarks/<timestamp>.json
+    python -m benchmarks.run --full -o base.json      # include the 1M-item cases
+    python -m benchmarks.run --compare base.json      # fail if anything got >10% slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+from benchmarks import (  # noqa: F401  (registration)
+    bench_batch,
+    bench_cli,
+    bench_format,
+    bench_logging,
+    bench_models,
+    bench_publish,
+    bench_trusted,
+)
+from benchmarks.harness import REGISTRY, compare, results_document, run_benchmark
+
+DEFAULT_RESULTS_DIR = Path(".benchmarks")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run metaflow-argo-events benchmarks.")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--full", action="store_true", help="Include slow, large-input benchmarks.")
+    parser.add_argument("--repeat", type=int, default=None, help="Override the number of timed repetitions.")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="Where to write the JSON results.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline results to compare against.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression (default 0.10)."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    selected = [b for b in REGISTRY if args.filter in b.name and (args.full or b.quick)]
+
+    results = []
+    for bench in selected:
+        result = run_benchmark(bench, args.repeat)
+        results.append(result)
+        line = f"{result.name:<36} {result.median * 1e3:10.3f} ms  {result.per_item * 1e6:10.3f} us/item"
+        if result.retained_bytes is not None:
+            line += f"  {result.retained_bytes / result.items:10.1f} B/item retained"
+        print(line)
+
+    document = results_document(results)
+    output = args.output or DEFAULT_RESULTS_DIR / f"{datetime.now(UTC):%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare is None:
+        return 0
+    regressions = 0
+    print(f"\nCompared with {args.compare}:")
+    for comparison in compare(json.loads(args.compare.read_text()), document):
+        regressed = comparison.ratio > 1 + args.threshold
+        regressions += regressed
+        marker = "REGRESSION" if regressed else ""
+        print(f"{comparison.name:<36} {comparison.ratio:8.2f}x {marker}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,52 @@
-from metaflow_argo_events.cli.console import get_console, get_error_console
-from metaflow_argo_events.cli.format import (
-    display_dict,
-    display_list,
-    format_output,
-    format_success,
-)
-from metaflow_argo_events.cli.main import app
-from metaflow_argo_events.exceptions import (
-    CliError,
-    SchemaError,
-    ValidationError,
-    handle_error,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from metaflow_argo_events.cli.console import get_console, get_error_console
+    from metaflow_argo_events.cli.format import (
+        display_dict,
+        display_list,
+        format_output,
+        format_success,
+        iter_output,
+        write_output,
+    )
+    from metaflow_argo_events.cli.main import app
+    from metaflow_argo_events.exceptions import (
+        CliError,
+        SchemaError,
+        ValidationError,
+        handle_error,
+    )
+
+# Resolved on first access: `metaflow_argo_events.exceptions` imports `cli.console`, so importing
+# it eagerly here would make `import metaflow_argo_events.exceptions` circular.
+_EXPORTS = {
+    "app": "metaflow_argo_events.cli.main",
+    "CliError": "metaflow_argo_events.exceptions",
+    "display_dict": "metaflow_argo_events.cli.format",
+    "display_list": "metaflow_argo_events.cli.format",
+    "format_output": "metaflow_argo_events.cli.format",
+    "format_success": "metaflow_argo_events.cli.format",
+    "get_console": "metaflow_argo_events.cli.console",
+    "get_error_console": "metaflow_argo_events.cli.console",
+    "handle_error": "metaflow_argo_events.exceptions",
+    "iter_output": "metaflow_argo_events.cli.format",
+    "SchemaError": "metaflow_argo_events.exceptions",
+    "ValidationError": "metaflow_argo_events.exceptions",
+    "write_output": "metaflow_argo_events.cli.format",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "app",
@@ -23,6 +58,8 @@ __all__ = [
     "get_console",
     "get_error_console",
     "handle_error",
+    "iter_output",
     "SchemaError",
     "ValidationError",
+    "write_output",
 ]
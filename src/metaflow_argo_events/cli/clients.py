@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import typer
+
+from metaflow_argo_events.cli.format import format_success, print_output
+from metaflow_argo_events.exceptions import CliError, SchemaError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.schema.clients import (
+    DEFAULT_CLIENT_CACHE_DIR,
+    FAILED,
+    ClientTarget,
+    clear_client_cache,
+    find_generator,
+    generate_clients,
+)
+
+logger = get_logger("cli.clients")
+
+app = typer.Typer(help="Generate client libraries from OpenAPI specs.", no_args_is_help=True)
+
+CacheDirOption = typer.Option(
+    DEFAULT_CLIENT_CACHE_DIR,
+    "--cache-dir",
+    help="Generated client cache.",
+    envvar="METAFLOW_EVENTS_CLIENT_CACHE_DIR",
+)
+
+
+@app.command("generate")
+def generate(
+    specs: list[Path] = typer.Argument(..., help="OpenAPI specs, such as those written by `openapi generate`."),
+    languages: list[str] = typer.Option(
+        ["python"], "--language", "-l", help="openapi-generator generator name; repeat for several."
+    ),
+    output_dir: Path = typer.Option(
+        Path("clients"), "--output-dir", "-o", help="Clients are written to <output-dir>/<spec name>/<language>."
+    ),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Clients generated in parallel by the generator.", min=1),
+    cache_dir: Path = CacheDirOption,
+    generator: str | None = typer.Option(
+        None,
+        "--generator",
+        help="Generator command (default: openapi-generator-cli on PATH).",
+        envvar="METAFLOW_EVENTS_OPENAPI_GENERATOR",
+    ),
+    force: bool = typer.Option(False, "--force", help="Regenerate every client, ignoring the cache."),
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """
+    Generate a client per spec and language with a single generator run.
+
+    Clients whose spec, language and generator version are unchanged are left alone, and ones
+    generated before are restored from the cache without running the generator.
+    """
+    targets = [
+        ClientTarget(spec, language, output_dir / spec.stem / language) for spec in specs for language in languages
+    ]
+    try:
+        results = generate_clients(
+            targets, command=find_generator(generator), cache_dir=cache_dir, jobs=jobs, force=force
+        )
+    except (CliError, OSError) as err:
+        handle_error(err if isinstance(err, CliError) else CliError(f"{type(err).__name__}: {err}"))
+        return
+
+    failed = [
+        f"{result.target.spec} ({result.target.language}): {result.error}"
+        for result in results
+        if result.status == FAILED
+    ]
+    if output_format.lower() != "text":
+        print_output([result.to_dict() for result in results], output_format)
+    else:
+        counts: dict[str, int] = {}
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        if not failed:
+            format_success(f"{len(results)} clients up to date", counts)
+    if failed:
+        handle_error(SchemaError.client_generation_failed(failed))
+
+
+@app.command("clear-cache")
+def clear_cache(cache_dir: Path = CacheDirOption) -> None:
+    """Remove every cached client."""
+    removed = clear_client_cache(cache_dir)
+    format_success(f"Removed {removed} cached clients")
@@ -1,13 +1,19 @@
-from rich.console import Console
+from functools import cache
+from typing import TYPE_CHECKING
 
-_console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
 
-_error_console = Console(stderr=True)
 
+@cache
+def get_console() -> "Console":
+    from rich.console import Console
 
-def get_console() -> Console:
-    return _console
+    return Console()
 
 
-def get_error_console() -> Console:
-    return _error_console
+@cache
+def get_error_console() -> "Console":
+    from rich.console import Console
+
+    return Console(stderr=True)
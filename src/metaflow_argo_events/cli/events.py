@@ -0,0 +1,152 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+import typer
+
+from metaflow_argo_events.cli.console import get_console
+from metaflow_argo_events.cli.format import print_output
+from metaflow_argo_events.exceptions import EventError, ValidationError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.publish.history import DEFAULT_HISTORY_PATH, EventHistory, HistoryQuery
+
+logger = get_logger("cli.events")
+
+app = typer.Typer(help="Query the local history of published events.", no_args_is_help=True)
+
+DatabaseOption = typer.Option(
+    DEFAULT_HISTORY_PATH,
+    "--db",
+    help="Event history database.",
+    envvar="METAFLOW_EVENTS_HISTORY_PATH",
+)
+NameOption = typer.Option(None, "--name", "-n", help="Only events with this name.")
+DateOption = typer.Option(None, "--date", help="Only events whose utc_date is this day (YYYYMMDD).")
+SinceOption = typer.Option(None, "--since", help="Only events at or after this time (YYYYMMDD, ISO 8601 or Unix).")
+UntilOption = typer.Option(None, "--until", help="Only events at or before this time (YYYYMMDD, ISO 8601 or Unix).")
+StatusOption = typer.Option(None, "--status", help="Only events with this status: published, spooled or failed.")
+FormatOption = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml.")
+
+_DAY_SECONDS = 86_400
+
+
+def parse_time(value: str | None, *, end_of_day: bool = False) -> int | None:
+    """
+    Parse a Unix timestamp, a YYYYMMDD day or an ISO 8601 time (UTC unless it has an offset).
+
+    A bare day means its first second, or its last one when ``end_of_day`` is set.
+    """
+    if value is None:
+        return None
+    text = value.strip()
+    try:
+        if len(text) == 8 and text.isdigit():  # noqa: PLR2004
+            start = datetime.strptime(text, "%Y%m%d").replace(tzinfo=UTC)
+            return int(start.timestamp()) + (_DAY_SECONDS - 1 if end_of_day else 0)
+        if text.isdigit():
+            return int(text)
+        moment = datetime.fromisoformat(text)
+    except ValueError as err:
+        msg = f"Invalid time '{value}'"
+        raise ValidationError(msg, hint="Use YYYYMMDD, an ISO 8601 time or a Unix timestamp.") from err
+    return int((moment if moment.tzinfo else moment.replace(tzinfo=UTC)).timestamp())
+
+
+def _open(database: Path) -> EventHistory:
+    if not database.exists():
+        msg = f"No event history at {database}"
+        raise EventError(msg, hint="Set METAFLOW_EVENTS_HISTORY_PATH in publishing processes to record events.")
+    return EventHistory(database)
+
+
+def _build_query(
+    name: str | None,
+    date: str | None,
+    since: str | None,
+    until: str | None,
+    status: str | None,
+) -> HistoryQuery:
+    return HistoryQuery(name, date, parse_time(since), parse_time(until, end_of_day=True), status)
+
+
+@app.command("list")
+def list_events(
+    database: Path = DatabaseOption,
+    name: str | None = NameOption,
+    date: str | None = DateOption,
+    since: str | None = SinceOption,
+    until: str | None = UntilOption,
+    status: str | None = StatusOption,
+    limit: int = typer.Option(50, "--limit", "-l", help="Maximum number of events to show (0 for all).", min=0),
+    output_format: str = FormatOption,
+) -> None:
+    """List recorded events, newest first."""
+    try:
+        history = _open(database)
+        try:
+            events = history.query(_build_query(name, date, since, until, status), limit=limit or None)
+        finally:
+            history.close()
+    except (EventError, ValidationError) as err:
+        handle_error(err)
+        return
+
+    rows = [event.model_dump() for event in events]
+    if output_format.lower() != "text":
+        print_output(rows, output_format)
+        return
+    if not rows:
+        typer.echo("No matching events.")
+        return
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold")
+    for column in ("Time (UTC)", "Name", "Status", "Event ID", "Payload"):
+        table.add_column(column)
+    for event in events:
+        moment = datetime.fromtimestamp(event.timestamp, UTC).strftime("%Y-%m-%d %H:%M:%S")
+        payload = ", ".join(f"{key}={value}" for key, value in (event.payload or {}).items())
+        table.add_row(moment, event.name, event.status, event.event_id, payload)
+    get_console().print(table)
+
+
+@app.command("count")
+def count_events(
+    database: Path = DatabaseOption,
+    name: str | None = NameOption,
+    date: str | None = DateOption,
+    since: str | None = SinceOption,
+    until: str | None = UntilOption,
+    status: str | None = StatusOption,
+) -> None:
+    """Count recorded events matching the filters."""
+    try:
+        history = _open(database)
+        try:
+            total = history.count(_build_query(name, date, since, until, status))
+        finally:
+            history.close()
+    except (EventError, ValidationError) as err:
+        handle_error(err)
+        return
+    typer.echo(total)
+
+
+@app.command("show")
+def show_event(
+    event_id: str = typer.Argument(..., help="Event ID to look up."),
+    database: Path = DatabaseOption,
+    output_format: str = FormatOption,
+) -> None:
+    """Show one recorded event."""
+    try:
+        history = _open(database)
+        try:
+            event = history.get(event_id)
+        finally:
+            history.close()
+        if event is None:
+            raise EventError.not_found(event_id)
+    except EventError as err:
+        handle_error(err)
+        return
+    print_output(event.model_dump(), output_format)
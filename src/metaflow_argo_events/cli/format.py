@@ -1,9 +1,8 @@
 import json
-from typing import Any, TypeVar
-
-import yaml
-from rich.markdown import Markdown
-from rich.table import Table
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO, TypeVar
 
 from metaflow_argo_events.cli.console import get_console, get_error_console
 from metaflow_argo_events.logger import get_logger
@@ -16,7 +15,7 @@ T = TypeVar("T")
 
 
 def format_success(message: str, data: T | None = None) -> None:
-    logger.info("Success: %s", message)
+    logger.info("Success: {}", message)
     console.print(f"[bold green]✓[/bold green] {message}")
     if data:
         if isinstance(data, dict):
@@ -28,6 +27,8 @@ def format_success(message: str, data: T | None = None) -> None:
 
 
 def display_dict(data: dict[str, Any], title: str | None = None) -> None:
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold", expand=True)
     table.add_column("Key")
     table.add_column("Value")
@@ -37,7 +38,7 @@ def display_dict(data: dict[str, Any], title: str | None = None) -> None:
         table.add_row(str(key), value_str)
 
     if title:
-        logger.debug("Displaying dictionary table: %s", title)
+        logger.debug("Displaying dictionary table: {}", title)
         console.print(f"[bold]{title}[/bold]")
     else:
         logger.debug("Displaying dictionary table")
@@ -47,7 +48,7 @@ def display_dict(data: dict[str, Any], title: str | None = None) -> None:
 
 def display_list(data: list[T], title: str | None = None) -> None:
     if title:
-        logger.debug("Displaying list: %s", title)
+        logger.debug("Displaying list: {}", title)
         console.print(f"[bold]{title}[/bold]")
     else:
         logger.debug("Displaying list")
@@ -60,25 +61,133 @@ def display_list(data: list[T], title: str | None = None) -> None:
             console.print(f"{i}. {item}")
 
 
-def format_output(data: T, output_format: str = "text") -> str:
-    logger.debug("Formatting output as %s", output_format)
+STREAM_FORMATS = frozenset({"ndjson", "yaml"})
+_INDENTED = json.JSONEncoder(indent=2)
+_COMPACT = json.JSONEncoder(separators=(",", ":"))
+_YAML_BATCH = 256
+
+
+class _ListWriter:
+    __slots__ = ("write",)
+
+    def __init__(self, buffer: list[str]) -> None:
+        self.write = buffer.append
+
+
+def _is_stream(data: object) -> bool:
+    # Lists are materialized already; any other iterable (generators, iterators, views) is
+    # consumed lazily. Strings, bytes and mappings are single values.
+    return isinstance(data, Iterable) and not isinstance(data, str | bytes | dict | list | tuple)
+
+
+def _json_array(items: Iterable[Any]) -> Iterator[str]:
+    # Produces exactly what `json.dumps(list(items), indent=2)` would, one item at a time.
+    separator = "[\n"
+    for item in items:
+        yield separator
+        yield "  " + _INDENTED.encode(item).replace("\n", "\n  ")
+        separator = ",\n"
+    yield "[]" if separator == "[\n" else "\n]"
+
+
+def _yaml_chunks(data: Any) -> Iterator[str]:
+    import yaml
+
+    if _is_stream(data):
+        # One YAML document per item, so readers can consume the output incrementally too. A
+        # single dumper is reused for the whole stream, as `yaml.dump_all` does.
+        buffer: list[str] = []
+        dumper = yaml.Dumper(_ListWriter(buffer), sort_keys=False, explicit_start=True)
+        dumper.open()
+        for item in data:
+            dumper.represent(item)
+            yield "".join(buffer)
+            buffer.clear()
+        dumper.close()
+        dumper.dispose()
+        yield "".join(buffer)
+    elif isinstance(data, list | tuple) and len(data) > _YAML_BATCH:
+        # Chunks are dumped separately, so an anchor defined in one chunk cannot be referenced
+        # from the next, and two chunks would each define `&id001`. Long lists therefore write
+        # shared objects out in full wherever they occur instead of as anchors and aliases.
+        class _UnaliasedDumper(yaml.Dumper):
+            def ignore_aliases(self, data: Any) -> bool:  # noqa: ARG002
+                return True
+
+        for start in range(0, len(data), _YAML_BATCH):
+            yield yaml.dump(list(data[start : start + _YAML_BATCH]), Dumper=_UnaliasedDumper, sort_keys=False)
+    else:
+        yield yaml.dump(data, sort_keys=False)
+
+
+def iter_output(data: Any, output_format: str = "text") -> Iterator[str]:
+    """
+    Yield ``data`` formatted as ``output_format`` in chunks, without building the whole string.
+
+    Lists and iterators are emitted item by item: ``ndjson`` writes one compact JSON document per
+    line, ``yaml`` writes a multi-document stream for iterators and ``json`` a streamed array.
+    YAML for lists longer than one batch is written without anchors, so objects that appear
+    more than once are repeated rather than aliased.
+    """
     match output_format.lower():
-        case "json":
-            return json.dumps(data, indent=2)
+        case "ndjson":
+            items = data if _is_stream(data) or isinstance(data, list | tuple) else [data]
+            for item in items:
+                yield _COMPACT.encode(item) + "\n"
         case "yaml":
-            return yaml.dump(data, sort_keys=False)
+            yield from _yaml_chunks(data)
+        case "json" if _is_stream(data):
+            yield from _json_array(data)
+        case "json":
+            yield from _INDENTED.iterencode(data)
+        case _ if _is_stream(data):
+            for item in data:
+                yield (json.dumps(item) if isinstance(item, dict | list) else str(item)) + "\n"
         case _:
-            return json.dumps(data, indent=2) if isinstance(data, dict | list) else str(data)
+            yield json.dumps(data, indent=2) if isinstance(data, dict | list) else str(data)
+
+
+def format_output(data: T, output_format: str = "text") -> str:
+    logger.debug("Formatting output as {}", output_format)
+    if not _is_stream(data):
+        match output_format.lower():
+            case "json":
+                return _INDENTED.encode(data)
+            case "yaml":
+                import yaml
+
+                return yaml.dump(data, sort_keys=False)
+    return "".join(iter_output(data, output_format))
+
+
+def write_output(data: Any, output_format: str = "text", stream: TextIO | None = None) -> None:
+    """Write ``data`` to ``stream`` (stdout by default) chunk by chunk, bypassing rich."""
+    stream = stream or sys.stdout
+    try:
+        for chunk in iter_output(data, output_format):
+            stream.write(chunk)
+        if output_format.lower() not in STREAM_FORMATS and not _is_stream(data):
+            stream.write("\n")
+        stream.flush()
+    except BrokenPipeError:
+        # The reader went away (`... | head`); stop quietly instead of failing on interpreter exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stream.fileno())
 
 
 def print_output(data: T, output_format: str = "text") -> None:
-    logger.info("Printing output in %s format", output_format)
+    logger.info("Printing output in {} format", output_format)
+    if not sys.stdout.isatty():
+        write_output(data, output_format)
+        return
+    if output_format.lower() in STREAM_FORMATS or _is_stream(data):
+        for chunk in iter_output(data, output_format):
+            console.print(chunk, end="", markup=False, soft_wrap=True)
+        return
     formatted_output = format_output(data, output_format)
     match output_format.lower():
         case "json":
             console.print_json(formatted_output)
-        case "yaml":
-            console.print(formatted_output)
         case _:
             console.print(formatted_output)
 
@@ -87,13 +196,15 @@ def display_schema(schema: dict[str, Any]) -> None:
     schema_name = schema.get("name", "Unnamed")
     schema_version = schema.get("version", "Unversioned")
 
-    logger.info("Displaying schema: %s (v%s)", schema_name, schema_version)
+    logger.info("Displaying schema: {} (v{})", schema_name, schema_version)
     console.print(f"[bold]Schema:[/bold] {schema_name}")
     console.print(f"[bold]Version:[/bold] {schema_version}")
 
     if "parameters" in schema and isinstance(schema["parameters"], list):
-        logger.debug("Schema has %s parameters", len(schema["parameters"]))
+        logger.debug("Schema has {} parameters", len(schema["parameters"]))
         console.print("\n[bold]Parameters:[/bold]")
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold", expand=True)
         table.add_column("Name")
         table.add_column("Type")
@@ -112,6 +223,8 @@ def display_schema(schema: dict[str, Any]) -> None:
 
 
 def display_markdown(text: str) -> None:
+    from rich.markdown import Markdown
+
     logger.debug("Displaying markdown content")
     md = Markdown(text)
     console.print(md)
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any
+
+import typer
+
+from metaflow_argo_events.cli.format import print_output
+from metaflow_argo_events.exceptions import CliError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.publish.batch import BatchSettings
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.loadtest import run_load_test
+from metaflow_argo_events.publish.publisher import EventPublisher
+from metaflow_argo_events.publish.standin import Faults, StandInWebhook, run_standin
+
+logger = get_logger("cli.loadtest")
+
+app = typer.Typer(help="Measure publishing throughput and latency against a webhook.")
+standin_app = typer.Typer(help="Run a local stand-in Argo Events webhook.")
+
+LatencyOption = typer.Option(0.0, "--latency", help="Seconds the stand-in waits before answering each request.")
+JitterOption = typer.Option(0.0, "--jitter", help="Up to this many extra seconds of random latency.")
+ErrorRateOption = typer.Option(0.0, "--error-rate", help="Fraction of requests answered with 500.", min=0, max=1)
+ThrottleRateOption = typer.Option(0.0, "--throttle-rate", help="Fraction of requests answered with 429.", min=0, max=1)
+RetryAfterOption = typer.Option(None, "--retry-after", help="Retry-After seconds sent with each 429.")
+SeedOption = typer.Option(None, "--seed", help="Seed for the injected faults, for repeatable runs.")
+
+
+@app.command("loadtest")
+def loadtest(
+    rate: float = typer.Option(500.0, "--rate", "-r", help="Target events per second.", min=0.001),
+    duration: float = typer.Option(10.0, "--duration", "-t", help="Seconds to generate load for.", min=0.001),
+    url: str | None = typer.Option(
+        None,
+        "--url",
+        help="Webhook to load. Defaults to a stand-in started in this process, which shares its CPU.",
+    ),
+    max_in_flight: int = typer.Option(64, "--max-in-flight", help="Maximum concurrent webhook requests."),
+    batch: bool = typer.Option(False, "--batch", help="Send events in compressed batch envelopes."),
+    batch_size: int = typer.Option(500, "--batch-size", help="Maximum events per batch envelope."),
+    payload_size: int = typer.Option(64, "--payload-size", help="Bytes of padding in each event payload."),
+    latency: float = LatencyOption,
+    jitter: float = JitterOption,
+    error_rate: float = ErrorRateOption,
+    throttle_rate: float = ThrottleRateOption,
+    retry_after: float | None = RetryAfterOption,
+    seed: int | None = SeedOption,
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """
+    Publish at a fixed rate and report throughput and p50/p95/p99 latency.
+
+    Latency is measured from when each event was scheduled, so a publisher that cannot keep up
+    shows growing latency. Fault options apply to the in-process stand-in only.
+    """
+    try:
+        faults = Faults(latency, jitter, error_rate, throttle_rate, retry_after)
+        batch_settings = BatchSettings(max_events=batch_size) if batch else None
+    except ValueError as err:
+        handle_error(CliError(str(err)))
+        return
+
+    async def run() -> dict[str, Any]:
+        standin = StandInWebhook(faults=faults, seed=seed) if url is None else None
+        target = await standin.start() if standin is not None else str(url)
+        try:
+            # A private breaker so that one run's injected failures do not leak into the next.
+            async with EventPublisher(
+                max_in_flight=max_in_flight,
+                breaker=CircuitBreaker(),
+                batch=batch_settings,
+            ) as publisher:
+                result = await run_load_test(publisher, target, rate=rate, duration=duration, payload_size=payload_size)
+        finally:
+            if standin is not None:
+                await standin.close()
+        report = result.to_dict()
+        if standin is not None:
+            report.update({f"receiver_{key}": value for key, value in standin.stats.to_dict().items()})
+        return report
+
+    try:
+        report = asyncio.run(run())
+    except CliError as err:
+        handle_error(err)
+        return
+    print_output(report, output_format)
+
+
+@standin_app.command("standin")
+def standin(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on."),
+    port: int = typer.Option(12000, "--port", "-p", help="Port to listen on."),
+    latency: float = LatencyOption,
+    jitter: float = JitterOption,
+    error_rate: float = ErrorRateOption,
+    throttle_rate: float = ThrottleRateOption,
+    retry_after: float | None = RetryAfterOption,
+    seed: int | None = SeedOption,
+) -> None:
+    """Serve a stand-in webhook that accepts Argo event payloads and batch envelopes until interrupted."""
+    try:
+        faults = Faults(latency, jitter, error_rate, throttle_rate, retry_after)
+    except ValueError as err:
+        handle_error(CliError(str(err)))
+        return
+    typer.echo(f"Stand-in webhook on http://{host}:{port}/ (GET /stats for counters); press Ctrl+C to stop.")
+    run_standin(host, port, faults, seed)
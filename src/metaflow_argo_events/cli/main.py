@@ -1,14 +1,59 @@
-import importlib.metadata
+from __future__ import annotations
+
+from importlib import import_module
+from pathlib import Path  # noqa: TC003  # typer needs it at runtime
+from typing import TYPE_CHECKING
 
 import typer
+from typer.core import TyperGroup
 
+from metaflow_argo_events import __version__
 from metaflow_argo_events.cli.console import get_console
 from metaflow_argo_events.logger import configure_verbose_logging, get_logger
 
-console = get_console()
+if TYPE_CHECKING:
+    import click
+
 logger = get_logger("cli")
 
+# Subcommand groups are imported on first use so that `--version` and unrelated commands do not
+# pay for pydantic, the publisher or the formatting stack.
+LAZY_SUBCOMMANDS = {
+    "clients": "metaflow_argo_events.cli.clients:app",
+    "events": "metaflow_argo_events.cli.events:app",
+    "loadtest": "metaflow_argo_events.cli.loadtest:app",
+    "openapi": "metaflow_argo_events.cli.openapi:app",
+    "outbox": "metaflow_argo_events.cli.outbox:app",
+    "replay": "metaflow_argo_events.cli.replay:app",
+    "schema": "metaflow_argo_events.cli.schema:app",
+    "standin": "metaflow_argo_events.cli.loadtest:standin_app",
+    "stats": "metaflow_argo_events.cli.stats:app",
+}
+
+
+class LazyGroup(TyperGroup):
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if "--profile" in args:
+            from metaflow_argo_events.cli.profiling import expand_profile_flag
+
+            args = expand_profile_flag(args, self.list_commands(ctx))
+        return super().parse_args(ctx, args)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *LAZY_SUBCOMMANDS]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = LAZY_SUBCOMMANDS.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module_name, _, attribute = target.partition(":")
+        command = typer.main.get_command(getattr(import_module(module_name), attribute))
+        command.name = cmd_name
+        return command
+
+
 app = typer.Typer(
+    cls=LazyGroup,
     help="Metaflow OpenAPI utilities for Argo Events.",
     add_completion=True,
     pretty_exceptions_enable=True,
@@ -18,19 +63,29 @@ app = typer.Typer(
 
 def get_version() -> str:
     """Get current package version."""
-    try:
-        return importlib.metadata.version("metaflow-argo-events")
-    except importlib.metadata.PackageNotFoundError:
-        return "unknown"
+    return __version__
 
 
 def version_callback(value: bool) -> None:
     """Display version information and exit."""
     if value:
-        console.print(f"[bold]metaflow-events[/bold] version: {get_version()}")
+        get_console().print(f"[bold]metaflow-events[/bold] version: {get_version()}")
         raise typer.Exit()
 
 
+def profile_callback(ctx: typer.Context, value: str | None) -> str | None:
+    """Start profiling the rest of the invocation when ``--profile`` is given."""
+    if value is None:
+        return None
+    from metaflow_argo_events.cli.profiling import PROFILE_MODES, start_profiling
+
+    if value not in PROFILE_MODES:
+        msg = f"expected one of {', '.join(PROFILE_MODES)}, got {value!r}"
+        raise typer.BadParameter(msg)
+    start_profiling(ctx, value)
+    return value
+
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -49,6 +104,24 @@ def main(
         help="Enable verbose output.",
         is_flag=True,
     ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        help="Profile the command: 'cpu' (cProfile, the default) or 'mem' (tracemalloc). Reports go to stderr.",
+        metavar="[cpu|mem]",
+        callback=profile_callback,
+    ),
+    profile_output: Path | None = typer.Option(
+        None,
+        "--profile-output",
+        help="File for the profile data (default: metaflow-events-<command>-<time>.prof in the working directory).",
+    ),
+    profile_top: int = typer.Option(
+        25,
+        "--profile-top",
+        help="Number of entries shown in the profile report.",
+        min=1,
+    ),
 ) -> None:
     """
     Metaflow OpenAPI Utilities.
@@ -58,12 +131,13 @@ def main(
     """
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
+    ctx.obj["profile"] = profile
 
     configure_verbose_logging(verbose=verbose)
 
     if verbose:
         logger.debug("Verbose logging enabled")
-        logger.debug("CLI context: %s", ctx.info_name)
+        logger.debug("CLI context: {}", ctx.info_name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,265 @@
+import contextlib
+import json
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from metaflow_argo_events.cli.format import format_success
+from metaflow_argo_events.exceptions import CliError, SchemaError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.schema.cache import DEFAULT_CACHE_DIR, SchemaCache
+from metaflow_argo_events.schema.generate import ExtractionResult, discover_flow_files, extract_many, ordered_flows
+from metaflow_argo_events.schema.manifest import (
+    BuildManifest,
+    FileRecord,
+    RebuildPlan,
+    build_environment,
+    fragment_hash,
+    plan_rebuild,
+)
+from metaflow_argo_events.schema.openapi import (
+    DEFAULT_TITLE,
+    build_openapi_spec,
+    flow_fragment,
+    patch_openapi_spec,
+    spec_fragments,
+)
+
+logger = get_logger("cli.openapi")
+
+app = typer.Typer(help="Generate OpenAPI specifications for Metaflow flows.", no_args_is_help=True)
+
+PathsArgument = typer.Argument(..., help="Flow files or directories to search for flows.")
+
+
+def dump_spec(spec: dict[str, Any], output_format: str) -> str:
+    if output_format.lower() == "yaml":
+        import yaml
+
+        return yaml.safe_dump(spec, sort_keys=False)
+    return json.dumps(spec, indent=2) + "\n"
+
+
+def load_spec(path: Path, output_format: str) -> dict[str, Any] | None:
+    """Read a previously written spec, or ``None`` if it is missing or cannot be parsed."""
+    try:
+        text = path.read_text()
+        if output_format.lower() == "yaml":
+            import yaml
+
+            spec = yaml.safe_load(text)
+        else:
+            spec = json.loads(text)
+    except (OSError, ValueError):
+        return None
+    return spec if isinstance(spec, dict) else None
+
+
+def default_manifest_path(output: Path | None, output_dir: Path | None) -> Path | None:
+    if output is not None:
+        return output.with_name(f".{output.name}.manifest.json")
+    if output_dir is not None:
+        return output_dir / ".manifest.json"
+    return None
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    with contextlib.suppress(OSError):
+        if path.read_text() == text:
+            return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return True
+
+
+def _extract(
+    flow_files: list[Path], jobs: int | None, cache: SchemaCache | None, *, refresh: bool = False
+) -> list[ExtractionResult]:
+    results = extract_many(flow_files, jobs=jobs, cache=cache, refresh=refresh) if flow_files else []
+    if cache is not None:
+        cache.save_stats()
+    errors = [f"{result.flow_file}: {result.error}" for result in results if result.error]
+    if errors:
+        raise SchemaError.extraction_failed(errors)
+    return results
+
+
+def _generate_full(
+    flow_files: list[Path],
+    *,
+    output: Path | None,
+    output_dir: Path | None,
+    output_format: str,
+    title: str,
+    jobs: int | None,
+    cache: SchemaCache | None,
+    force: bool,
+) -> None:
+    results = _extract(flow_files, jobs, cache, refresh=force)
+    flows = ordered_flows(results)
+    suffix = "yaml" if output_format.lower() == "yaml" else "json"
+    if output_dir is not None:
+        for flow in flows:
+            spec = build_openapi_spec([flow], title=flow.flow_name)
+            write_if_changed(output_dir / f"{flow.flow_name}.{suffix}", dump_spec(spec, output_format))
+    if output is not None or output_dir is None:
+        rendered = dump_spec(build_openapi_spec(flows, title=title), output_format)
+        if output is None:
+            typer.echo(rendered, nl=False)
+            return
+        write_if_changed(output, rendered)
+    cached = sum(result.cached for result in results)
+    format_success(f"Generated OpenAPI for {len(flows)} flows from {len(results)} files ({cached} cached)")
+
+
+def _per_flow_fragments(manifest: BuildManifest, output_dir: Path, output_format: str) -> dict[str, dict[str, Any]]:
+    suffix = "yaml" if output_format.lower() == "yaml" else "json"
+    fragments: dict[str, dict[str, Any]] = {}
+    for record in manifest.files.values():
+        for flow_name in record.flows:
+            fragments.update(spec_fragments(load_spec(output_dir / f"{flow_name}.{suffix}", output_format) or {}))
+    return fragments
+
+
+def _collect_fragments(
+    manifest: BuildManifest,
+    plan: RebuildPlan,
+    results: dict[Path, ExtractionResult],
+    reusable: dict[str, dict[str, Any]],
+) -> tuple[list[dict[str, Any]], set[str]]:
+    """Return every flow's fragment in file, then flow-name order, and the names that changed."""
+    fragments: list[dict[str, Any]] = []
+    owners: dict[str, Path] = {}
+    duplicates: list[str] = []
+    changed: set[str] = set()
+    for flow_file, record in plan.records.items():
+        previous = manifest.files.get(manifest.key_for(flow_file), FileRecord(input_hash=""))
+        if flow_file in results:
+            file_fragments = [flow_fragment(flow) for flow in results[flow_file].flows]
+        else:
+            file_fragments = [reusable[flow_name] for flow_name in previous.flows]
+        for fragment in sorted(file_fragments, key=lambda fragment: fragment["flow_name"]):
+            flow_name = fragment["flow_name"]
+            if flow_name in owners:
+                duplicates.append(f"{flow_name}: {owners[flow_name]} and {flow_file}")
+                continue
+            owners[flow_name] = flow_file
+            record.flows[flow_name] = fragment_hash(fragment)
+            if previous.flows.get(flow_name) != record.flows[flow_name]:
+                changed.add(flow_name)
+            fragments.append(fragment)
+    if duplicates:
+        raise SchemaError.duplicate_flows(duplicates)
+    return fragments, changed
+
+
+def _generate_incremental(
+    flow_files: list[Path],
+    manifest: BuildManifest,
+    *,
+    output: Path | None,
+    output_dir: Path | None,
+    output_format: str,
+    title: str,
+    jobs: int | None,
+    cache: SchemaCache | None,
+    force: bool,
+) -> None:
+    merged = load_spec(output, output_format) if output is not None else None
+    # The fragments currently present in each requested output, keyed by flow name.
+    outputs: list[dict[str, dict[str, Any]]] = []
+    if output is not None:
+        outputs.append(spec_fragments(merged or {}))
+    if output_dir is not None:
+        outputs.append(_per_flow_fragments(manifest, output_dir, output_format))
+    plan = plan_rebuild(manifest, flow_files, outputs, force=force)
+    results = {result.flow_file: result for result in _extract(list(plan.reasons), jobs, cache, refresh=force)}
+    fragments, changed = _collect_fragments(manifest, plan, results, outputs[0])
+
+    if output_dir is not None:
+        suffix = "yaml" if output_format.lower() == "yaml" else "json"
+        for fragment in fragments:
+            flow_name = fragment["flow_name"]
+            existing = outputs[-1].get(flow_name)
+            if existing is None or fragment_hash(existing) != fragment_hash(fragment):
+                spec = patch_openapi_spec(build_openapi_spec([], title=flow_name), [fragment])
+                write_if_changed(output_dir / f"{flow_name}.{suffix}", dump_spec(spec, output_format))
+        current = {fragment["flow_name"] for fragment in fragments}
+        for record in plan.removed.values():
+            for flow_name in record.flows.keys() - current:
+                (output_dir / f"{flow_name}.{suffix}").unlink(missing_ok=True)
+    if output is not None:
+        spec = patch_openapi_spec(merged or build_openapi_spec([], title=title), fragments)
+        spec["info"] = {**spec.get("info", {}), "title": title}
+        write_if_changed(output, dump_spec(spec, output_format))
+
+    manifest.environment = build_environment()
+    manifest.files = {manifest.key_for(flow_file): record for flow_file, record in plan.records.items()}
+    manifest.save()
+
+    report = {manifest.key_for(flow_file): reason for flow_file, reason in plan.reasons.items()}
+    report.update(dict.fromkeys(plan.removed, "removed"))
+    cached = sum(result.cached for result in results.values())
+    format_success(
+        f"Rebuilt {len(plan.reasons)} of {len(flow_files)} flow files ({cached} cached), "
+        f"{len(changed)} of {len(fragments)} flows changed",
+        report,
+    )
+
+
+@app.command("generate")
+def generate(
+    paths: list[Path] = PathsArgument,
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write one merged spec to this file."),
+    output_dir: Path | None = typer.Option(None, "--output-dir", help="Write one spec per flow to this directory."),
+    output_format: str = typer.Option("json", "--format", "-f", help="Spec format: json or yaml."),
+    jobs: int | None = typer.Option(None, "--jobs", "-j", help="Worker processes (default: CPU count)."),
+    title: str = typer.Option(DEFAULT_TITLE, "--title", help="Title of the merged spec."),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse previously extracted schemas."),
+    cache_dir: Path = typer.Option(DEFAULT_CACHE_DIR, "--cache-dir", envvar="METAFLOW_EVENTS_CACHE_DIR"),
+    incremental: bool = typer.Option(
+        True, "--incremental/--full", help="Only rebuild flows whose source or local imports changed."
+    ),
+    manifest_path: Path | None = typer.Option(None, "--manifest", help="Build manifest (default: next to the output)."),
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild every flow, ignoring the manifest and refreshing the schema cache."
+    ),
+) -> None:
+    """
+    Extract flow parameters in parallel and write OpenAPI specs.
+
+    When writing to files, a build manifest records what each flow was generated from so that
+    the next run only re-extracts changed flows and patches their entries into the existing specs.
+    """
+    try:
+        flow_files = discover_flow_files(paths)
+        if not flow_files:
+            raise SchemaError.no_flows(", ".join(map(str, paths)))
+        cache = SchemaCache(cache_dir) if use_cache else None
+        manifest_path = manifest_path or default_manifest_path(output, output_dir)
+        if incremental and manifest_path is not None and (output is not None or output_dir is not None):
+            _generate_incremental(
+                flow_files,
+                BuildManifest.load(manifest_path),
+                output=output,
+                output_dir=output_dir,
+                output_format=output_format,
+                title=title,
+                jobs=jobs,
+                cache=cache,
+                force=force,
+            )
+        else:
+            _generate_full(
+                flow_files,
+                output=output,
+                output_dir=output_dir,
+                output_format=output_format,
+                title=title,
+                jobs=jobs,
+                cache=cache,
+                force=force,
+            )
+    except CliError as err:
+        handle_error(err)
@@ -0,0 +1,75 @@
+import asyncio
+import contextlib
+from pathlib import Path
+
+import typer
+
+from metaflow_argo_events.cli.format import format_success, print_output
+from metaflow_argo_events.exceptions import CliError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.publish.outbox import DEFAULT_OUTBOX_DIR, Outbox, OutboxDrainer
+from metaflow_argo_events.publish.publisher import EventPublisher
+
+logger = get_logger("cli.outbox")
+
+app = typer.Typer(help="Inspect and replay events spooled to the local outbox.", no_args_is_help=True)
+
+DirectoryOption = typer.Option(
+    DEFAULT_OUTBOX_DIR,
+    "--dir",
+    "-d",
+    help="Outbox directory.",
+    envvar="METAFLOW_EVENTS_OUTBOX_DIR",
+)
+
+
+@app.command("stats")
+def stats(
+    directory: Path = DirectoryOption,
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """Show how many events are waiting in the outbox."""
+    try:
+        print_output(Outbox(directory).stats().to_dict(), output_format)
+    except CliError as err:
+        handle_error(err)
+
+
+@app.command("drain")
+def drain(
+    directory: Path = DirectoryOption,
+    max_in_flight: int = typer.Option(64, "--max-in-flight", help="Maximum concurrent webhook requests."),
+    limit: int | None = typer.Option(None, "--limit", help="Replay at most this many events."),
+    timeout: float = typer.Option(60.0, "--timeout", help="Per-request timeout in seconds."),
+    watch: float | None = typer.Option(
+        None, "--watch", min=0.1, help="Keep draining every this many seconds until interrupted."
+    ),
+) -> None:
+    """Replay spooled events to their webhooks, oldest first."""
+    drainer = OutboxDrainer(
+        Outbox(directory),
+        lambda: EventPublisher(max_in_flight=max_in_flight, timeout=timeout),
+        interval=watch or 0.0,
+    )
+    if watch is not None:
+        logger.info("Draining outbox {} every {}s; press Ctrl-C to stop", directory, watch)
+        drainer.start()
+        with contextlib.suppress(KeyboardInterrupt):
+            drainer.wait()
+        drainer.stop()
+        return
+
+    try:
+        result = asyncio.run(drainer.drain_once(limit=limit))
+    except CliError as err:
+        handle_error(err)
+        return
+
+    if result.failed:
+        handle_error(
+            CliError(
+                f"Replayed {result.replayed} events before a delivery failure",
+                hint="Remaining events stay in the outbox; rerun the drain once the webhook is reachable.",
+            )
+        )
+    format_success(f"Replayed {result.replayed} events", result.to_dict())
@@ -0,0 +1,100 @@
+"""
+Profiling for any subcommand through the global ``--profile[=cpu|mem]`` option.
+
+Profiling starts while the command line is parsed, before the subcommand module is imported,
+and the report is written when the command finishes, including when it exits with an error.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+    import typer
+
+PROFILE_MODES = ("cpu", "mem")
+DEFAULT_PROFILE_MODE = "cpu"
+DEFAULT_TOP = 25
+
+
+def expand_profile_flag(args: list[str], commands: list[str]) -> list[str]:
+    """
+    Rewrite a bare ``--profile`` into ``--profile=cpu``.
+
+    Without this, ``--profile schema show`` would take ``schema`` as the mode. Only options in
+    front of the subcommand name are rewritten.
+    """
+    expanded: list[str] = []
+    for index, arg in enumerate(args):
+        if arg in commands:
+            return [*expanded, *args[index:]]
+        following = args[index + 1] if index + 1 < len(args) else None
+        bare = arg == "--profile" and following not in PROFILE_MODES
+        expanded.append(f"--profile={DEFAULT_PROFILE_MODE}" if bare else arg)
+    return expanded
+
+
+def _output_path(ctx: typer.Context, mode: str) -> Path:
+    output = ctx.params.get("profile_output")
+    if output is not None:
+        return Path(output)
+    command = ctx.invoked_subcommand or "main"
+    suffix = ".prof" if mode == "cpu" else ".tracemalloc"
+    return Path(f"metaflow-events-{command}-{time.strftime('%Y%m%dT%H%M%S')}{suffix}")
+
+
+def _report_cpu(ctx: typer.Context, profiler: cProfile.Profile) -> None:
+    import pstats
+
+    profiler.disable()
+    path = _output_path(ctx, "cpu")
+    profiler.dump_stats(path)
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(ctx.params.get("profile_top") or DEFAULT_TOP)
+    sys.stderr.write(f"CPU profile written to {path} (open it with `python -m pstats {path}`)\n")
+
+
+def _report_mem(ctx: typer.Context) -> None:
+    import tracemalloc
+
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+            tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+        )
+    )
+    top = ctx.params.get("profile_top") or DEFAULT_TOP
+    sys.stderr.write(f"Top {top} allocations by line (current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB):\n")
+    for rank, stat in enumerate(snapshot.statistics("lineno")[:top], 1):
+        frame = stat.traceback[0]
+        sys.stderr.write(
+            f"{rank:>3}. {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB in {stat.count} blocks\n"
+        )
+    if ctx.params.get("profile_output") is not None:
+        path = _output_path(ctx, "mem")
+        snapshot.dump(str(path))
+        sys.stderr.write(f"Allocation snapshot written to {path} (load it with tracemalloc.Snapshot.load)\n")
+
+
+def start_profiling(ctx: typer.Context, mode: str) -> None:
+    """Start profiling in ``mode`` and report when ``ctx`` closes."""
+    if mode == "cpu":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        ctx.call_on_close(lambda: _report_cpu(ctx, profiler))
+        profiler.enable()
+    else:
+        import tracemalloc
+
+        ctx.call_on_close(lambda: _report_mem(ctx))
+        tracemalloc.start()
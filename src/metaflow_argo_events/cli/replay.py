@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+from pathlib import Path
+
+import typer
+
+from metaflow_argo_events.cli.console import get_error_console
+from metaflow_argo_events.cli.format import format_success
+from metaflow_argo_events.exceptions import ClientError, CliError, handle_error
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.publish.publisher import EventPublisher
+from metaflow_argo_events.publish.replay import (
+    PARTITION_BY_NAME,
+    ReplayFilter,
+    ReplayProgress,
+    failure_writer,
+    iter_recorded_events,
+    replay_events,
+)
+
+logger = get_logger("cli.replay")
+
+app = typer.Typer(help="Republish recorded events.")
+
+
+async def _report_progress(progress: ReplayProgress, interval: float) -> None:
+    console = get_error_console()
+    last = 0
+    while True:
+        await asyncio.sleep(interval)
+        done = progress.replayed + progress.failed
+        console.print(
+            f"Replayed {progress.replayed} events ({progress.failed} failed, {progress.skipped} skipped) "
+            f"from {progress.read} read; {(done - last) / interval:.0f}/s now, {progress.throughput:.0f}/s overall",
+            highlight=False,
+        )
+        last = done
+
+
+@app.command("replay")
+def replay(
+    files: list[str] = typer.Argument(..., help="NDJSON files of recorded events (.gz is decompressed, - is stdin)."),
+    url: str | None = typer.Option(
+        None,
+        "--url",
+        help="Webhook to republish to.",
+        envvar="METAFLOW_ARGO_EVENTS_WEBHOOK_URL",
+    ),
+    names: list[str] = typer.Option([], "--name", "-n", help="Only replay events matching this name or glob."),
+    since: str | None = typer.Option(None, "--since", help="Only replay events with utc_date >= YYYYMMDD."),
+    until: str | None = typer.Option(None, "--until", help="Only replay events with utc_date <= YYYYMMDD."),
+    date: str | None = typer.Option(None, "--date", help="Only replay events from this utc_date (YYYYMMDD)."),
+    partition: str = typer.Option(
+        PARTITION_BY_NAME,
+        "--partition-key",
+        help="Keep order per 'name', per 'payload.<field>', or not at all with 'none'.",
+    ),
+    concurrency: int = typer.Option(16, "--concurrency", "-c", help="Partitions replayed in parallel.", min=1),
+    retries: int = typer.Option(3, "--retries", help="Retries per event before it counts as failed.", min=0),
+    timeout: float = typer.Option(60.0, "--timeout", help="Per-request timeout in seconds."),
+    failed_output: Path | None = typer.Option(
+        None,
+        "--failed-output",
+        help="Append events that could not be delivered here, as NDJSON that replay accepts.",
+    ),
+    progress_interval: float = typer.Option(
+        5.0, "--progress-interval", help="Seconds between progress reports.", min=0.1
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Count matching events without sending them."),
+) -> None:
+    """
+    Republish recorded events concurrently while keeping order within each partition.
+
+    Files are streamed line by line, so any size can be replayed in bounded memory.
+    """
+    if date is not None:
+        since = until = date
+    event_filter = ReplayFilter(tuple(names), since, until)
+    progress = ReplayProgress()
+    events = iter_recorded_events(files, event_filter, progress)
+    if dry_run:
+        for _ in events:
+            pass
+        format_success(f"{progress.matched} of {progress.read} recorded events would be replayed", progress.to_dict())
+        return
+    if not url:
+        handle_error(ClientError.webhook_url_missing())
+        return
+
+    async def run() -> None:
+        with contextlib.ExitStack() as stack:
+            on_failure = None
+            if failed_output is not None:
+                on_failure = failure_writer(stack.enter_context(failed_output.open("ab")))
+            reporter = asyncio.create_task(_report_progress(progress, progress_interval))
+            try:
+                async with EventPublisher(max_in_flight=concurrency, timeout=timeout) as publisher:
+                    await replay_events(
+                        publisher,
+                        events,
+                        url,
+                        concurrency=concurrency,
+                        partition=partition,
+                        retries=retries,
+                        progress=progress,
+                        on_failure=on_failure,
+                    )
+            finally:
+                reporter.cancel()
+
+    try:
+        asyncio.run(run())
+    except (CliError, OSError) as err:
+        handle_error(err if isinstance(err, CliError) else CliError(f"{type(err).__name__}: {err}"))
+        return
+
+    if progress.failed:
+        hint = f"Failed events were written to {failed_output}." if failed_output else None
+        handle_error(CliError(f"Replayed {progress.replayed} events; {progress.failed} could not be delivered", hint))
+    format_success(f"Replayed {progress.replayed} events", progress.to_dict())
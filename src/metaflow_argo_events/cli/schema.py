@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from metaflow_argo_events.cli.console import get_console
+from metaflow_argo_events.cli.format import display_schema, format_success, print_output
+from metaflow_argo_events.exceptions import CliError, SchemaError, handle_error
+from metaflow_argo_events.schema.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, SchemaCache
+from metaflow_argo_events.schema.deploy_time import SCOPE_PARAMETER, DeployTimeResolver, ResolvedField
+from metaflow_argo_events.schema.extract import (
+    deploy_time_fields,
+    extract_flow_parameters,
+    find_flow_classes,
+    load_flow_module,
+)
+from metaflow_argo_events.schema.generate import discover_flow_files
+
+app = typer.Typer(help="Inspect the parameter schema of Metaflow flows.", no_args_is_help=True)
+cache_app = typer.Typer(help="Manage the flow schema cache.", no_args_is_help=True)
+app.add_typer(cache_app, name="cache")
+
+CacheDirOption = typer.Option(
+    DEFAULT_CACHE_DIR,
+    "--cache-dir",
+    help="Schema cache directory.",
+    envvar="METAFLOW_EVENTS_CACHE_DIR",
+)
+FlowFileArgument = typer.Argument(..., help="Path to the Metaflow flow file.")
+CacheMaxBytesOption = typer.Option(DEFAULT_MAX_BYTES, "--cache-max-bytes", help="Schema cache size limit in bytes.")
+
+
+@app.command("show")
+def show(
+    flow_file: Path = FlowFileArgument,
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse previously extracted schemas."),
+    cache_dir: Path = CacheDirOption,
+    cache_max_bytes: int = CacheMaxBytesOption,
+) -> None:
+    """Show the parameters defined by the flows in FLOW_FILE."""
+    try:
+        if use_cache:
+            cache = SchemaCache(cache_dir, max_bytes=cache_max_bytes)
+            flows = cache.get_or_extract(flow_file)
+            cache.save_stats()
+        else:
+            flows = extract_flow_parameters(flow_file)
+    except CliError as err:
+        handle_error(err)
+        return
+
+    if output_format.lower() != "text":
+        data = [flow.model_dump(mode="json") for flow in flows]
+        print_output(data[0] if len(data) == 1 else data, output_format)
+        return
+    for flow in flows:
+        display_schema(
+            {"name": flow.flow_name, "parameters": [parameter.model_dump(mode="json") for parameter in flow.parameters]}
+        )
+
+
+def _collect_deploy_time_fields(paths: list[Path]) -> list[tuple[str, Any]]:
+    flow_files = discover_flow_files(paths)
+    if not flow_files:
+        raise SchemaError.no_flows(", ".join(map(str, paths)))
+    fields: list[tuple[str, Any]] = []
+    errors: list[str] = []
+    for flow_file in flow_files:
+        try:
+            flows = find_flow_classes(load_flow_module(flow_file))
+        except SchemaError as err:
+            errors.append("; ".join([err.message, *err.errors]))
+            continue
+        fields.extend((flow.__name__, field) for flow in flows for field in deploy_time_fields(flow))
+    if errors:
+        raise SchemaError.extraction_failed(errors)
+    return fields
+
+
+def _display_resolved(resolved: list[ResolvedField]) -> None:
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold")
+    for column in ("Flow", "Parameter", "Field", "Value", "Time (ms)", "Cached"):
+        table.add_column(column)
+    for result in resolved:
+        value = f"[red]{result.error}[/red]" if result.error else str(result.value)
+        table.add_row(
+            result.flow_name,
+            result.field.parameter_name,
+            result.field.field,
+            value,
+            f"{result.seconds * 1000:.1f}",
+            "yes" if result.cached else "",
+        )
+    get_console().print(table)
+
+
+@app.command("resolve")
+def resolve(
+    paths: list[Path] = typer.Argument(..., help="Flow files or directories to search for flows."),
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Deploy-time functions evaluated concurrently.", min=1),
+    scope: str = typer.Option(
+        SCOPE_PARAMETER,
+        "--scope",
+        help="Reuse results per 'parameter' of each flow, or per deploy-time 'function' across all flows.",
+    ),
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """
+    Evaluate the deploy-time parameter defaults of every flow under PATHS in one session.
+
+    Each deploy-time function runs once per flow parameter that uses it, or once in total when it
+    is marked with ``shared_deploy_time`` or ``--scope function`` is given. The time spent on
+    every field is reported.
+    """
+    try:
+        fields = _collect_deploy_time_fields(paths)
+        with DeployTimeResolver(max_workers=jobs, scope=scope) as resolver:
+            resolved = resolver.resolve(fields)
+        summary = resolver.summary()
+    except (CliError, ValueError) as err:
+        handle_error(err if isinstance(err, CliError) else CliError(str(err)))
+        return
+
+    errors = [
+        f"{result.flow_name}.{result.field.parameter_name}: {result.error}" for result in resolved if result.error
+    ]
+    if output_format.lower() != "text":
+        print_output([result.to_dict() for result in resolved], output_format)
+    else:
+        if resolved:
+            _display_resolved(resolved)
+        if not errors:
+            seconds = sum(result.seconds for result in resolved)
+            format_success(
+                f"Resolved {len(resolved)} deploy-time fields with {summary['evaluations']} evaluations "
+                f"taking {seconds:.3f}s",
+                summary,
+            )
+    if errors:
+        handle_error(SchemaError.deploy_time_failed(errors))
+
+
+@cache_app.command("stats")
+def cache_stats(
+    cache_dir: Path = CacheDirOption,
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """Show schema cache size and hit/miss counters."""
+    print_output(SchemaCache(cache_dir).summary(), output_format)
+
+
+@cache_app.command("clear")
+def cache_clear(cache_dir: Path = CacheDirOption) -> None:
+    """Remove every cached schema."""
+    removed = SchemaCache(cache_dir).clear()
+    format_success(f"Removed {removed} cached schemas")
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import typer
+
+from metaflow_argo_events.cli.format import display_list, print_output
+from metaflow_argo_events.metrics import DEFAULT_METRICS_DIR, collect_snapshot
+
+app = typer.Typer(help="Show publishing metrics recorded on this node.")
+
+
+@app.command("stats")
+def stats(
+    directory: Path = typer.Option(
+        DEFAULT_METRICS_DIR,
+        "--dir",
+        "-d",
+        help="Directory the publishing processes write metrics to.",
+        envvar="METAFLOW_EVENTS_METRICS_DIR",
+    ),
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson or yaml."),
+) -> None:
+    """Sum the counters, latency histograms and gauges written by every publishing process."""
+    rows = collect_snapshot(directory)
+    if output_format.lower() == "text":
+        if not rows:
+            typer.echo(f"No metrics found in {directory}; set METAFLOW_EVENTS_METRICS_DIR in the publishing processes.")
+            return
+        display_list(rows, title=f"Metrics from {directory}")
+        return
+    print_output(rows, output_format)
@@ -1,21 +1,21 @@
-import typer
-from rich.panel import Panel
-
 from metaflow_argo_events.cli.console import get_error_console
 from metaflow_argo_events.logger import get_logger
 
-console = get_error_console()
 logger = get_logger("exceptions")
 
 
 class CliError(Exception):
+    """
+    An error reported to the user by ``handle_error``.
+
+    Creating one does not log: publishing raises these per event, often with ``ignore_errors``
+    set, so logging is left to ``handle_error`` at the CLI boundary.
+    """
+
     def __init__(self, message: str, hint: str | None = None, exit_code: int = 1) -> None:
         self.message = message
         self.hint = hint
         self.exit_code = exit_code
-        logger.error(message)
-        if hint:
-            logger.info("Error hint: %s", hint)
         super().__init__(message)
 
 
@@ -24,9 +24,50 @@ class SchemaError(CliError):
         self.errors = errors or []
         full_message = f"Schema error: {message}"
         super().__init__(full_message, hint)
-        if errors:
-            for error in errors:
-                logger.debug("Schema detail: %s", error)
+
+    @classmethod
+    def flow_not_found(cls, path: str) -> "SchemaError":
+        return cls(f"Flow file not found: {path}")
+
+    @classmethod
+    def flow_import_failed(cls, path: str, error: Exception) -> "SchemaError":
+        return cls(
+            f"Failed to import flow file {path}",
+            hint="Check that the flow runs with `python <flow>.py show`.",
+            errors=[f"{type(error).__name__}: {error}"],
+        )
+
+    @classmethod
+    def no_flows(cls, path: str) -> "SchemaError":
+        return cls(f"No FlowSpec subclass found in {path}")
+
+    @classmethod
+    def duplicate_flows(cls, duplicates: list[str]) -> "SchemaError":
+        return cls("Duplicate flow names", hint="Flow class names must be unique across files.", errors=duplicates)
+
+    @classmethod
+    def extraction_failed(cls, errors: list[str]) -> "SchemaError":
+        return cls(f"Failed to extract parameters from {len(errors)} flow files", errors=errors)
+
+    @classmethod
+    def deploy_time_failed(cls, errors: list[str]) -> "SchemaError":
+        return cls(f"Failed to resolve {len(errors)} deploy-time fields", errors=errors)
+
+    @classmethod
+    def generator_missing(cls) -> "SchemaError":
+        return cls(
+            "openapi-generator-cli not found",
+            hint="Install the clients extra (pip install 'metaflow-argo-events[clients]') and Java, "
+            "or pass --generator.",
+        )
+
+    @classmethod
+    def generator_failed(cls, detail: str) -> "SchemaError":
+        return cls("Client generator failed", errors=[detail])
+
+    @classmethod
+    def client_generation_failed(cls, errors: list[str]) -> "SchemaError":
+        return cls(f"Failed to generate {len(errors)} clients", errors=errors)
 
 
 class ValidationError(CliError):
@@ -35,10 +76,6 @@ class ValidationError(CliError):
         full_message = f"Validation error: {message}"
         super().__init__(full_message, hint)
 
-        if errors:
-            for error in errors:
-                logger.debug("Validation detail: %s", error)
-
 
 class EventError(CliError):
     @classmethod
@@ -61,6 +98,34 @@ class ClientError(CliError):
     def api_error(cls, service: str, status_code: int, detail: str, hint: str | None = None) -> "ClientError":
         return cls(f"API error from {service} (status {status_code}): {detail}", hint)
 
+    @classmethod
+    def not_published(cls, event_name: str) -> "ClientError":
+        return cls(
+            f"Argo Event ({event_name}) was not published",
+            "Set force=True to publish outside of Argo Workflows.",
+        )
+
+    @classmethod
+    def webhook_url_missing(cls) -> "ClientError":
+        return cls("No webhook URL configured", "Set the event url or METAFLOW_ARGO_EVENTS_WEBHOOK_URL.")
+
+    @classmethod
+    def outbox_missing(cls) -> "ClientError":
+        return cls("No outbox configured", "Pass outbox=Outbox(...) to the publisher.")
+
+
+class CircuitOpenError(ClientError):
+    def __init__(self, url: str, retry_in: float, failures: int) -> None:
+        self.url = url
+        self.retry_in = retry_in
+        self.failures = failures
+        message = f"Circuit open for {url} after {failures} consecutive failures"
+        if retry_in > 0:
+            hint = f"Requests to this endpoint fail fast for another {retry_in:.1f}s."
+        else:
+            hint = "A trial request to this endpoint is already in flight."
+        super().__init__(message, hint)
+
 
 class ConfigError(CliError):
     def __init__(self, config_name: str, detail: str, hint: str | None = None) -> None:
@@ -88,7 +153,16 @@ class AccessDeniedError(CliError):
 
 
 def handle_error(error: Exception) -> None:
+    import typer
+    from rich.panel import Panel
+
+    console = get_error_console()
     if isinstance(error, CliError):
+        logger.error(error.message)
+        if error.hint:
+            logger.info("Error hint: {}", error.hint)
+        for detail in getattr(error, "errors", None) or []:
+            logger.debug("Error detail: {}", detail)
         error_panel = Panel.fit(f"[bold red]{error.message}[/bold red]", title="Error", border_style="red")
         console.print(error_panel)
 
@@ -102,7 +176,7 @@ def handle_error(error: Exception) -> None:
 
         raise typer.Exit(code=getattr(error, "exit_code", 1))
 
-    logger.exception("Unexpected error: %s", error)
+    logger.exception("Unexpected error: {}", error)
     console.print(f"[bold red]Unexpected error:[/bold red] {error}")
     console.print("[dim]For detailed error information, run with --verbose flag.[/dim]")
     raise typer.Exit(code=1)
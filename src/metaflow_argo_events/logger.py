@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import atexit
 import os
+import queue
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any, TextIO, cast
 
-import loguru
-from loguru import logger
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import loguru
 
 DEFAULT_LOG_LEVEL = os.environ.get("METAFLOW_EVENTS_LOG_LEVEL", "INFO").upper()
 
+_TRUTHY = {"1", "true", "yes", "on"}
+
 BASE_LOG_FORMAT = (
     "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
     "<level>{level: <8}</level> | "
@@ -22,19 +33,203 @@ VERBOSE_LOG_FORMAT = (
     "<level>{message}</level>"
 )
 
-logger.remove()
-logger.add(sys.stderr, level=DEFAULT_LOG_LEVEL, format=BASE_LOG_FORMAT)
+
+@dataclass(frozen=True)
+class LogSettings:
+    """
+    How records are written.
+
+    ``json_lines`` writes one compact JSON object per record, including the fields bound by
+    ``get_logger`` and ``get_context_logger``. ``enqueue`` hands records to a background thread,
+    so the caller never serializes or writes them. ``rate_limit`` caps how many records per
+    second each logging call site may emit (0 disables it); the next record let through
+    carries a ``suppressed`` count of the ones dropped.
+    """
+
+    json_lines: bool = os.environ.get("METAFLOW_EVENTS_LOG_FORMAT", "text").lower() == "json"
+    enqueue: bool = os.environ.get("METAFLOW_EVENTS_LOG_ENQUEUE", "").lower() in _TRUTHY
+    rate_limit: float = float(os.environ.get("METAFLOW_EVENTS_LOG_RATE_LIMIT", "0"))
+    stream: TextIO | None = None
+
+
+_settings = LogSettings()
+_active_sink: tuple[str, str] = (DEFAULT_LOG_LEVEL, BASE_LOG_FORMAT)
+
+
+class RateLimitFilter:
+    """Loguru filter letting at most ``per_second`` records through per call site per second."""
+
+    def __init__(self, per_second: float) -> None:
+        self.per_second = per_second
+        self._windows: dict[tuple[str | None, int], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: loguru.Record) -> bool:
+        key = (record["name"], record["line"])
+        now = time.monotonic()
+        with self._lock:
+            # [window start, records let through, records dropped]
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= 1.0:
+                suppressed = int(window[2]) if window is not None else 0
+                window = self._windows[key] = [now, 0.0, 0.0]
+                if suppressed:
+                    record["extra"]["suppressed"] = suppressed
+            if window[1] >= self.per_second:
+                window[2] += 1
+                return False
+            window[1] += 1
+        return True
+
+
+def _json_lines_sink(stream: TextIO) -> Callable[[loguru.Message], None]:
+    import json
+
+    def write(message: loguru.Message) -> None:
+        record = message.record
+        entry: dict[str, Any] = {
+            "ts": round(record["time"].timestamp(), 6),
+            "level": record["level"].name,
+            "msg": record["message"],
+            **record["extra"],
+        }
+        if record["exception"] is not None:
+            error_type, error, _ = record["exception"]
+            entry["error"] = f"{error_type.__name__ if error_type else 'Exception'}: {error}"
+        stream.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+
+    return write
+
+
+class _BackgroundSink:
+    """
+    Hand records to a writer thread through an in-process queue.
+
+    loguru's own ``enqueue`` pickles every record through a multiprocessing pipe, which costs
+    more per record than writing it synchronously; a ``SimpleQueue`` put costs far less.
+    """
+
+    def __init__(self, write: Callable[[loguru.Message], object]) -> None:
+        self._write = write
+        self._queue: queue.SimpleQueue[loguru.Message | threading.Event | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def __call__(self, message: loguru.Message) -> None:
+        self._queue.put(message)
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._write(item)
+            except Exception:  # noqa: BLE001
+                sys.stderr.write("--- Logging error in metaflow-events background sink ---\n")
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+
+_background: _BackgroundSink | None = None
+
+
+def _install_sink(logger: loguru.Logger, level: str, text_format: str) -> None:
+    global _active_sink, _background  # noqa: PLW0603
+    _active_sink = (level, text_format)
+    logger.remove()
+    if _background is not None:
+        _background.stop()
+        _background = None
+    stream = _settings.stream or sys.stderr
+    log_filter = RateLimitFilter(_settings.rate_limit) if _settings.rate_limit > 0 else None
+    if _settings.enqueue:
+        write: Callable[[loguru.Message], object] = _json_lines_sink(stream) if _settings.json_lines else stream.write
+        log_format = "{message}" if _settings.json_lines else text_format
+        _background = _BackgroundSink(write)
+        logger.add(_background, level=level, format=log_format, filter=log_filter, colorize=False)
+    elif _settings.json_lines:
+        logger.add(_json_lines_sink(stream), level=level, format="{message}", filter=log_filter)
+    else:
+        logger.add(stream, level=level, format=text_format, filter=log_filter)
+
+
+@cache
+def _configured_logger() -> loguru.Logger:
+    """Import loguru and install the default sink on first use rather than at import time."""
+    from loguru import logger
+
+    _install_sink(logger, DEFAULT_LOG_LEVEL, BASE_LOG_FORMAT)
+    return logger
+
+
+def configure_logging(
+    *,
+    json_lines: bool | None = None,
+    enqueue: bool | None = None,
+    rate_limit: float | None = None,
+    stream: TextIO | None = None,
+) -> LogSettings:
+    """Change how records are written, keeping the current level; unset options keep their value."""
+    global _settings  # noqa: PLW0603
+    _settings = LogSettings(
+        json_lines=_settings.json_lines if json_lines is None else json_lines,
+        enqueue=_settings.enqueue if enqueue is None else enqueue,
+        rate_limit=_settings.rate_limit if rate_limit is None else rate_limit,
+        stream=_settings.stream if stream is None else stream,
+    )
+    logger = _configured_logger()
+    _install_sink(logger, *_active_sink)
+    return _settings
+
+
+def log_queue_depth() -> int:
+    """Return how many records are waiting for the background writer."""
+    return _background.depth if _background is not None else 0
+
+
+@atexit.register
+def flush_logs() -> None:
+    """Wait until every queued record has been written."""
+    if _background is not None:
+        _background.flush()
+
+
+class _LazyLogger:
+    """Stands in for a bound loguru logger until the first log call."""
+
+    __slots__ = ("_bound", "_extra")
+
+    def __init__(self, **extra: Any) -> None:
+        self._extra = extra
+        self._bound: loguru.Logger | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._bound is None:
+            self._bound = _configured_logger().bind(**self._extra)
+        return getattr(self._bound, name)
 
 
 def get_logger(name: str) -> loguru.Logger:
     """Get a logger instance bound to a specific name."""
-    return logger.bind(name=name)
+    return cast("loguru.Logger", _LazyLogger(name=name))
 
 
 def configure_verbose_logging(*, verbose: bool = False) -> None:
     if verbose:
-        logger.remove()
-        logger.add(sys.stderr, level="DEBUG", format=VERBOSE_LOG_FORMAT)
+        logger = _configured_logger()
+        _install_sink(logger, "DEBUG", VERBOSE_LOG_FORMAT)
         logger.debug("Verbose logging enabled")
 
 
@@ -46,9 +241,9 @@ def get_log_level() -> str:
 def set_log_level(level: str) -> None:
     level = level.upper()
     os.environ["METAFLOW_EVENTS_LOG_LEVEL"] = level
-    logger.remove()
-    logger.add(sys.stderr, level=level, format=BASE_LOG_FORMAT)
-    logger.info(f"Log level set to {level}")
+    logger = _configured_logger()
+    _install_sink(logger, level, BASE_LOG_FORMAT)
+    logger.info(f"Log level set to {level}")  # noqa: G004
 
 
 def get_context_logger(
@@ -59,4 +254,4 @@ def get_context_logger(
     if ctx_name:
         context["ctx"] = ctx_name
     context.update(context_kwargs)
-    return logger.bind(**context)
+    return _configured_logger().bind(**context)
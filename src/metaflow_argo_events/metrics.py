@@ -0,0 +1,360 @@
+"""
+In-process metrics for event publishing, exported in the Prometheus text format.
+
+Publishers record counters, latency histograms and queue depth gauges in a process-wide
+``MetricsRegistry``. ``get_metrics`` takes the same arguments as ``get_context_logger`` and
+returns a view that adds them as labels, so metrics and log records carry the same context.
+
+Each process can write its samples to ``<METAFLOW_EVENTS_METRICS_DIR>/<pid>.prom``, the layout
+the node exporter textfile collector reads, and serve them on a local HTTP port; both start
+automatically when the corresponding environment variable is set. ``metaflow-events stats``
+sums the files from every process on the node and deletes those left by processes that exited
+more than ``METRICS_RETENTION`` seconds ago.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import contextlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from metaflow_argo_events.logger import get_logger, log_queue_depth
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from http.server import ThreadingHTTPServer
+
+logger = get_logger("metrics")
+
+DEFAULT_METRICS_DIR = Path(os.environ.get("METAFLOW_EVENTS_METRICS_DIR", Path.home() / ".metaflow-events" / "metrics"))
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_RETENTION = 24 * 60 * 60
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    name: str
+    kind: MetricKind
+    help: str
+
+
+METRICS = {
+    spec.name: spec
+    for spec in (
+        MetricSpec("events_published_total", "counter", "Events delivered to a webhook."),
+        MetricSpec("events_failed_total", "counter", "Events that could not be delivered."),
+        MetricSpec("events_retried_total", "counter", "Delivery attempts replayed from the outbox."),
+        MetricSpec("events_deduplicated_total", "counter", "Publishes skipped as duplicates of an earlier event."),
+        MetricSpec("events_spooled_total", "counter", "Events written to the outbox for later delivery."),
+        MetricSpec("publish_latency_seconds", "histogram", "Time from starting a publish to its response."),
+        MetricSpec("publish_in_flight", "gauge", "Webhook requests currently outstanding."),
+        MetricSpec("publish_queued", "gauge", "Publishes waiting for an in-flight slot."),
+        MetricSpec("log_queue_depth", "gauge", "Log records waiting for the background writer."),
+    )
+}
+
+_PREFIX = "metaflow_events_"
+
+
+@dataclass(slots=True)
+class _Histogram:
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = (*key, *extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class MetricsRegistry:
+    """Thread-safe store of every sample recorded in this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, _Histogram]] = {}
+        self._callbacks: dict[str, Callable[[], float]] = {}
+
+    def inc(self, name: str, amount: float = 1, labels: dict[str, Any] | None = None) -> None:
+        key = _label_key(labels or {})
+        with self._lock:
+            samples = self._values.setdefault(name, {})
+            samples[key] = samples.get(key, 0) + amount
+
+    def set(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        with self._lock:
+            self._values.setdefault(name, {})[_label_key(labels or {})] = value
+
+    def observe(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        key = _label_key(labels or {})
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram()
+            histogram.observe(value)
+
+    def gauge_callback(self, name: str, read: Callable[[], float]) -> None:
+        """Sample the unlabeled gauge ``name`` by calling ``read`` whenever metrics are collected."""
+        with self._lock:
+            self._callbacks[name] = read
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every sample in the Prometheus text exposition format."""
+        callbacks = dict(self._callbacks)
+        sampled = {name: read() for name, read in callbacks.items()}
+        with self._lock:
+            values = {name: dict(samples) for name, samples in self._values.items()}
+            histograms = {
+                name: {key: (list(h.counts), h.total) for key, h in samples.items()}
+                for name, samples in self._histograms.items()
+            }
+        for name, value in sampled.items():
+            values.setdefault(name, {})[()] = value
+
+        lines: list[str] = []
+        for name in sorted(values.keys() | histograms.keys()):
+            spec = METRICS.get(name, MetricSpec(name, "histogram" if name in histograms else "gauge", name))
+            full_name = _PREFIX + name
+            lines.append(f"# HELP {full_name} {spec.help}")
+            lines.append(f"# TYPE {full_name} {spec.kind}")
+            for key, value in sorted(values.get(name, {}).items()):
+                lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+            for key, (counts, total) in sorted(histograms.get(name, {}).items()):
+                cumulative = 0
+                for bound, count in zip((*LATENCY_BUCKETS, float("inf")), counts, strict=True):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{full_name}_bucket{_format_labels(key, (('le', le),))} {cumulative}")
+                lines.append(f"{full_name}_sum{_format_labels(key)} {_format_value(total)}")
+                lines.append(f"{full_name}_count{_format_labels(key)} {cumulative}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class BoundMetrics:
+    """A view of a registry that adds fixed labels to every sample it records."""
+
+    __slots__ = ("labels", "registry")
+
+    def __init__(self, registry: MetricsRegistry, labels: dict[str, Any]) -> None:
+        self.registry = registry
+        self.labels = labels
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        self.registry.inc(name, amount, {**self.labels, **labels})
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        self.registry.observe(name, value, {**self.labels, **labels})
+
+    def add(self, name: str, amount: float, **labels: Any) -> None:
+        """Move a gauge up or down by ``amount``."""
+        self.registry.inc(name, amount, {**self.labels, **labels})
+
+    @contextlib.contextmanager
+    def gauge(self, name: str, **labels: Any) -> Iterator[None]:
+        """Count the enclosed block in gauge ``name`` while it runs."""
+        self.add(name, 1, **labels)
+        try:
+            yield
+        finally:
+            self.add(name, -1, **labels)
+
+
+@cache
+def get_registry() -> MetricsRegistry:
+    """Return the process-wide registry, starting the exporters configured in the environment."""
+    registry = MetricsRegistry()
+    registry.gauge_callback("log_queue_depth", log_queue_depth)
+    if "METAFLOW_EVENTS_METRICS_DIR" in os.environ:
+        start_file_exporter(registry, interval=float(os.environ.get("METAFLOW_EVENTS_METRICS_INTERVAL", "10")))
+    if port := os.environ.get("METAFLOW_EVENTS_METRICS_PORT"):
+        serve_metrics(registry, port=int(port))
+    return registry
+
+
+def get_metrics(ctx_name: str | None = None, **context_kwargs: str | float | bool | None) -> BoundMetrics:
+    """Return a metrics view labeled like ``get_context_logger(ctx_name, **context_kwargs)``."""
+    labels: dict[str, Any] = {}
+    if ctx_name:
+        labels["ctx"] = ctx_name
+    labels.update(context_kwargs)
+    return BoundMetrics(get_registry(), labels)
+
+
+def write_textfile(registry: MetricsRegistry, path: str | os.PathLike[str]) -> Path:
+    """Atomically write ``registry`` to ``path`` so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(registry.to_prometheus())
+    tmp.replace(path)
+    return path
+
+
+def start_file_exporter(
+    registry: MetricsRegistry,
+    directory: str | os.PathLike[str] = DEFAULT_METRICS_DIR,
+    *,
+    interval: float = 10.0,
+) -> threading.Thread:
+    """Rewrite ``<directory>/<pid>.prom`` every ``interval`` seconds and once more at exit."""
+    path = Path(directory) / f"{os.getpid()}.prom"
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval):
+            try:
+                write_textfile(registry, path)
+            except OSError as err:
+                logger.warning("Could not write metrics to {}: {}", path, err)
+
+    def final_write() -> None:
+        stop.set()
+        with contextlib.suppress(OSError):
+            write_textfile(registry, path)
+
+    atexit.register(final_write)
+    thread = threading.Thread(target=run, name="metrics-exporter", daemon=True)
+    thread.start()
+    return thread
+
+
+def serve_metrics(registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+    """Serve ``registry`` at ``http://host:port/metrics`` from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?", 1)[0] not in {"/", "/metrics"}:
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("Serving metrics on http://{}:{}/metrics", host, server.server_port)
+    return server
+
+
+_SAMPLE = re.compile(r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>.*)\})?\s+(?P<value>\S+)$")
+_LABEL = re.compile(r'(?P<key>[a-zA-Z_][a-zA-Z0-9_]*)="(?P<value>(?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus(text: str) -> Iterator[tuple[str, LabelKey, float]]:
+    """Yield ``(name, labels, value)`` for each sample line of a Prometheus text file."""
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE.match(line)
+        if match is None:
+            continue
+        labels = tuple(
+            (label["key"], label["value"].replace('\\"', '"').replace("\\n", "\n").replace("\\\\", "\\"))
+            for label in _LABEL.finditer(match["labels"] or "")
+        )
+        yield match["name"], labels, float(match["value"])
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _expired(path: Path, retention: float) -> bool:
+    # Files from exited processes still hold their final totals, so they are kept for a while;
+    # without a limit every short-lived publisher would leave a file behind forever.
+    if not path.stem.isdigit() or int(path.stem) == os.getpid() or _pid_alive(int(path.stem)):
+        return False
+    try:
+        return time.time() - path.stat().st_mtime > retention
+    except FileNotFoundError:
+        return True
+
+
+def collect_snapshot(
+    directory: str | os.PathLike[str] = DEFAULT_METRICS_DIR,
+    *,
+    retention: float = METRICS_RETENTION,
+) -> list[dict[str, Any]]:
+    """
+    Sum the samples written by every process into ``directory``.
+
+    Histogram buckets are left out; each histogram is summarized by its count and mean. Files
+    whose process is gone and that were last written more than ``retention`` seconds ago are
+    deleted instead of counted.
+    """
+    totals: dict[tuple[str, LabelKey], float] = {}
+    directory = Path(directory)
+    paths = sorted(directory.glob("*.prom")) if directory.is_dir() else []
+    for path in paths:
+        if _expired(path, retention):
+            path.unlink(missing_ok=True)
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            for name, labels, value in parse_prometheus(path.read_text()):
+                if name.endswith("_bucket"):
+                    continue
+                totals[name, labels] = totals.get((name, labels), 0.0) + value
+
+    rows: list[dict[str, Any]] = []
+    for (name, labels), value in sorted(totals.items()):
+        if name.endswith("_sum"):
+            continue
+        metric = name.removeprefix(_PREFIX)
+        row: dict[str, Any] = {"metric": metric.removesuffix("_count"), **dict(labels)}
+        if name.endswith("_count"):
+            total = totals.get((name.removesuffix("_count") + "_sum", labels), 0.0)
+            row.update(count=int(value), mean_ms=round(total / value * 1000, 3) if value else None)
+        else:
+            row["value"] = int(value) if value.is_integer() else value
+        rows.append(row)
+    return rows
@@ -8,6 +8,8 @@ from metaflow_argo_events.models.argo_events import (
     PublishResult,
 )
 from metaflow_argo_events.models.auth import AuthConfig, BearerAuth, ServiceAuth
+from metaflow_argo_events.models.event_batch import EventBatch
+from metaflow_argo_events.models.lazy_json import LazyJSON, LazyJSONParameterModel, dump_model_json
 from metaflow_argo_events.models.parameters import (
     DeployTimeFieldModel,
     FlowParameters,
@@ -18,6 +20,12 @@ from metaflow_argo_events.models.parameters import (
     ParameterRequest,
     ParameterResponse,
 )
+from metaflow_argo_events.models.trusted import (
+    dump_json_bytes,
+    trusted_create_event_input,
+    trusted_event_payload,
+)
+from metaflow_argo_events.models.validation import validate_parameters
 
 __all__ = [
     "ArgoEventOutput",
@@ -27,8 +35,13 @@ __all__ = [
     "BearerAuth",
     "CreateArgoEventInput",
     "DeployTimeFieldModel",
+    "dump_json_bytes",
+    "dump_model_json",
+    "EventBatch",
     "FlowParameters",
     "JSONParameterModel",
+    "LazyJSON",
+    "LazyJSONParameterModel",
     "ParameterError",
     "ParameterListResponse",
     "ParameterModel",
@@ -38,4 +51,7 @@ __all__ = [
     "PublishOptions",
     "PublishResult",
     "ServiceAuth",
+    "trusted_create_event_input",
+    "trusted_event_payload",
+    "validate_parameters",
 ]
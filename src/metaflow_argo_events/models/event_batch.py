@@ -0,0 +1,241 @@
+"""
+Compact, columnar storage for large numbers of pending event payloads.
+
+An ``ArgoEventPayload`` instance costs well over a kilobyte once its ``__dict__``, extras dict
+and field-set are counted, which adds up when hundreds of thousands of events wait to be
+published. ``EventBatch`` keeps the declared fields in parallel columns instead: a ``q``
+array for timestamps, and lists for names, ids and dates whose repeated strings are shared.
+Extra payload keys are stored sparsely. Each row records the index of its key tuple (its
+"shape") and where its values start in one flat list, so rows without extras cost nothing
+beyond the shape index and offset.
+
+Rows serialize to JSON, NDJSON or webhook bodies byte for byte like the equivalent models,
+without building one. Indexing with an integer returns an ``ArgoEventPayload``; slicing
+returns a new ``EventBatch``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import islice
+from typing import TYPE_CHECKING, Any, overload
+
+from pydantic_core import to_json
+
+from metaflow_argo_events.models.argo_events import ArgoEventPayload
+from metaflow_argo_events.models.trusted import trusted_event_payload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_PAYLOAD_FIELDS = frozenset(ArgoEventPayload.model_fields)
+_NO_EXTRA: tuple[str, ...] = ()
+# Rows are serialized in chunks so that a single list of row dicts never holds the whole batch.
+_JSON_CHUNK = 4096
+
+
+class EventBatch:
+    """Append-only columnar batch of event payloads; see the module docstring for the layout."""
+
+    __slots__ = (
+        "_dates",
+        "_ids",
+        "_names",
+        "_not_generated",
+        "_offsets",
+        "_shape_index",
+        "_shape_table",
+        "_shapes",
+        "_strings",
+        "_timestamps",
+        "_values",
+    )
+
+    def __init__(self, payloads: Iterable[ArgoEventPayload] = ()) -> None:
+        self._names: list[str] = []
+        self._ids: list[str] = []
+        self._timestamps = array("q")
+        self._dates: list[str] = []
+        self._shapes = array("I")
+        self._shape_table: list[tuple[str, ...]] = [_NO_EXTRA]
+        self._shape_index: dict[tuple[str, ...], int] = {_NO_EXTRA: 0}
+        self._values: list[Any] = []
+        self._offsets = array("Q", [0])
+        # Rows whose generated_by_metaflow is False; almost always empty.
+        self._not_generated: set[int] = set()
+        # Pool for names, dates, keys and string values, so repeats share one object.
+        self._strings: dict[str, str] = {}
+        self.extend(payloads)
+
+    def _share(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def append(
+        self,
+        name: str,
+        event_id: str,
+        timestamp: int,
+        utc_date: str,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        """Add one event, taking the same arguments as ``trusted_event_payload``."""
+        if extra and not _PAYLOAD_FIELDS.isdisjoint(extra):
+            # Declared fields in ``extra`` need validation, exactly as trusted_event_payload does.
+            self.append_payload(trusted_event_payload(name, event_id, timestamp, utc_date, extra))
+            return
+        self._append_row(name, event_id, timestamp, utc_date, extra, generated=True)
+
+    def append_payload(self, payload: ArgoEventPayload) -> None:
+        self._append_row(
+            payload.name,
+            payload.id,
+            payload.timestamp,
+            payload.utc_date,
+            payload.model_extra,
+            generated=payload.generated_by_metaflow,
+        )
+
+    def extend(self, payloads: Iterable[ArgoEventPayload]) -> None:
+        for payload in payloads:
+            self.append_payload(payload)
+
+    def _append_row(  # noqa: PLR0913
+        self,
+        name: str,
+        event_id: str,
+        timestamp: int,
+        utc_date: str,
+        extra: dict[str, Any] | None,
+        *,
+        generated: bool,
+    ) -> None:
+        if not generated:
+            self._not_generated.add(len(self._ids))
+        self._names.append(self._share(name))
+        self._ids.append(event_id)
+        self._timestamps.append(timestamp)
+        self._dates.append(self._share(utc_date))
+        if not extra:
+            self._shapes.append(0)
+            self._offsets.append(self._offsets[-1])
+            return
+        shape = tuple(extra)
+        index = self._shape_index.get(shape)
+        if index is None:
+            index = self._shape_index[shape] = len(self._shape_table)
+            self._shape_table.append(tuple(self._share(key) for key in shape))
+        self._shapes.append(index)
+        self._values.extend(self._share(value) if type(value) is str else value for value in extra.values())
+        self._offsets.append(len(self._values))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def row_extra(self, index: int) -> dict[str, Any]:
+        """Return the extra payload keys of row ``index`` as a new dict."""
+        shape = self._shape_table[self._shapes[index]]
+        if not shape:
+            return {}
+        return dict(zip(shape, self._values[self._offsets[index] : self._offsets[index + 1]], strict=True))
+
+    @overload
+    def __getitem__(self, index: int) -> ArgoEventPayload: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> EventBatch: ...
+
+    def __getitem__(self, index: int | slice) -> ArgoEventPayload | EventBatch:
+        if isinstance(index, slice):
+            return self._slice(index)
+        row = range(len(self))[index]
+        payload = trusted_event_payload(
+            self._names[row], self._ids[row], self._timestamps[row], self._dates[row], self.row_extra(row)
+        )
+        if row in self._not_generated:
+            return payload.model_copy(update={"generated_by_metaflow": False})
+        return payload
+
+    def __iter__(self) -> Iterator[ArgoEventPayload]:
+        """Yield each row as an ``ArgoEventPayload``; prefer the serializers for bulk output."""
+        for row in range(len(self)):
+            yield self[row]
+
+    def _slice(self, index: slice) -> EventBatch:
+        rows = range(len(self))[index]
+        batch = EventBatch()
+        # Shapes and the string pool are only ever appended to, so sharing them is safe.
+        batch._shape_table, batch._shape_index, batch._strings = self._shape_table, self._shape_index, self._strings
+        if not rows:
+            return batch
+        if rows.step == 1:
+            start, stop = rows.start, rows.stop
+            batch._names = self._names[start:stop]
+            batch._ids = self._ids[start:stop]
+            batch._timestamps = self._timestamps[start:stop]
+            batch._dates = self._dates[start:stop]
+            batch._shapes = self._shapes[start:stop]
+            base = self._offsets[start]
+            batch._values = self._values[base : self._offsets[stop]]
+            batch._offsets = array("Q", (offset - base for offset in self._offsets[start : stop + 1]))
+            batch._not_generated = {row - start for row in self._not_generated if start <= row < stop}
+            return batch
+        for row in rows:
+            batch._append_row(
+                self._names[row],
+                self._ids[row],
+                self._timestamps[row],
+                self._dates[row],
+                self.row_extra(row),
+                generated=row not in self._not_generated,
+            )
+        return batch
+
+    def _chunks(self) -> Iterator[list[dict[str, Any]]]:
+        # Walk column slices in lockstep; per-row indexing into every column costs twice as much.
+        table, values, not_generated = self._shape_table, self._values, self._not_generated
+        for start in range(0, len(self), _JSON_CHUNK):
+            stop = min(start + _JSON_CHUNK, len(self))
+            offsets = self._offsets[start : stop + 1]
+            chunk = []
+            for row, name, event_id, timestamp, utc_date, shape, low, high in zip(
+                range(start, stop),
+                self._names[start:stop],
+                self._ids[start:stop],
+                self._timestamps[start:stop],
+                self._dates[start:stop],
+                self._shapes[start:stop],
+                offsets,
+                islice(offsets, 1, None),
+                strict=False,
+            ):
+                row_values = {
+                    "name": name,
+                    "id": event_id,
+                    "timestamp": timestamp,
+                    "utc_date": utc_date,
+                    "generated_by_metaflow": row not in not_generated,
+                }
+                if shape:
+                    row_values.update(zip(table[shape], values[low:high], strict=True))
+                chunk.append(row_values)
+            yield chunk
+
+    def to_json(self) -> bytes:
+        """Serialize all rows as one JSON array of payload objects."""
+        # Each chunk is encoded as an array in one call; the brackets are stripped to join them.
+        return b"[" + b",".join(to_json(chunk)[1:-1] for chunk in self._chunks()) + b"]"
+
+    def iter_ndjson(self) -> Iterator[bytes]:
+        """Yield one newline-terminated JSON payload per row, as ``metaflow-events replay`` reads."""
+        for chunk in self._chunks():
+            for values in chunk:
+                yield to_json(values) + b"\n"
+
+    def to_ndjson(self) -> bytes:
+        return b"".join(self.iter_ndjson())
+
+    def webhook_bodies(self) -> Iterator[bytes]:
+        """Yield the webhook request body of each row, equal to ``encode_webhook_body`` of its model."""
+        for chunk in self._chunks():
+            for values in chunk:
+                yield to_json({"name": values["name"], "payload": values})
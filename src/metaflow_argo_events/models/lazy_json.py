@@ -0,0 +1,287 @@
+"""
+Lazily parsed JSON parameter values.
+
+Config-style JSON parameters can be several megabytes, while most consumers only forward them or
+read a key or two. ``LazyJSON`` keeps the raw text, checks the top-level type with a scan of the
+first and last significant bytes, and parses on first access to ``value``. Until then, turning
+it back into text or bytes returns the original object without copying.
+
+``model_dump`` has to return Python objects and so parses the value. ``dump_model_json``, which
+``LazyJSONParameterModel.model_dump_json`` uses, writes the raw text into the output instead;
+the body is not checked, so malformed text is only caught by whoever parses the result.
+
+Parsing uses ``orjson`` when it is installed (the ``fast`` extra) and the standard library
+otherwise. Values are bounded in size when created and in nesting depth when parsed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import uuid
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import core_schema, to_json
+
+from metaflow_argo_events.models.parameters import (
+    InvalidJSONStringError,
+    InvalidJSONTypeError,
+    JSONTooDeepError,
+    JSONTooLargeError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler, SerializationInfo, ValidationInfo
+    from pydantic.json_schema import JsonSchemaValue
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+DEFAULT_MAX_JSON_BYTES = int(os.environ.get("METAFLOW_EVENTS_JSON_MAX_BYTES", str(32 * 1024 * 1024)))
+DEFAULT_MAX_JSON_DEPTH = int(os.environ.get("METAFLOW_EVENTS_JSON_MAX_DEPTH", "128"))
+# Key of the serialization context entry through which dump_model_json collects raw text.
+_RAW_TEXT = "metaflow_events_lazy_json_raw"
+
+_WHITESPACE = " \t\n\r"
+_CLOSERS = {"{": "}", "[": "]"}
+_ESCAPE = re.compile(rb"\\.", re.DOTALL)
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"[]{}')
+_DEPTH_STEP = {ord("["): 1, ord("{"): 1, ord("]"): -1, ord("}"): -1}
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+loads_json: Callable[[bytes | str], Any] = orjson.loads if HAS_ORJSON else _stdlib_loads
+
+
+def json_depth(data: bytes) -> int:
+    """Return the maximum nesting depth of the JSON text ``data`` without parsing it."""
+    # Brackets inside strings do not nest. Once escapes are gone, quotes pair up, so keeping
+    # only quotes and brackets and dropping every odd quote-delimited segment leaves the brackets
+    # outside strings.
+    if b"\\" in data:
+        data = _ESCAPE.sub(b"", data)
+    brackets = b"".join(data.translate(None, _NOT_STRUCTURE).split(b'"')[::2])
+    return max(accumulate(map(_DEPTH_STEP.__getitem__, brackets)), default=0)
+
+
+def _char(data: str | bytes, index: int) -> str:
+    item = data[index]
+    return item if isinstance(item, str) else chr(item)
+
+
+def _top_level_kind(data: str | bytes) -> str:
+    # Only the first and last significant characters are inspected; the rest is checked on parse.
+    start, end = 0, len(data)
+    while start < end and _char(data, start) in _WHITESPACE:
+        start += 1
+    while end > start and _char(data, end - 1) in _WHITESPACE:
+        end -= 1
+    if start == end:
+        raise InvalidJSONStringError()
+    opener = _char(data, start)
+    if opener not in _CLOSERS:
+        # Scalars (strings, numbers, literals) are valid JSON, just not a valid parameter.
+        raise InvalidJSONTypeError() if opener in '"-0123456789tfn' else InvalidJSONStringError()
+    if _char(data, end - 1) != _CLOSERS[opener]:
+        raise InvalidJSONStringError()
+    return "object" if opener == "{" else "array"
+
+
+class LazyJSON:
+    """
+    A JSON object or array kept as raw text and parsed on first access.
+
+    ``value`` is a parsed view of the raw text, which stays authoritative: build a new instance
+    with ``from_value`` to change the contents rather than mutating ``value`` in place.
+    """
+
+    __slots__ = ("_bytes", "_kind", "_raw", "_value", "max_depth")
+
+    def __init__(
+        self,
+        raw: str | bytes | bytearray | memoryview,
+        *,
+        max_bytes: int = DEFAULT_MAX_JSON_BYTES,
+        max_depth: int = DEFAULT_MAX_JSON_DEPTH,
+    ) -> None:
+        if isinstance(raw, bytearray | memoryview):
+            raw = bytes(raw)
+        encoded = raw if isinstance(raw, bytes) else None
+        size = len(raw)
+        # UTF-8 text takes one to four bytes per character, so only non-ASCII text close to the
+        # limit is encoded to measure it; the encoding is kept for ``to_bytes``.
+        if isinstance(raw, str) and size <= max_bytes < 4 * size and not raw.isascii():
+            encoded = raw.encode()
+            size = len(encoded)
+        if size > max_bytes:
+            raise JSONTooLargeError(size, max_bytes)
+        self._raw: str | bytes = raw
+        self._bytes = encoded
+        self._kind = _top_level_kind(raw)
+        self._value: dict[str, Any] | list[Any] | None = None
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_value(cls, value: dict[str, Any] | list[Any]) -> LazyJSON:
+        """Wrap an already parsed object or array; its text is produced once, compactly."""
+        if not isinstance(value, dict | list):
+            raise InvalidJSONTypeError()
+        text = orjson.dumps(value) if HAS_ORJSON else json.dumps(value, separators=(",", ":")).encode()
+        instance = cls(text, max_bytes=len(text))
+        instance._value = value
+        return instance
+
+    @property
+    def kind(self) -> str:
+        """``"object"`` or ``"array"``, known without parsing."""
+        return self._kind
+
+    @property
+    def parsed(self) -> bool:
+        return self._value is not None
+
+    @property
+    def value(self) -> dict[str, Any] | list[Any]:
+        if self._value is not None:
+            return self._value
+        depth = json_depth(self.to_bytes())
+        if depth > self.max_depth:
+            raise JSONTooDeepError(depth, self.max_depth)
+        try:
+            value: dict[str, Any] | list[Any] = loads_json(self._raw)
+        except ValueError as err:
+            raise InvalidJSONStringError() from err
+        # The top-level check guarantees an object or array for any text that parses.
+        self._value = value
+        return value
+
+    @property
+    def raw(self) -> str | bytes:
+        """The text this value was created from, exactly as given."""
+        return self._raw
+
+    def to_bytes(self) -> bytes:
+        if self._bytes is None:
+            self._bytes = self._raw if isinstance(self._raw, bytes) else self._raw.encode()
+        return self._bytes
+
+    def __str__(self) -> str:
+        return self._raw if isinstance(self._raw, str) else self._raw.decode()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.value[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.value
+        return value.get(key, default) if isinstance(value, dict) else default
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyJSON):
+            return self._raw == other._raw or self.value == other.value
+        return self.value == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        unit = "characters" if isinstance(self._raw, str) else "bytes"
+        return f"LazyJSON({self._kind}, {len(self._raw)} {unit}, {'parsed' if self.parsed else 'unparsed'})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.with_info_plain_validator_function(
+            _coerce_lazy_json,
+            serialization=core_schema.plain_serializer_function_ser_schema(_serialize_lazy_json, info_arg=True),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": ["object", "array"]}
+
+
+class _RawText:
+    """Raw text collected during one ``dump_model_json`` call, keyed by its JSON placeholder."""
+
+    __slots__ = ("prefix", "texts")
+
+    def __init__(self) -> None:
+        # A random prefix keeps placeholders from colliding with any string in the model.
+        self.prefix = f"\x00lazy-json:{uuid.uuid4().hex}:"
+        self.texts: dict[str, str] = {}
+
+    def placeholder(self, value: LazyJSON) -> str:
+        placeholder = f"{self.prefix}{len(self.texts)}"
+        self.texts[to_json(placeholder).decode()] = str(value)
+        return placeholder
+
+
+def _serialize_lazy_json(value: LazyJSON, info: SerializationInfo) -> Any:
+    context = info.context
+    raw_text = context.get(_RAW_TEXT) if info.mode_is_json() and isinstance(context, dict) else None
+    if isinstance(raw_text, _RawText):
+        return raw_text.placeholder(value)
+    return value.value
+
+
+def dump_model_json(model: BaseModel, **kwargs: Any) -> str:
+    """
+    Serialize ``model`` like ``model_dump_json``, writing every ``LazyJSON`` as its raw text.
+
+    Accepts the keyword arguments of ``model_dump_json``; the raw text is written as given,
+    even with ``indent``.
+    """
+    raw_text = _RawText()
+    context = {**(kwargs.pop("context", None) or {}), _RAW_TEXT: raw_text}
+    text = BaseModel.model_dump_json(model, context=context, **kwargs)
+    for placeholder, raw in raw_text.texts.items():
+        text = text.replace(placeholder, raw, 1)
+    return text
+
+
+def _coerce_lazy_json(value: Any, info: ValidationInfo) -> LazyJSON:
+    # Limits can be set per call: `model_validate(data, context={"max_json_bytes": ...})`.
+    # pydantic only reports ValueError as a validation error, so the type error is converted.
+    if isinstance(value, LazyJSON):
+        return value
+    context = info.context or {}
+    try:
+        if isinstance(value, dict | list):
+            return LazyJSON.from_value(value)
+        if isinstance(value, str | bytes | bytearray | memoryview):
+            return LazyJSON(
+                value,
+                max_bytes=context.get("max_json_bytes", DEFAULT_MAX_JSON_BYTES),
+                max_depth=context.get("max_json_depth", DEFAULT_MAX_JSON_DEPTH),
+            )
+    except InvalidJSONTypeError as err:
+        raise ValueError(str(err)) from err
+    raise ValueError(str(InvalidJSONTypeError()))
+
+
+class LazyJSONParameterModel(BaseModel):
+    value: LazyJSON = Field(..., description="JSON value, parsed on first access")
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON without parsing ``value``; see ``dump_model_json``."""
+        return dump_model_json(self, **kwargs)
+
+    model_config = ConfigDict(
+        title="Lazy JSON Parameter Model",
+        json_schema_extra={"example": {"value": {"workers": 4, "timeout": 30, "retry": {"count": 3, "delay": 5}}}},
+    )
@@ -29,12 +29,59 @@ class InvalidJSONTypeError(TypeError):
         super().__init__("JSON value must be an object or array")
 
 
+class JSONTooLargeError(ValueError):
+    def __init__(self, size: int, limit: int) -> None:
+        super().__init__(f"JSON value of {size} bytes exceeds the limit of {limit} bytes")
+
+
+class JSONTooDeepError(ValueError):
+    def __init__(self, depth: int, limit: int) -> None:
+        super().__init__(f"JSON value nested {depth} levels deep exceeds the limit of {limit}")
+
+
 class DuplicateParameterNameError(ValueError):
     def __init__(self) -> None:
         super().__init__("Duplicate parameter names are not allowed")
 
 
-class ParameterModel(BaseModel):
+RESERVED_PARAMETER_NAMES = frozenset({"params", "with", "tag", "namespace", "obj", "tags"})
+SUPPORTED_PARAMETER_TYPES = frozenset({"str", "int", "float", "bool", "json"})
+
+
+def check_parameter_name(value: str) -> str:
+    if value in RESERVED_PARAMETER_NAMES:
+        raise ParameterNameReservedError(value)
+    return value
+
+
+def check_parameter_type(value: str | None) -> str | None:
+    if value is not None and value not in SUPPORTED_PARAMETER_TYPES:
+        raise UnsupportedParameterTypeError(value)
+    return value
+
+
+class _ParameterDefinition(BaseModel):
+    # Validators shared by the models that accept user-written parameter definitions.
+
+    @field_validator("name", check_fields=False)
+    @classmethod
+    def validate_name(cls, value: str) -> str:
+        return check_parameter_name(value)
+
+    @field_validator("type", check_fields=False)
+    @classmethod
+    def validate_type(cls, value: str | None) -> str | None:
+        return check_parameter_type(value)
+
+    @field_validator("separator", check_fields=False)
+    @classmethod
+    def validate_separator(cls, value: str | None, info: ValidationInfo) -> str | None:
+        if value is not None and info.data.get("type") != "str":
+            raise SeparatorTypeError()
+        return value
+
+
+class ParameterModel(_ParameterDefinition):
     name: str = Field(..., description="Parameter name")
     type: str | None = Field("str", description="Parameter type as string")
     help: str | None = Field(None, description="Help text for the parameter")
@@ -58,31 +105,8 @@ class ParameterModel(BaseModel):
         },
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, value: str) -> str:
-        reserved_words = ["params", "with", "tag", "namespace", "obj", "tags"]
-        if value in reserved_words:
-            raise ParameterNameReservedError(value)
-        return value
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, value: str | None) -> str | None:
-        valid_types = ["str", "int", "float", "bool", "json"]
-        if value is not None and value not in valid_types:
-            raise UnsupportedParameterTypeError(value)
-        return value
 
-    @field_validator("separator")
-    @classmethod
-    def validate_separator(cls, value: str | None, info: ValidationInfo) -> str | None:
-        if value is not None and info.data.get("type") != "str":
-            raise SeparatorTypeError()
-        return value
-
-
-class ParameterRequest(BaseModel):
+class ParameterRequest(_ParameterDefinition):
     name: str = Field(..., description="Parameter name")
     type: str | None = Field("str", description="Parameter type")
     help: str | None = Field(None, description="Help text")
@@ -105,29 +129,6 @@ class ParameterRequest(BaseModel):
         },
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, value: str) -> str:
-        reserved_words = ["params", "with", "tag", "namespace", "obj", "tags"]
-        if value in reserved_words:
-            raise ParameterNameReservedError(value)
-        return value
-
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, value: str | None) -> str | None:
-        valid_types = ["str", "int", "float", "bool", "json"]
-        if value is not None and value not in valid_types:
-            raise UnsupportedParameterTypeError(value)
-        return value
-
-    @field_validator("separator")
-    @classmethod
-    def validate_separator(cls, value: str | None, info: ValidationInfo) -> str | None:
-        if value is not None and info.data.get("type") != "str":
-            raise SeparatorTypeError()
-        return value
-
 
 class ParameterResponse(BaseModel):
     name: str = Field(..., description="Parameter name")
@@ -0,0 +1,106 @@
+"""
+Validation-free construction for models built from values that are already known to be valid.
+
+These helpers produce instances equal to the validated constructors (same field values, same
+extras, same serialized output) but skip pydantic validation entirely. They are
+meant for internal code paths that generate every field themselves; input from users, files or
+the network must still go through ``model_validate``.
+"""
+
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from metaflow_argo_events.models.argo_events import ArgoEventPayload, CreateArgoEventInput
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_PAYLOAD_FIELDS = frozenset(ArgoEventPayload.model_fields)
+_PAYLOAD_REQUIRED = frozenset({"name", "id", "timestamp", "utc_date"})
+_INPUT_DEFAULTS = {
+    name: field.get_default(call_default_factory=True) for name, field in CreateArgoEventInput.model_fields.items()
+}
+
+_set_attr = object.__setattr__
+
+
+def construct_model(
+    model_type: type[ModelT],
+    values: dict[str, Any],
+    fields_set: set[str],
+    extra: dict[str, Any] | None = None,
+) -> ModelT:
+    """
+    Build a ``model_type`` instance from ``values`` without validation.
+
+    ``values`` must hold every declared field, already of its declared type. This is
+    ``model_construct`` for models without private attributes, minus its per-field default
+    resolution, which costs more than validating these small models.
+    """
+    instance = model_type.__new__(model_type)
+    _set_attr(instance, "__dict__", values)
+    _set_attr(instance, "__pydantic_fields_set__", fields_set)
+    _set_attr(instance, "__pydantic_extra__", extra)
+    _set_attr(instance, "__pydantic_private__", None)
+    return instance
+
+
+@cache
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for ``tp``; building one compiles a core schema."""
+    return TypeAdapter(tp)
+
+
+def dump_json_bytes(model: BaseModel) -> bytes:
+    """Serialize ``model`` straight to compact JSON bytes using its compiled serializer."""
+    return type(model).__pydantic_serializer__.to_json(model)
+
+
+def dump_json_list(models: list[ModelT], model_type: type[ModelT]) -> bytes:
+    """Serialize a list of ``model_type`` instances as one JSON array in a single call."""
+    return type_adapter(list[model_type]).dump_json(models)  # type: ignore[valid-type]
+
+
+def trusted_event_payload(
+    name: str,
+    event_id: str,
+    timestamp: int,
+    utc_date: str,
+    extra: dict[str, Any] | None = None,
+) -> ArgoEventPayload:
+    """
+    Build an ``ArgoEventPayload`` without validation.
+
+    Falls back to full validation when ``extra`` overrides one of the declared fields, since
+    those values are not guaranteed to have the declared types.
+    """
+    extra = dict(extra) if extra else {}
+    if not _PAYLOAD_FIELDS.isdisjoint(extra):
+        return ArgoEventPayload.model_validate(
+            {"name": name, "id": event_id, "timestamp": timestamp, "utc_date": utc_date, **extra}
+        )
+    values = {"name": name, "id": event_id, "timestamp": timestamp, "utc_date": utc_date, "generated_by_metaflow": True}
+    return construct_model(ArgoEventPayload, values, {*_PAYLOAD_REQUIRED, *extra}, extra)
+
+
+def trusted_create_event_input(
+    name: str,
+    payload: dict[str, Any] | None = None,
+    **fields: Any,
+) -> CreateArgoEventInput:
+    """
+    Build a ``CreateArgoEventInput`` without validation.
+
+    Payload values are stringified exactly as ``CreateArgoEventInput.validate_payload_values``
+    does; values that are already strings are passed through untouched.
+    """
+    converted = {key: value if type(value) is str else str(value) for key, value in (payload or {}).items()}
+    values = {**_INPUT_DEFAULTS, **fields, "name": name, "payload": converted}
+    return construct_model(CreateArgoEventInput, values, {"name", "payload", *fields})
+
+
+def encode_webhook_body(payload: ArgoEventPayload) -> bytes:
+    """Encode the ``{"name": ..., "payload": ...}`` webhook body without an intermediate dict."""
+    return b'{"name":' + to_json(payload.name) + b',"payload":' + dump_json_bytes(payload) + b"}"
@@ -0,0 +1,146 @@
+"""
+Validate many parameter definitions in one call, collecting every problem instead of raising.
+
+``validate_parameters`` applies the same rules as ``ParameterModel`` (plus the unique-name rule of
+``FlowParameters``). Field types for the whole batch are checked in a single pydantic-core call
+that returns invalid items unchanged instead of raising; only those items are validated again, in
+one more call, to collect their errors. The cross-field rules are plain lookups. Valid definitions
+are returned as ``ParameterResponse`` objects and every problem becomes a ``ParameterError``.
+"""
+
+from collections.abc import Iterable
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+from metaflow_argo_events.models.parameters import (
+    RESERVED_PARAMETER_NAMES,
+    DuplicateParameterNameError,
+    ParameterError,
+    ParameterListResponse,
+    ParameterNameReservedError,
+    ParameterResponse,
+    SeparatorTypeError,
+    UnsupportedParameterTypeError,
+)
+from metaflow_argo_events.models.trusted import construct_model
+
+INVALID_DEFINITION = "INVALID_DEFINITION"
+MISSING_FIELD = "MISSING_FIELD"
+INVALID_FIELD = "INVALID_FIELD"
+RESERVED_NAME = "RESERVED_NAME"
+INVALID_TYPE = "INVALID_TYPE"
+INVALID_SEPARATOR = "INVALID_SEPARATOR"
+DUPLICATE_NAME = "DUPLICATE_NAME"
+
+
+class _Definition(BaseModel):
+    # The fields of `ParameterModel` without its Python validators, so that pydantic-core checks
+    # the whole batch natively.
+    name: str
+    type: Literal["str", "int", "float", "bool", "json"] | None = "str"
+    help: str | None = None
+    default: Any | None = None
+    required: bool = False
+    show_default: bool = True
+    separator: str | None = None
+
+    model_config = ConfigDict(extra="allow")
+
+
+# An item that is not a valid definition falls through to `Any` and comes back as given.
+_DEFINITIONS: TypeAdapter[list[_Definition | Any]] = TypeAdapter(
+    list[Annotated[_Definition | Any, Field(union_mode="left_to_right")]]
+)
+_STRICT_DEFINITIONS: TypeAdapter[list[_Definition]] = TypeAdapter(list[_Definition])
+_RESPONSE_FIELDS = frozenset(ParameterResponse.model_fields)
+_ERROR_FIELDS = frozenset({"error_code", "message", "parameter_name", "field"})
+_LIST_FIELDS = frozenset({"parameters", "count"})
+
+
+def _error(code: str, message: str, name: str | None, field: str | None) -> ParameterError:
+    values = {"error_code": code, "message": message, "parameter_name": name, "field": field}
+    return construct_model(ParameterError, values, set(_ERROR_FIELDS))
+
+
+def _name_of(definition: Any) -> str | None:
+    name = definition.get("name") if isinstance(definition, dict) else None
+    return name if isinstance(name, str) else None
+
+
+def _type_errors(definitions: list[Any], failed: list[int]) -> dict[int, list[ParameterError]]:
+    # Validate the failed items once more and translate pydantic's error list into records,
+    # grouped by their index in `definitions`.
+    try:
+        _STRICT_DEFINITIONS.validate_python([definitions[index] for index in failed])
+    except ValidationError as err:
+        details = err.errors(include_url=False, include_context=False)
+    else:
+        details = []
+    errors: dict[int, list[ParameterError]] = {index: [] for index in failed}
+    for detail in details:
+        position, *location = detail["loc"]
+        index = failed[int(position)]
+        name = _name_of(definitions[index])
+        field = str(location[0]) if location else None
+        if field is None:
+            record = _error(INVALID_DEFINITION, "Parameter definition must be a mapping", None, None)
+        elif detail["type"] == "missing":
+            record = _error(MISSING_FIELD, detail["msg"], name, field)
+        elif detail["type"] == "literal_error" and field == "type":
+            record = _error(INVALID_TYPE, str(UnsupportedParameterTypeError(detail["input"])), name, field)
+        else:
+            record = _error(INVALID_FIELD, detail["msg"], name, field)
+        errors[index].append(record)
+    return errors
+
+
+def validate_parameters(definitions: Iterable[Any]) -> tuple[ParameterListResponse, list[ParameterError]]:
+    """
+    Validate every parameter definition in ``definitions`` and report all problems at once.
+
+    Returns the valid definitions as a ``ParameterListResponse`` together with one
+    ``ParameterError`` per problem found; invalid definitions are left out of the response.
+    Parameter names must be unique across the whole batch.
+    """
+    definitions = list(definitions)
+    validated = _DEFINITIONS.validate_python(definitions)
+    failed = [index for index, definition in enumerate(validated) if not isinstance(definition, _Definition)]
+    type_errors = _type_errors(definitions, failed) if failed else {}
+
+    parameters: list[ParameterResponse] = []
+    errors: list[ParameterError] = []
+    seen: set[str] = set()
+    for index, definition in enumerate(validated):
+        if index in type_errors:
+            errors.extend(type_errors[index])
+            continue
+        name, type_name, separator = definition.name, definition.type, definition.separator
+        problems = len(errors)
+        if name in RESERVED_PARAMETER_NAMES:
+            errors.append(_error(RESERVED_NAME, str(ParameterNameReservedError(name)), name, "name"))
+        if separator is not None and type_name != "str":
+            errors.append(_error(INVALID_SEPARATOR, str(SeparatorTypeError()), name, "separator"))
+        if len(errors) == problems and name in seen:
+            errors.append(_error(DUPLICATE_NAME, str(DuplicateParameterNameError()), name, "name"))
+        if len(errors) != problems:
+            continue
+        seen.add(name)
+        type_name = type_name or "str"
+        values = {
+            "name": name,
+            "type": type_name,
+            "help": definition.help,
+            "default": definition.default,
+            "required": definition.required,
+            "show_default": definition.show_default,
+            "is_string_type": type_name == "str",
+            "separator": separator,
+            "additional_properties": definition.__pydantic_extra__ or None,
+        }
+        parameters.append(construct_model(ParameterResponse, values, set(_RESPONSE_FIELDS)))
+
+    response = construct_model(
+        ParameterListResponse, {"parameters": parameters, "count": len(parameters)}, set(_LIST_FIELDS)
+    )
+    return response, errors
@@ -0,0 +1,55 @@
+from metaflow_argo_events.publish.batch import BatchDecodeError, BatchSender, BatchSettings, decode_batch, encode_batch
+from metaflow_argo_events.publish.breaker import CircuitBreaker, CircuitState, shared_breaker
+from metaflow_argo_events.publish.credentials import CredentialProvider, render_headers, token_expiry
+from metaflow_argo_events.publish.dedup import DedupEntry, DedupStats, EventDeduplicator, dedup_key
+from metaflow_argo_events.publish.history import EventHistory, HistoryQuery
+from metaflow_argo_events.publish.limits import EndpointLimiter, EndpointLimits, TokenBucket
+from metaflow_argo_events.publish.outbox import (
+    DrainResult,
+    Outbox,
+    OutboxDrainer,
+    OutboxRecord,
+    OutboxStats,
+)
+from metaflow_argo_events.publish.publisher import (
+    EventPublisher,
+    build_event_payload,
+    encode_event_body,
+    publish_events,
+)
+from metaflow_argo_events.publish.transport import ConnectionPool, HttpResponse, TransportError
+
+__all__ = [
+    "BatchDecodeError",
+    "BatchSender",
+    "BatchSettings",
+    "build_event_payload",
+    "CircuitBreaker",
+    "CircuitState",
+    "ConnectionPool",
+    "CredentialProvider",
+    "dedup_key",
+    "DedupEntry",
+    "DedupStats",
+    "decode_batch",
+    "DrainResult",
+    "encode_batch",
+    "encode_event_body",
+    "EndpointLimiter",
+    "EndpointLimits",
+    "EventDeduplicator",
+    "EventHistory",
+    "EventPublisher",
+    "HistoryQuery",
+    "HttpResponse",
+    "Outbox",
+    "OutboxDrainer",
+    "OutboxRecord",
+    "OutboxStats",
+    "publish_events",
+    "render_headers",
+    "shared_breaker",
+    "TokenBucket",
+    "token_expiry",
+    "TransportError",
+]
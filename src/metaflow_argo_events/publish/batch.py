@@ -0,0 +1,287 @@
+"""
+Batch envelopes: many event payloads in one compressed webhook request.
+
+An envelope is newline-delimited JSON, one webhook body per line, compressed with zstd when
+``zstandard`` is installed and with gzip otherwise. It is sent with ``Content-Type:
+application/x-ndjson``, the matching ``Content-Encoding`` and an ``X-Metaflow-Event-Count``
+header. A stock Argo Events webhook expects one event per request, so batching is opt-in and
+meant for receivers that read envelopes with ``decode_batch``, such as the local stand-in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.lazy_json import DEFAULT_MAX_JSON_BYTES, loads_json
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+logger = get_logger("batch")
+
+BATCH_CONTENT_TYPE = "application/x-ndjson"
+EVENT_COUNT_HEADER = "X-Metaflow-Event-Count"
+ENCODINGS = ("zstd", "gzip", "identity")
+
+_GZIP_WBITS = 31
+# Accept both gzip and zlib headers when decoding.
+_AUTO_WBITS = 47
+_CORRUPT_BODY_ERRORS: tuple[type[Exception], ...] = (zlib.error, EOFError)
+if zstandard is not None:
+    _CORRUPT_BODY_ERRORS += (zstandard.ZstdError,)
+
+
+class BatchDecodeError(ValueError):
+    """Raised when a request body is not a valid batch envelope."""
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def default_encoding() -> str:
+    """Return the best ``Content-Encoding`` available: zstd when installed, gzip otherwise."""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _compressor(encoding: str, level: int | None) -> _Compressor:
+    if encoding == "gzip":
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, _GZIP_WBITS)
+    if encoding == "zstd":
+        if zstandard is None:
+            msg = "zstd compression requires the zstandard package (pip install 'metaflow-argo-events[zstd]')"
+            raise ValueError(msg)
+        compressor: _Compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+        return compressor
+    return _Identity()
+
+
+@dataclass(frozen=True, slots=True)
+class BatchSettings:
+    """
+    When to send a batch and how to compress it.
+
+    A batch is sent once it holds ``max_events`` payloads, once its uncompressed body reaches
+    ``max_bytes``, or ``max_linger`` seconds after its first payload arrived, whichever comes
+    first. ``compression`` is ``"auto"`` (see ``default_encoding``), ``"zstd"``, ``"gzip"`` or
+    ``"identity"``; ``level`` overrides the codec's default compression level.
+    """
+
+    max_events: int = 500
+    max_bytes: int = 1024 * 1024
+    max_linger: float = 0.05
+    compression: str = "auto"
+    level: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_events < 1 or self.max_bytes < 1:
+            msg = "max_events and max_bytes must be at least 1"
+            raise ValueError(msg)
+        if self.max_linger < 0:
+            msg = "max_linger must not be negative"
+            raise ValueError(msg)
+        if self.compression != "auto" and self.compression not in ENCODINGS:
+            msg = f"compression must be 'auto' or one of {', '.join(ENCODINGS)}"
+            raise ValueError(msg)
+        if self.compression == "zstd" and zstandard is None:
+            msg = "zstd compression requires the zstandard package (pip install 'metaflow-argo-events[zstd]')"
+            raise ValueError(msg)
+
+    @property
+    def encoding(self) -> str:
+        return default_encoding() if self.compression == "auto" else self.compression
+
+
+def envelope_headers(headers: Mapping[str, str], encoding: str, count: int) -> dict[str, str]:
+    """Return ``headers`` adjusted for an envelope of ``count`` events."""
+    merged = {key: value for key, value in headers.items() if key.lower() not in {"content-type", "content-encoding"}}
+    merged["Content-Type"] = BATCH_CONTENT_TYPE
+    if encoding != "identity":
+        merged["Content-Encoding"] = encoding
+    merged[EVENT_COUNT_HEADER] = str(count)
+    return merged
+
+
+def encode_batch(bodies: Iterable[bytes], encoding: str = "gzip", level: int | None = None) -> bytes:
+    """Pack encoded webhook bodies into one envelope compressed with ``encoding``."""
+    compressor = _compressor(encoding, level)
+    chunks = [compressor.compress(body + b"\n") for body in bodies]
+    chunks.append(compressor.flush())
+    return b"".join(chunks)
+
+
+def _decompress(body: bytes, encoding: str, max_bytes: int) -> bytes:
+    # Decompress at most one byte past the limit so an oversized (or hostile) body is rejected
+    # without being inflated in full.
+    try:
+        if encoding in {"", "identity"}:
+            data = body
+        elif encoding in {"gzip", "x-gzip", "deflate"}:
+            decompressor = zlib.decompressobj(_AUTO_WBITS if encoding != "deflate" else zlib.MAX_WBITS)
+            data = decompressor.decompress(body, max_bytes + 1)
+        elif encoding == "zstd":
+            if zstandard is None:
+                msg = "zstd-encoded body received but the zstandard package is not installed"
+                raise BatchDecodeError(msg)
+            with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(body)) as reader:
+                data = reader.read(max_bytes + 1)
+        else:
+            msg = f"Unsupported Content-Encoding: {encoding}"
+            raise BatchDecodeError(msg)
+    except _CORRUPT_BODY_ERRORS as err:
+        msg = f"Corrupt {encoding} body: {err}"
+        raise BatchDecodeError(msg) from err
+    if len(data) > max_bytes:
+        msg = f"Decoded body exceeds {max_bytes} bytes"
+        raise BatchDecodeError(msg)
+    return data
+
+
+def decode_batch(
+    body: bytes,
+    content_encoding: str | None = None,
+    content_type: str | None = None,
+    *,
+    max_bytes: int = DEFAULT_MAX_JSON_BYTES,
+) -> list[dict[str, Any]]:
+    """
+    Return the event payloads carried by a webhook request body.
+
+    Envelopes yield one payload per line; any other content type is read as a single event, so
+    a receiver can accept batched and unbatched publishers alike.
+    """
+    data = _decompress(body, (content_encoding or "identity").strip().lower(), max_bytes)
+    media_type = (content_type or BATCH_CONTENT_TYPE).split(";", 1)[0].strip().lower()
+    try:
+        if media_type != BATCH_CONTENT_TYPE:
+            events = [loads_json(data)]
+        else:
+            events = [loads_json(line) for line in data.splitlines() if line.strip()]
+    except ValueError as err:
+        msg = f"Invalid JSON in request body: {err}"
+        raise BatchDecodeError(msg) from err
+    if not all(isinstance(event, dict) for event in events):
+        msg = "Every event must be a JSON object"
+        raise BatchDecodeError(msg)
+    return events
+
+
+class _Batch:
+    __slots__ = ("chunks", "compressor", "futures", "headers", "size", "timer", "url")
+
+    def __init__(self, url: str, headers: Mapping[str, str], compressor: _Compressor) -> None:
+        self.url = url
+        self.headers = headers
+        self.compressor = compressor
+        self.chunks: list[bytes] = []
+        self.futures: list[asyncio.Future[None]] = []
+        self.size = 0
+        self.timer: asyncio.TimerHandle | None = None
+
+    def add(self, body: bytes) -> asyncio.Future[None]:
+        # Compressing as bodies arrive spreads the work out instead of stalling the loop on flush.
+        self.chunks.append(self.compressor.compress(body + b"\n"))
+        self.size += len(body) + 1
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.futures.append(future)
+        return future
+
+    def finish(self) -> bytes:
+        self.chunks.append(self.compressor.flush())
+        return b"".join(self.chunks)
+
+
+class BatchSender:
+    """
+    Collect event bodies per endpoint and deliver them as batch envelopes.
+
+    ``send`` delivers one finished envelope. ``submit`` returns once the batch holding its body
+    was delivered and raises whatever ``send`` raised, so every event in a failed batch fails.
+    Bodies are grouped by URL and by headers, so events carrying different tokens are never
+    mixed.
+    """
+
+    def __init__(
+        self,
+        settings: BatchSettings,
+        send: Callable[[str, bytes, Mapping[str, str]], Awaitable[None]],
+    ) -> None:
+        self.settings = settings
+        self.encoding = settings.encoding
+        self._send = send
+        self._open: dict[tuple[str, int], _Batch] = {}
+        self._sending: set[asyncio.Task[None]] = set()
+
+    async def submit(self, url: str, body: bytes, headers: Mapping[str, str]) -> None:
+        # Header mappings are cached per credential, so identity is a cheap and exact grouping key.
+        key = (url, id(headers))
+        batch = self._open.get(key)
+        if batch is not None and batch.size + len(body) + 1 > self.settings.max_bytes:
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = self._open[key] = _Batch(url, headers, _compressor(self.encoding, self.settings.level))
+            batch.timer = asyncio.get_running_loop().call_later(self.settings.max_linger, self._flush, key, batch)
+        future = batch.add(body)
+        if len(batch.futures) >= self.settings.max_events or batch.size >= self.settings.max_bytes:
+            self._flush(key)
+        # Shielded so that a cancelled caller does not cancel delivery for the rest of the batch.
+        await asyncio.shield(future)
+
+    def _flush(self, key: tuple[str, int], batch: _Batch | None = None) -> None:
+        if batch is None:
+            batch = self._open.get(key)
+        if batch is None or self._open.get(key) is not batch:
+            return
+        del self._open[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._deliver(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _deliver(self, batch: _Batch) -> None:
+        count = len(batch.futures)
+        body = batch.finish()
+        logger.debug("Sending batch of {} events ({} -> {} bytes) to {}", count, batch.size, len(body), batch.url)
+        try:
+            await self._send(batch.url, body, envelope_headers(batch.headers, self.encoding, count))
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_result(None)
+
+    async def flush(self) -> None:
+        """Send every open batch now and wait for all batches in flight."""
+        for key in list(self._open):
+            self._flush(key)
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
@@ -0,0 +1,145 @@
+"""
+Per-endpoint circuit breakers for webhook requests.
+
+A circuit starts closed. ``failure_threshold`` consecutive failures (connection errors or 5xx
+responses) open it, and while open every request fails immediately with ``CircuitOpenError``
+instead of waiting out a timeout against a dead endpoint. After ``reset_timeout`` seconds the
+circuit goes half-open and lets ``half_open_max_calls`` trial requests through: a success
+closes it, a failure opens it again. Circuits are guarded by a ``threading.Lock`` and never
+await, so one breaker can be shared by threads and by tasks on any event loop in the process.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache
+from typing import Any
+
+from metaflow_argo_events.exceptions import CircuitOpenError
+from metaflow_argo_events.logger import get_logger
+
+logger = get_logger("breaker")
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class Circuit:
+    url: str
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    trials: int = 0
+    rejected: int = 0
+
+    def to_dict(self, reset_timeout: float) -> dict[str, Any]:
+        retry_in = self.opened_at + reset_timeout - time.monotonic() if self.state is CircuitState.OPEN else 0.0
+        return {
+            "url": self.url,
+            "state": str(self.state),
+            "consecutive_failures": self.failures,
+            "retry_in": round(max(retry_in, 0.0), 3),
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            msg = "failure_threshold and half_open_max_calls must be at least 1"
+            raise ValueError(msg)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._circuits: dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, url: str) -> Circuit:
+        circuit = self._circuits.get(url)
+        if circuit is None:
+            circuit = self._circuits[url] = Circuit(url)
+        return circuit
+
+    def state(self, url: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(url).state
+
+    def acquire(self, url: str) -> None:
+        """Admit one request to ``url`` or raise ``CircuitOpenError``; pair with ``release``."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state is CircuitState.OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - time.monotonic()
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(url, retry_in, circuit.failures)
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trials = 0
+                logger.info("Circuit for {} is half-open; sending a trial request", url)
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.trials >= self.half_open_max_calls:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(url, 0.0, circuit.failures)
+                circuit.trials += 1
+
+    def release(self, url: str, healthy: bool | None) -> None:
+        """
+        Report how an admitted request went.
+
+        ``healthy`` is None when the request says nothing about the endpoint's health, for
+        example when it was cancelled or throttled; a half-open trial slot is simply returned.
+        """
+        with self._lock:
+            circuit = self._circuit(url)
+            half_open = circuit.state is CircuitState.HALF_OPEN
+            if half_open:
+                circuit.trials = max(circuit.trials - 1, 0)
+            if healthy is None:
+                return
+            if healthy:
+                if half_open:
+                    logger.info("Circuit for {} closed", url)
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if half_open or (circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                logger.warning(
+                    "Circuit for {} opened after {} consecutive failures; failing fast for {}s",
+                    url,
+                    circuit.failures,
+                    self.reset_timeout,
+                )
+
+    def reset(self, url: str | None = None) -> None:
+        """Close the circuit for ``url``, or every circuit when no URL is given."""
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(url, None)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [circuit.to_dict(self.reset_timeout) for circuit in self._circuits.values()]
+
+
+@cache
+def shared_breaker() -> CircuitBreaker:
+    """Process-wide breaker used by publishers that are not given their own."""
+    return CircuitBreaker()
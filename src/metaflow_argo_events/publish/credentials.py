@@ -0,0 +1,148 @@
+"""
+Pre-rendered authentication headers for webhook requests.
+
+``CredentialProvider`` turns an ``AuthConfig`` into an immutable header mapping once, so a
+request only has to look the mapping up. Bearer tokens that carry a JWT ``exp`` claim, or
+that are given a ``token_ttl``, are refreshed on a background thread ``refresh_margin``
+seconds before they expire; only one refresh runs at a time and callers keep getting the
+current headers while it does, so a publish never waits on a token fetch.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.auth import AuthConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+logger = get_logger("credentials")
+
+EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+
+@lru_cache(maxsize=1024)
+def bearer_headers(token: str) -> Mapping[str, str]:
+    """Return the immutable ``Authorization`` header mapping for ``token``."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+@lru_cache(maxsize=256)
+def _service_headers(items: tuple[tuple[str, str], ...]) -> Mapping[str, str]:
+    return MappingProxyType(dict(items))
+
+
+def render_headers(config: AuthConfig) -> Mapping[str, str]:
+    """Return the immutable headers for ``config``; equal configs share one mapping."""
+    if config.method == "bearer" and config.bearer_token:
+        return bearer_headers(config.bearer_token)
+    if config.method == "service" and config.service_headers:
+        return _service_headers(tuple(config.service_headers.items()))
+    return EMPTY_HEADERS
+
+
+def token_expiry(token: str) -> float | None:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, or None if it has none."""
+    parts = token.split(".")
+    if len(parts) != 3:  # noqa: PLR2004
+        return None
+    segment = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(segment))
+    except (binascii.Error, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, int | float) else None
+
+
+class CredentialProvider:
+    """
+    Serve pre-rendered auth headers and keep bearer tokens fresh.
+
+    ``refresh`` is a blocking callable that returns a new bearer token; it always runs on a
+    background thread. Without it, or for non-bearer methods, the headers never change.
+    """
+
+    def __init__(
+        self,
+        config: AuthConfig | None = None,
+        *,
+        refresh: Callable[[], str] | None = None,
+        refresh_margin: float = 60.0,
+        token_ttl: float | None = None,
+        retry_interval: float = 5.0,
+    ) -> None:
+        self.config = config or AuthConfig()
+        self.refresh = refresh
+        self.refresh_margin = refresh_margin
+        self.token_ttl = token_ttl
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._refreshing: threading.Thread | None = None
+        self._headers = render_headers(self.config)
+        self.expires_at: float | None = None
+        self._refresh_at = float("inf")
+        if self.config.method == "bearer" and self.config.bearer_token:
+            self._schedule(self.config.bearer_token)
+
+    def _schedule(self, token: str) -> None:
+        expires_at = token_expiry(token)
+        if expires_at is None and self.token_ttl is not None:
+            expires_at = time.time() + self.token_ttl
+        self.expires_at = expires_at
+        if self.refresh is None or expires_at is None:
+            self._refresh_at = float("inf")
+        else:
+            self._refresh_at = expires_at - self.refresh_margin
+
+    def headers(self) -> Mapping[str, str]:
+        """Return the current headers, starting a background refresh when the token is due."""
+        if time.time() >= self._refresh_at:
+            self._start_refresh()
+        return self._headers
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def _start_refresh(self) -> None:
+        with self._lock:
+            if self._refreshing is not None:
+                return
+            self._refreshing = threading.Thread(target=self._run_refresh, name="token-refresh", daemon=True)
+            self._refreshing.start()
+
+    def _run_refresh(self) -> None:
+        try:
+            token = self.refresh() if self.refresh is not None else None
+        except Exception as err:  # noqa: BLE001
+            logger.warning("Bearer token refresh failed: {}", err)
+            token = None
+        with self._lock:
+            if token:
+                self.config = self.config.model_copy(update={"bearer_token": token})
+                self._headers = bearer_headers(token)
+                self._schedule(token)
+                logger.debug("Bearer token refreshed")
+            else:
+                self._refresh_at = time.time() + self.retry_interval
+            self._refreshing = None
+
+    def refresh_now(self, timeout: float | None = None) -> Mapping[str, str]:
+        """Refresh the token and wait for it; joins a refresh that is already running."""
+        if self.refresh is None:
+            return self._headers
+        self._start_refresh()
+        thread = self._refreshing
+        if thread is not None:
+            thread.join(timeout)
+        return self._headers
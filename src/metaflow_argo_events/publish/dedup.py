@@ -0,0 +1,255 @@
+"""
+Idempotency cache that suppresses re-publishing the same logical event.
+
+Metaflow retries steps, so one logical event (its name plus its payload) can be published
+several times. Each event is keyed by a SHA-256 of its name and canonicalized payload; the
+first publish records the event id it was sent under, and later publishes of the same key
+return that id without touching the network. Entries live in an LRU cache bounded by count
+and expire after ``ttl`` seconds. When a ``path`` is given they are also appended to a journal
+file shared by every process on the node, so retries in a fresh process see them too.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from metaflow_argo_events.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+logger = get_logger("dedup")
+
+DEFAULT_TTL = float(os.environ.get("METAFLOW_EVENTS_DEDUP_TTL", "86400"))
+DEFAULT_MAX_ENTRIES = 100_000
+
+# The journal is rewritten with only live entries once it grows past this many lines per live entry.
+_COMPACT_RATIO = 4
+_COMPACT_MIN_LINES = 1024
+
+
+def dedup_key(name: str, payload: Mapping[str, Any]) -> str:
+    """Return a stable hash of an event ``name`` and its ``payload``, independent of key order."""
+    canonical = json.dumps(
+        [name, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode()
+    return hashlib.sha256(canonical).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class DedupEntry:
+    event_id: str
+    delivered: bool
+    expires_at: float
+
+    def to_json(self, key: str) -> bytes:
+        record = {"key": key, "event_id": self.event_id, "delivered": self.delivered, "expires_at": self.expires_at}
+        return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+@dataclass(frozen=True, slots=True)
+class DedupStats:
+    entries: int
+    hits: int
+    misses: int
+    path: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"entries": self.entries, "hits": self.hits, "misses": self.misses, "path": self.path}
+
+
+class EventDeduplicator:
+    """
+    LRU + TTL record of published event keys, optionally persisted to a node-local journal.
+
+    ``delivered`` distinguishes events that reached the webhook from events that were spooled to
+    the outbox; both are deduplicated because the outbox delivers spooled events on its own.
+    Lookups that miss in memory first read any lines other processes appended to the journal
+    since the last read, so the file is never parsed more than once per process.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if ttl <= 0:
+            msg = "ttl must be positive"
+            raise ValueError(msg)
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, DedupEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._offset = 0
+        self._inode: int | None = None
+        self._journal_lines = 0
+        # Live records left by the last compaction; with several processes the journal can hold
+        # more of them than this process's LRU.
+        self._journal_live = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.compact()
+
+    def get(self, key: str) -> DedupEntry | None:
+        """Return the live entry for ``key``, or None when the event has not been published."""
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is None and self.path is not None:
+                self._read_journal(self.path)
+                entry = self._lookup(key, now)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return entry
+
+    def put(self, key: str, event_id: str, *, delivered: bool = True) -> DedupEntry:
+        """Record that the event with ``key`` was published as ``event_id``."""
+        entry = DedupEntry(event_id, delivered, time.time() + self.ttl)
+        with self._lock:
+            self._store(key, entry)
+            if self.path is not None:
+                self._append(self.path, key, entry)
+        return entry
+
+    def discard(self, key: str) -> None:
+        """Forget ``key`` in this process; entries already in the journal expire with their TTL."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> DedupStats:
+        with self._lock:
+            return DedupStats(
+                len(self._entries), self._hits, self._misses, str(self.path) if self.path is not None else None
+            )
+
+    def _lookup(self, key: str, now: float) -> DedupEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: DedupEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @contextlib.contextmanager
+    def _locked_journal(self, path: Path, flags: int, lock: int) -> Iterator[int]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            fd = os.open(path, flags | os.O_CREAT, 0o600)
+            fcntl.flock(fd, lock)
+            with contextlib.suppress(FileNotFoundError):
+                if os.fstat(fd).st_ino == path.stat().st_ino:
+                    break
+            # The journal was compacted while we waited for the lock; use the new file.
+            os.close(fd)
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+
+    def _read_journal(self, path: Path) -> None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_ino == self._inode and stat.st_size == self._offset:
+            return
+        with self._locked_journal(path, os.O_RDONLY, fcntl.LOCK_SH) as fd:
+            self._consume(fd)
+
+    def _consume(self, fd: int) -> None:
+        """Load journal lines appended since the last read from the locked ``fd``."""
+        stat = os.fstat(fd)
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Another process compacted the journal: reread it from the start.
+            self._inode, self._offset, self._journal_lines = stat.st_ino, 0, 0
+        data = os.pread(fd, stat.st_size - self._offset, self._offset)
+        # Only consume complete lines; a partially visible append is picked up next time.
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+        self._journal_lines += data.count(b"\n", 0, end)
+        for key, entry in self._parse(data[:end], time.time()):
+            self._store(key, entry)
+
+    def _parse(self, data: bytes, now: float) -> Iterator[tuple[str, DedupEntry]]:
+        """Yield the unexpired records in the journal lines ``data``, oldest first."""
+        for line in data.splitlines():
+            try:
+                record = json.loads(line)
+                key, entry = record["key"], DedupEntry(record["event_id"], record["delivered"], record["expires_at"])
+            except (ValueError, KeyError):
+                logger.warning("Skipping unreadable dedup journal line in {}", self.path)
+                continue
+            if entry.expires_at > now:
+                yield key, entry
+
+    def _append(self, path: Path, key: str, entry: DedupEntry) -> None:
+        line = entry.to_json(key)
+        # The exclusive lock keeps other processes from appending between the fstat and the
+        # write, so the size seen by fstat is exactly where our line lands.
+        with self._locked_journal(path, os.O_WRONLY | os.O_APPEND, fcntl.LOCK_EX) as fd:
+            stat = os.fstat(fd)
+            os.write(fd, line)
+        if stat.st_ino == self._inode and stat.st_size == self._offset:
+            # Nothing new from other processes was pending, so skip rereading our own line.
+            self._offset += len(line)
+        self._journal_lines += 1
+        live = max(len(self._entries), self._journal_live)
+        if self._journal_lines >= max(_COMPACT_MIN_LINES, _COMPACT_RATIO * live):
+            self._compact(path)
+
+    def compact(self) -> None:
+        """Rewrite the journal with only unexpired entries."""
+        if self.path is None:
+            return
+        with self._lock:
+            self._compact(self.path)
+
+    def _compact(self, path: Path) -> None:
+        # The journal, not this process's LRU, is the shared record: the LRU is capped at
+        # max_entries and may have evicted entries that other processes still rely on.
+        with self._locked_journal(path, os.O_RDONLY, fcntl.LOCK_EX) as fd:
+            self._consume(fd)
+            data = os.pread(fd, self._offset, 0)
+            live: dict[str, DedupEntry] = {}
+            for key, entry in self._parse(data, time.time()):
+                # Later records for a key supersede earlier ones.
+                live.pop(key, None)
+                live[key] = entry
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(b"".join(entry.to_json(key) for key, entry in live.items()))
+            tmp.replace(path)
+            stat = path.stat()
+            self._inode, self._offset = stat.st_ino, stat.st_size
+            self._journal_lines = self._journal_live = len(live)
+        logger.debug("Compacted dedup journal {} to {} entries", path, len(live))
@@ -0,0 +1,252 @@
+"""
+Local, indexed history of published events in a SQLite database.
+
+``EventHistory.record`` only appends a row tuple to an in-memory list; a background thread
+writes pending rows in one transaction every ``flush_interval`` seconds, or as soon as
+``batch_size`` rows are waiting, so the publish path never waits on disk. The database is in
+WAL mode, so queries from other processes, such as ``metaflow-events events list``, run
+alongside the writer. Rows are indexed on ``(name, timestamp)``, ``(utc_date, name, timestamp)``,
+``(status, timestamp)`` and ``timestamp``, so lookups by name, day, status or time range stay
+fast with millions of rows.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.argo_events import ArgoEventOutput
+from metaflow_argo_events.models.lazy_json import loads_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from metaflow_argo_events.models.argo_events import ArgoEventPayload
+
+logger = get_logger("history")
+
+DEFAULT_HISTORY_PATH = Path(
+    os.environ.get("METAFLOW_EVENTS_HISTORY_PATH", Path.home() / ".metaflow-events" / "history.db")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    utc_date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS events_name_timestamp ON events (name, timestamp);
+CREATE INDEX IF NOT EXISTS events_date_name_timestamp ON events (utc_date, name, timestamp);
+CREATE INDEX IF NOT EXISTS events_status_timestamp ON events (status, timestamp);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+"""
+# A later status wins: an event spooled to the outbox and delivered by a drain ends up "published".
+_UPSERT = """
+INSERT INTO events (event_id, name, timestamp, utc_date, status, payload) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (event_id) DO UPDATE SET status = excluded.status
+"""
+_COLUMNS = "event_id, name, timestamp, utc_date, status, payload"
+
+Row = tuple[str, str, int, str, str, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryQuery:
+    """
+    Filters for ``EventHistory.query``.
+
+    ``since`` and ``until`` are Unix timestamps (inclusive); ``utc_date`` is YYYYMMDD.
+    """
+
+    name: str | None = None
+    utc_date: str | None = None
+    since: int | None = None
+    until: int | None = None
+    status: str | None = None
+
+    def where(self) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, operator, value in (
+            ("name", "=", self.name),
+            ("utc_date", "=", self.utc_date),
+            ("timestamp", ">=", self.since),
+            ("timestamp", "<=", self.until),
+            ("status", "=", self.status),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class EventHistory:
+    """
+    Batched writer and query interface for the event history database at ``path``.
+
+    Call ``close`` (or leave it to interpreter exit) to write rows still pending. Events
+    recorded after ``close`` are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_HISTORY_PATH,
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._reader() as connection:
+            connection.executescript(_SCHEMA)
+        self._pending: list[Row] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flushed = threading.Condition(self._lock)
+        # Rows handed to record() and rows the writer has finished with, for flush().
+        self._recorded = 0
+        self._written = 0
+        self._closed = False
+        # Started by the first record() so that read-only use never spawns a thread.
+        self._writer: threading.Thread | None = None
+
+    def record(self, payload: ArgoEventPayload, status: str = "published") -> None:
+        """Queue one event for writing; never blocks on the database."""
+        if self._closed:
+            return
+        extra = payload.model_extra
+        row = (
+            payload.id,
+            payload.name,
+            payload.timestamp,
+            payload.utc_date,
+            status,
+            to_json(extra).decode() if extra else None,
+        )
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="event-history", daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+            self._pending.append(row)
+            self._recorded += 1
+            if len(self._pending) >= self.batch_size:
+                self._wake.set()
+
+    def _take(self) -> list[Row]:
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._wake.clear()
+            return rows
+
+    def _write(self, connection: sqlite3.Connection, rows: list[Row]) -> None:
+        try:
+            with connection:
+                connection.executemany(_UPSERT, rows)
+        except sqlite3.Error as err:
+            logger.warning("Could not write {} events to {}: {}", len(rows), self.path, err)
+        with self._lock:
+            self._written += len(rows)
+            self._flushed.notify_all()
+
+    def _run(self) -> None:
+        connection = _connect(self.path)
+        try:
+            while not self._closed:
+                self._wake.wait(self.flush_interval)
+                if rows := self._take():
+                    self._write(connection, rows)
+            if rows := self._take():
+                self._write(connection, rows)
+            connection.execute("PRAGMA optimize")
+        finally:
+            connection.close()
+
+    def flush(self, timeout: float | None = 10.0) -> None:
+        """Wait until every event recorded so far has been written."""
+        with self._lock:
+            target = self._recorded
+            if self._written >= target or self._writer is None or not self._writer.is_alive():
+                return
+            self._wake.set()
+            self._flushed.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._wake.set()
+            self._writer.join()
+            atexit.unregister(self.close)
+
+    def query(self, query: HistoryQuery | None = None, *, limit: int | None = 100) -> list[ArgoEventOutput]:
+        """Return matching events, newest first."""
+        where, params = (query or HistoryQuery()).where()
+        sql = f"SELECT {_COLUMNS} FROM events{where} ORDER BY timestamp DESC"  # noqa: S608 - only placeholders
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._reader() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [_to_output(row) for row in rows]
+
+    def count(self, query: HistoryQuery | None = None) -> int:
+        where, params = (query or HistoryQuery()).where()
+        with self._reader() as connection:
+            (total,) = connection.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()  # noqa: S608
+        return int(total)
+
+    def get(self, event_id: str) -> ArgoEventOutput | None:
+        with self._reader() as connection:
+            row = connection.execute(f"SELECT {_COLUMNS} FROM events WHERE event_id = ?", (event_id,)).fetchone()  # noqa: S608
+        return _to_output(row) if row is not None else None
+
+    @contextlib.contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        connection = _connect(self.path)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+
+def _to_output(row: Row) -> ArgoEventOutput:
+    event_id, name, timestamp, _, status, payload = row
+    return ArgoEventOutput.model_construct(
+        event_id=event_id,
+        name=name,
+        timestamp=timestamp,
+        status=status,
+        payload=loads_json(payload) if payload else None,
+    )
+
+
+@cache
+def default_history() -> EventHistory | None:
+    """Process-wide history used by publishers when METAFLOW_EVENTS_HISTORY_PATH is set."""
+    if "METAFLOW_EVENTS_HISTORY_PATH" not in os.environ:
+        return None
+    return EventHistory(DEFAULT_HISTORY_PATH)
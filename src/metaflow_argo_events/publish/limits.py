@@ -0,0 +1,286 @@
+"""
+Per-endpoint rate limiting and adaptive concurrency for webhook requests.
+
+Every webhook URL gets a token bucket, which caps the request rate, and a concurrency limit
+that follows AIMD (additive increase, multiplicative decrease): each fast, successful response
+raises the limit by ``1 / limit``, so it grows by about one per round trip, and a throttled
+(429/503), failed (5xx or connection error) or slow response cuts it by ``backoff``. Cuts
+happen at most once per round trip, so a burst of rejections from one window counts as a
+single congestion signal.
+``Retry-After`` on a throttled response pauses the endpoint for that long.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+    from metaflow_argo_events.publish.transport import HttpResponse
+
+logger = get_logger("limits")
+
+THROTTLE_STATUSES = frozenset({429, 503})
+
+_LATENCY_SMOOTHING = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointLimits:
+    """
+    Limits for one webhook endpoint.
+
+    ``rate`` is in requests per second (None disables rate limiting) and ``burst`` is how many
+    requests may go out back to back; it defaults to one second's worth. Responses slower than
+    ``latency_target`` seconds count as congestion.
+    """
+
+    rate: float | None = None
+    burst: int | None = None
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    initial_concurrency: int | None = None
+    latency_target: float = 2.0
+    backoff: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.rate is not None and self.rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+        if not 1 <= self.min_concurrency <= self.max_concurrency:
+            msg = "concurrency limits must satisfy 1 <= min_concurrency <= max_concurrency"
+            raise ValueError(msg)
+        if not 0 < self.backoff < 1:
+            msg = "backoff must be between 0 and 1"
+            raise ValueError(msg)
+
+    @property
+    def bucket_size(self) -> float:
+        if self.burst is not None:
+            return float(max(self.burst, 1))
+        return max(self.rate or 1.0, 1.0)
+
+
+class TokenBucket:
+    """
+    Token bucket that lets callers borrow against future tokens.
+
+    A caller that finds the bucket empty takes a token anyway and sleeps until it would have
+    been refilled, so waiters are served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+@dataclass(slots=True)
+class Slot:
+    """One admitted request; the caller records how it went before the slot is released."""
+
+    started: float = field(default_factory=time.monotonic)
+    status: int | None = None
+    failed: bool = False
+    retry_after: float | None = None
+
+    def record(self, response: HttpResponse) -> None:
+        self.status = response.status
+        if response.status in THROTTLE_STATUSES:
+            self.retry_after = _parse_retry_after(response.headers.get("retry-after"))
+
+    def fail(self) -> None:
+        """Mark the request as failed at the connection level (refused, reset or timed out)."""
+        self.failed = True
+
+
+class EndpointState:
+    """Live limits and counters for one endpoint."""
+
+    def __init__(self, url: str, limits: EndpointLimits) -> None:
+        self.url = url
+        self.limits = limits
+        self.limit = float(min(limits.initial_concurrency or limits.max_concurrency, limits.max_concurrency))
+        self.in_flight = 0
+        self.bucket = TokenBucket(limits.rate, limits.bucket_size) if limits.rate is not None else None
+        self.latency: float | None = None
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # We were handed a free slot but will not use it; pass it on.
+                    self._wake()
+                raise
+            finally:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        try:
+            if (pause := self._paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            if self.bucket is not None:
+                await self.bucket.acquire()
+        except BaseException:
+            self.in_flight -= 1
+            self._wake()
+            raise
+
+    def release(self, slot: Slot) -> None:
+        now = time.monotonic()
+        elapsed = now - slot.started
+        self.in_flight -= 1
+        self.requests += 1
+        throttled = slot.status in THROTTLE_STATUSES
+        failed = slot.failed or (slot.status is not None and slot.status >= 500 and not throttled)  # noqa: PLR2004
+        if throttled:
+            self.throttled += 1
+            if slot.retry_after:
+                self._paused_until = max(self._paused_until, now + slot.retry_after)
+        elif failed:
+            self.errors += 1
+        else:
+            self.latency = (
+                elapsed if self.latency is None else self.latency + _LATENCY_SMOOTHING * (elapsed - self.latency)
+            )
+
+        if throttled or failed or elapsed > self.limits.latency_target:
+            self._decrease(now)
+        elif slot.status is not None:
+            self.limit = min(float(self.limits.max_concurrency), self.limit + 1 / self.limit)
+        self._wake()
+
+    def _decrease(self, now: float) -> None:
+        # Every request already in flight when congestion began reports it; only react once per round trip.
+        if now - self._last_decrease < (self.latency or self.limits.latency_target):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(float(self.limits.min_concurrency), self.limit * self.limits.backoff)
+        if int(self.limit) < int(previous):
+            logger.debug("Reduced concurrency for {} from {} to {}", self.url, int(previous), int(self.limit))
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        for waiter in self._waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "concurrency_limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "rate": self.limits.rate,
+            "tokens": round(self.bucket.tokens, 3) if self.bucket is not None else None,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "paused_for": round(max(self._paused_until - time.monotonic(), 0.0), 3),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "errors": self.errors,
+        }
+
+
+class EndpointLimiter:
+    """
+    Rate and concurrency limits for every webhook URL a publisher talks to.
+
+    ``overrides`` maps URL prefixes to the limits for matching endpoints; the longest matching
+    prefix wins and other URLs use ``default``. State is tied to the event loop that uses it.
+    """
+
+    def __init__(
+        self,
+        default: EndpointLimits | None = None,
+        overrides: Mapping[str, EndpointLimits] | None = None,
+    ) -> None:
+        self.default = default or EndpointLimits()
+        self.overrides = dict(overrides or {})
+        self._endpoints: dict[str, EndpointState] = {}
+
+    def configure(self, url_prefix: str, limits: EndpointLimits) -> None:
+        """Set limits for URLs starting with ``url_prefix``, resetting endpoints already seen."""
+        self.overrides[url_prefix] = limits
+        for url in [url for url in self._endpoints if url.startswith(url_prefix)]:
+            if self._endpoints[url].in_flight == 0:
+                del self._endpoints[url]
+
+    def limits_for(self, url: str) -> EndpointLimits:
+        matches = [prefix for prefix in self.overrides if url.startswith(prefix)]
+        return self.overrides[max(matches, key=len)] if matches else self.default
+
+    def endpoint(self, url: str) -> EndpointState:
+        state = self._endpoints.get(url)
+        if state is None:
+            state = EndpointState(url, self.limits_for(url))
+            self._endpoints[url] = state
+        return state
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[Slot]:
+        """Wait for ``url``'s rate and concurrency limits to admit one request."""
+        state = self.endpoint(url)
+        await state.acquire()
+        slot = Slot()
+        try:
+            yield slot
+        finally:
+            state.release(slot)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return the current limits and counters for every endpoint seen so far."""
+        return [state.snapshot() for state in self._endpoints.values()]
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    # Only the delay-seconds form is honoured; an HTTP-date falls back to the AIMD backoff alone.
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
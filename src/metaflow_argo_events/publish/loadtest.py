@@ -0,0 +1,135 @@
+"""
+Open-loop load generation against a webhook, usually the local stand-in.
+
+Events are scheduled at a fixed rate whether or not earlier ones have completed, and each
+latency is measured from the event's scheduled start. A publisher that falls behind therefore
+shows up as growing latency, rather than as a lower request rate that hides the backlog
+(coordinated omission).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.argo_events import CreateArgoEventInput
+
+if TYPE_CHECKING:
+    from metaflow_argo_events.publish.publisher import EventPublisher
+
+logger = get_logger("loadtest")
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of the already sorted ``ordered``."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(math.ceil(fraction * len(ordered)) - 1, 0))]
+
+
+@dataclass(frozen=True, slots=True)
+class LoadTestResult:
+    target_rate: float
+    duration: float
+    sent: int
+    succeeded: int
+    failed: int
+    dropped: int
+    latencies: tuple[float, ...]
+
+    @property
+    def throughput(self) -> float:
+        """Events delivered per second of wall-clock time."""
+        return self.succeeded / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "target_rate": self.target_rate,
+            "sent": self.sent,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "duration_s": round(self.duration, 3),
+            "throughput_per_s": round(self.throughput, 1),
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        }
+
+
+async def run_load_test(  # noqa: PLR0913
+    publisher: EventPublisher,
+    url: str,
+    *,
+    rate: float,
+    duration: float,
+    payload_size: int = 64,
+    max_outstanding: int = 10_000,
+) -> LoadTestResult:
+    """
+    Publish ``rate`` events per second to ``url`` for ``duration`` seconds.
+
+    Events that would take the number of unfinished publishes past ``max_outstanding`` are
+    counted as dropped instead of being queued without bound.
+    """
+    if rate <= 0 or duration <= 0:
+        msg = "rate and duration must be positive"
+        raise ValueError(msg)
+    event = CreateArgoEventInput(
+        name="loadtest",
+        url=url,
+        payload={"padding": "x" * payload_size},
+        force=True,
+        ignore_errors=True,
+    )
+    total = math.ceil(rate * duration)
+    latencies: list[float] = []
+    outcomes = {"succeeded": 0, "failed": 0}
+    pending: set[asyncio.Task[None]] = set()
+
+    async def fire(scheduled: float) -> None:
+        try:
+            result = await publisher.publish(event)
+        except Exception as err:  # noqa: BLE001
+            logger.debug("Load test publish failed: {}", err)
+            outcomes["failed"] += 1
+            return
+        latencies.append(time.perf_counter() - scheduled)
+        outcomes["succeeded" if result.success else "failed"] += 1
+
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    sent = dropped = 0
+    while sent + dropped < total:
+        # Fire everything that is due in one go: sleeping once per event would cap the rate at
+        # the event loop's timer resolution.
+        due = min(total, int((time.perf_counter() - start) * rate) + 1)
+        while sent + dropped < due:
+            scheduled = start + (sent + dropped) / rate
+            if len(pending) >= max_outstanding:
+                dropped += 1
+                continue
+            task = loop.create_task(fire(scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            sent += 1
+        if sent + dropped < total:
+            await asyncio.sleep(max(start + (sent + dropped) / rate - time.perf_counter(), 0))
+    if pending:
+        await asyncio.gather(*pending)
+    elapsed = time.perf_counter() - start
+    return LoadTestResult(
+        target_rate=rate,
+        duration=elapsed,
+        sent=sent,
+        succeeded=outcomes["succeeded"],
+        failed=outcomes["failed"],
+        dropped=dropped,
+        latencies=tuple(latencies),
+    )
@@ -0,0 +1,403 @@
+"""
+Append-only, crash-safe on-disk outbox for events that could not be published.
+
+Records are framed as ``<length><crc32><json>`` and appended with unbuffered ``os.write``
+calls, so a record survives a process crash as soon as ``append`` returns; ``fsync`` is
+batched by count and by time to bound the data lost on a host crash. Every writer process
+appends to its own ``*.open`` segment, which is sealed into a ``*.seg`` segment on rotation
+or close. Drainers replay sealed segments in creation order and record progress in a
+``*.ack`` file beside each segment, so an interrupted drain resumes where it stopped.
+
+A record keeps the event's own access token, if it had one, so that it is replayed with the
+same credentials; segments are therefore created readable by their owner only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import itertools
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from pydantic_core import to_json
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.argo_events import ArgoEventPayload
+from metaflow_argo_events.models.trusted import dump_json_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from metaflow_argo_events.publish.publisher import EventPublisher
+
+logger = get_logger("outbox")
+
+DEFAULT_OUTBOX_DIR = Path(os.environ.get("METAFLOW_EVENTS_OUTBOX_DIR", Path.home() / ".metaflow-events" / "outbox"))
+
+_HEADER = struct.Struct(">II")
+_OPEN_SUFFIX = ".open"
+_SEALED_SUFFIX = ".seg"
+_ACK_SUFFIX = ".ack"
+_DRAIN_LOCK = "drain.lock"
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxRecord:
+    url: str
+    payload: ArgoEventPayload
+    enqueued_at: float
+    access_token: str | None = None
+
+    def encode(self) -> bytes:
+        data = b"".join(
+            (
+                b'{"url":',
+                to_json(self.url),
+                b',"payload":',
+                dump_json_bytes(self.payload),
+                b',"enqueued_at":',
+                to_json(self.enqueued_at),
+                b',"access_token":' + to_json(self.access_token) if self.access_token else b"",
+                b"}",
+            )
+        )
+        return _HEADER.pack(len(data), zlib.crc32(data)) + data
+
+    @classmethod
+    def decode(cls, data: bytes) -> OutboxRecord:
+        raw = json.loads(data)
+        return cls(
+            raw["url"],
+            ArgoEventPayload.model_validate(raw["payload"]),
+            raw["enqueued_at"],
+            raw.get("access_token"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxStats:
+    directory: str
+    segments: int
+    open_segments: int
+    pending_records: int
+    pending_bytes: int
+    oldest_enqueued_at: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "segments": self.segments,
+            "open_segments": self.open_segments,
+            "pending_records": self.pending_records,
+            "pending_bytes": self.pending_bytes,
+            "oldest_enqueued_at": self.oldest_enqueued_at,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class DrainResult:
+    replayed: int
+    failed: int
+    segments_removed: int
+
+    def to_dict(self) -> dict[str, int]:
+        return {"replayed": self.replayed, "failed": self.failed, "segments_removed": self.segments_removed}
+
+
+def _iter_frames(path: Path, offset: int = 0) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(end_offset, record_bytes)`` for every intact frame after ``offset``."""
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        while True:
+            header = handle.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, checksum = _HEADER.unpack(header)
+            data = handle.read(length)
+            if len(data) < length or zlib.crc32(data) != checksum:
+                # A torn or partially written tail: everything after it is unreadable.
+                if data:
+                    logger.warning("Outbox segment {} has a corrupt record at offset {}", path.name, offset)
+                return
+            offset += _HEADER.size + length
+            yield offset, data
+
+
+def _read_ack(segment: Path) -> int:
+    try:
+        return int(segment.with_suffix(_ACK_SUFFIX).read_text())
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _write_ack(segment: Path, offset: int) -> None:
+    ack = segment.with_suffix(_ACK_SUFFIX)
+    tmp = ack.with_suffix(".ack.tmp")
+    tmp.write_text(str(offset))
+    tmp.replace(ack)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Outbox:
+    """
+    Durable spool of ``ArgoEventPayload`` records awaiting delivery.
+
+    ``append`` costs one ``write`` syscall; ``fsync`` runs once ``fsync_every`` records or
+    ``fsync_interval`` seconds have accumulated, whichever comes first. A timer covers the
+    time bound when no further append arrives. Segments rotate once they exceed
+    ``segment_max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = DEFAULT_OUTBOX_DIR,
+        *,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        fsync_every: int = 256,
+        fsync_interval: float = 0.05,
+    ) -> None:
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._segment: Path | None = None
+        self._segment_bytes = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer: threading.Timer | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _open_segment(self) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns():020d}-{os.getpid()}{_OPEN_SUFFIX}"
+        self._segment = self.directory / name
+        self._fd = os.open(self._segment, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._segment_bytes = 0
+        return self._fd
+
+    def _sync(self) -> None:
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _timed_sync(self) -> None:
+        with self._lock:
+            self._sync_timer = None
+            self._sync()
+
+    def _schedule_sync(self) -> None:
+        # One timer at a time: it syncs whatever was appended since, so idle writers are bounded too.
+        if self._sync_timer is None:
+            self._sync_timer = threading.Timer(self.fsync_interval, self._timed_sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def _seal(self) -> None:
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        if self._fd is None or self._segment is None:
+            return
+        self._sync()
+        os.close(self._fd)
+        if self._segment_bytes:
+            self._segment.rename(self._segment.with_suffix(_SEALED_SUFFIX))
+        else:
+            self._segment.unlink(missing_ok=True)
+        self._fd = None
+        self._segment = None
+
+    def append(self, url: str, payload: ArgoEventPayload, access_token: str | None = None) -> None:
+        """Spool ``payload`` for later delivery to ``url``, with ``access_token`` if the event had one."""
+        frame = OutboxRecord(url, payload, time.time(), access_token).encode()
+        with self._lock:
+            fd = self._fd if self._fd is not None else self._open_segment()
+            os.write(fd, frame)
+            self._segment_bytes += len(frame)
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+            else:
+                self._schedule_sync()
+            if self._segment_bytes >= self.segment_max_bytes:
+                self._seal()
+
+    def flush(self) -> None:
+        """Force pending records to stable storage."""
+        with self._lock:
+            self._sync()
+
+    def rotate(self) -> None:
+        """Seal the active segment so that it becomes visible to drainers."""
+        with self._lock:
+            self._seal()
+
+    def close(self) -> None:
+        self.rotate()
+
+    def _sealed_segments(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        for segment in self.directory.glob(f"*{_OPEN_SUFFIX}"):
+            # Segments left open by a writer that crashed are safe to seal: their tail is
+            # discarded on read if it was torn mid-record.
+            pid = int(segment.stem.rsplit("-", 1)[-1])
+            if pid != os.getpid() and not _pid_alive(pid):
+                with contextlib.suppress(FileNotFoundError):
+                    segment.rename(segment.with_suffix(_SEALED_SUFFIX))
+        return sorted(self.directory.glob(f"*{_SEALED_SUFFIX}"))
+
+    def stats(self) -> OutboxStats:
+        pending_records = pending_bytes = 0
+        oldest: float | None = None
+        segments = self._sealed_segments()
+        open_segments = list(self.directory.glob(f"*{_OPEN_SUFFIX}")) if self.directory.is_dir() else []
+        for segment in [*segments, *sorted(open_segments)]:
+            start = _read_ack(segment)
+            for end, data in _iter_frames(segment, start):
+                if oldest is None:
+                    oldest = json.loads(data)["enqueued_at"]
+                pending_records += 1
+                pending_bytes += end - start
+                start = end
+        return OutboxStats(
+            directory=str(self.directory),
+            segments=len(segments),
+            open_segments=len(open_segments),
+            pending_records=pending_records,
+            pending_bytes=pending_bytes,
+            oldest_enqueued_at=oldest,
+        )
+
+    @contextlib.contextmanager
+    def _drain_lock(self) -> Iterator[bool]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with (self.directory / _DRAIN_LOCK).open("a") as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    async def drain(
+        self,
+        send: Callable[[OutboxRecord], Awaitable[bool]],
+        *,
+        limit: int | None = None,
+        window: int = 64,
+    ) -> DrainResult:
+        """
+        Replay spooled records through ``send`` in the order they were written.
+
+        ``send`` returns True once a record has been delivered. Up to ``window`` records are
+        sent concurrently and acknowledged together; draining stops at the first record that
+        fails and it is retried on the next drain. Delivery is at-least-once: records after a
+        failure in the same window may be sent again. Only one drainer per directory runs at
+        a time; concurrent calls return immediately.
+        """
+        self.rotate()
+        replayed = removed = 0
+        with self._drain_lock() as acquired:
+            if not acquired:
+                logger.debug("Outbox {} is already being drained", self.directory)
+                return DrainResult(0, 0, 0)
+            for segment in self._sealed_segments():
+                frames = _iter_frames(segment, _read_ack(segment))
+                while True:
+                    budget = window if limit is None else min(window, limit - replayed)
+                    batch = list(itertools.islice(frames, budget)) if budget > 0 else []
+                    if not batch:
+                        break
+                    delivered = await asyncio.gather(*(send(OutboxRecord.decode(data)) for _, data in batch))
+                    acked = next((index for index, ok in enumerate(delivered) if not ok), len(batch))
+                    if acked:
+                        _write_ack(segment, batch[acked - 1][0])
+                    replayed += acked
+                    if acked < len(batch):
+                        return DrainResult(replayed, 1, removed)
+                if limit is not None and replayed >= limit:
+                    break
+                segment.unlink()
+                segment.with_suffix(_ACK_SUFFIX).unlink(missing_ok=True)
+                removed += 1
+        logger.info("Drained {} records from outbox {}", replayed, self.directory)
+        return DrainResult(replayed, 0, removed)
+
+
+class OutboxDrainer:
+    """
+    Replays an outbox, once with ``drain_once`` or periodically on a background thread.
+
+    Each cycle runs on a fresh event loop with a publisher from ``publisher_factory``, so the
+    drainer never shares connections with publishers running on other loops.
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        publisher_factory: Callable[[], EventPublisher],
+        *,
+        interval: float = 5.0,
+    ) -> None:
+        self.outbox = outbox
+        self.publisher_factory = publisher_factory
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    async def drain_once(self, *, limit: int | None = None) -> DrainResult:
+        async with self.publisher_factory() as publisher:
+            return await publisher.drain_outbox(self.outbox, limit=limit)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                asyncio.run(self.drain_once())
+            except Exception as err:  # noqa: BLE001
+                logger.warning("Outbox drain failed: {}", err)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-drainer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until ``stop`` is called or ``timeout`` passes; returns whether it was stopped."""
+        return self._stop.wait(timeout)
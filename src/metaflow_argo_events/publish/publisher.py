@@ -0,0 +1,426 @@
+"""Asynchronous, batched publishing of Argo events over pooled HTTP connections."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Self
+
+from metaflow_argo_events.exceptions import ClientError
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.metrics import get_metrics
+from metaflow_argo_events.models.argo_events import ArgoEventPayload, CreateArgoEventInput, PublishResult
+from metaflow_argo_events.models.auth import AuthConfig
+from metaflow_argo_events.models.trusted import encode_webhook_body, trusted_event_payload
+from metaflow_argo_events.publish.batch import BatchSender
+from metaflow_argo_events.publish.breaker import shared_breaker
+from metaflow_argo_events.publish.credentials import CredentialProvider, bearer_headers
+from metaflow_argo_events.publish.dedup import dedup_key
+from metaflow_argo_events.publish.history import default_history
+from metaflow_argo_events.publish.limits import THROTTLE_STATUSES, EndpointLimiter, EndpointLimits
+from metaflow_argo_events.publish.transport import ConnectionPool, TransportError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from metaflow_argo_events.metrics import BoundMetrics
+    from metaflow_argo_events.publish.batch import BatchSettings
+    from metaflow_argo_events.publish.breaker import CircuitBreaker
+    from metaflow_argo_events.publish.dedup import EventDeduplicator
+    from metaflow_argo_events.publish.history import EventHistory
+    from metaflow_argo_events.publish.outbox import DrainResult, Outbox, OutboxRecord
+
+logger = get_logger("publisher")
+
+WEBHOOK_SERVICE = "Argo Events webhook"
+_MAX_CACHED_TOKENS = 1024
+
+
+def build_event_payload(
+    event: CreateArgoEventInput,
+    additional_payload: dict[str, Any] | None = None,
+) -> ArgoEventPayload:
+    """Build the payload Metaflow's ``ArgoEvent.publish`` would send for ``event``."""
+    now = time.time()
+    return trusted_event_payload(
+        event.name,
+        str(uuid.uuid4()),
+        int(now),
+        datetime.fromtimestamp(now, UTC).strftime("%Y%m%d"),
+        {**event.payload, **additional_payload} if additional_payload else event.payload,
+    )
+
+
+def encode_event_body(payload: ArgoEventPayload) -> bytes:
+    """Encode ``payload`` into the JSON request body expected by the Argo Events webhook."""
+    return encode_webhook_body(payload)
+
+
+def should_publish(event: CreateArgoEventInput) -> bool:
+    """Events are published when forced or when running inside an Argo workflow."""
+    return event.force or bool(os.environ.get("ARGO_WORKFLOW_TEMPLATE"))
+
+
+class EventPublisher:
+    """
+    Publish ``CreateArgoEventInput`` objects concurrently.
+
+    Connections are kept alive and reused per webhook origin, and at most ``max_in_flight``
+    requests are outstanding at any time. Auth headers come from ``auth`` and are rendered once
+    per credential rather than per request.
+
+    Each webhook URL is held to the rate and adaptive concurrency limits of ``limiter`` (see
+    ``limits.EndpointLimiter``), and requests to an endpoint whose circuit in ``breaker`` is
+    open fail fast. With ``batch`` settings, events for the same endpoint are packed into
+    compressed envelopes (see ``batch.BatchSender``) instead of one request each; only receivers
+    that understand envelopes can accept them.
+
+    When an ``outbox`` is configured, events that fail to publish are spooled there instead of
+    being dropped. With a ``dedup`` cache, an event whose name and payload were already
+    published returns the original event id without a request. Outcomes, latencies and queue
+    depths are recorded in ``metrics``, the process-wide registry by default, and every outcome
+    is written to ``history`` when one is configured (by default when
+    ``METAFLOW_EVENTS_HISTORY_PATH`` is set).
+
+    Use as an async context manager so that pending batches are sent and pooled connections are
+    closed on exit.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        default_url: str | None = None,
+        max_in_flight: int = 64,
+        max_connections_per_origin: int = 32,
+        timeout: float = 60.0,
+        headers: dict[str, str] | None = None,
+        pool: ConnectionPool | None = None,
+        outbox: Outbox | None = None,
+        dedup: EventDeduplicator | None = None,
+        limiter: EndpointLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        auth: AuthConfig | CredentialProvider | None = None,
+        metrics: BoundMetrics | None = None,
+        batch: BatchSettings | None = None,
+        history: EventHistory | None = None,
+    ) -> None:
+        if max_in_flight < 1:
+            msg = "max_in_flight must be at least 1"
+            raise ValueError(msg)
+        self.default_url = default_url or os.environ.get("METAFLOW_ARGO_EVENTS_WEBHOOK_URL")
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self._pool = pool or ConnectionPool(max_connections_per_origin=max_connections_per_origin)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self.outbox = outbox
+        self.dedup = dedup
+        self.limiter = limiter or EndpointLimiter(EndpointLimits(max_concurrency=max_in_flight))
+        self.breaker = breaker or shared_breaker()
+        self.credentials = CredentialProvider(auth) if isinstance(auth, AuthConfig) else auth
+        self._merged_headers: tuple[Mapping[str, str], Mapping[str, str]] | None = None
+        self._token_headers: dict[str, Mapping[str, str]] = {}
+        self._publishing: dict[str, asyncio.Future[PublishResult | None]] = {}
+        self.metrics = metrics or get_metrics()
+        self.batch = batch
+        self.history = history if history is not None else default_history()
+        self._batcher = BatchSender(batch, self._send) if batch is not None else None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._batcher is not None:
+            await self._batcher.flush()
+        await self._pool.close()
+
+    def default_headers(self) -> Mapping[str, str]:
+        """Headers for requests without their own token, merged once per credential change."""
+        if self.credentials is None:
+            return self.headers
+        auth = self.credentials.headers()
+        merged = self._merged_headers
+        if merged is None or merged[0] is not auth:
+            merged = self._merged_headers = (auth, MappingProxyType({**self.headers, **auth}))
+            self._token_headers.clear()
+        return merged[1]
+
+    def _request_headers(self, access_token: str | None) -> Mapping[str, str]:
+        base = self.default_headers()
+        if not access_token:
+            return base
+        headers = self._token_headers.get(access_token)
+        if headers is None:
+            if len(self._token_headers) >= _MAX_CACHED_TOKENS:
+                self._token_headers.clear()
+            headers = MappingProxyType({**base, **bearer_headers(access_token)})
+            self._token_headers[access_token] = headers
+        return headers
+
+    async def send_payload(
+        self,
+        url: str,
+        payload: ArgoEventPayload,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Deliver an already built payload, raising ``ClientError`` on failure."""
+        body, headers = encode_event_body(payload), headers or self.default_headers()
+        if self._batcher is not None:
+            await self._batcher.submit(url, body, headers)
+        else:
+            await self._send(url, body, headers)
+
+    async def _send(self, url: str, body: bytes, headers: Mapping[str, str]) -> None:
+        self.breaker.acquire(url)
+        healthy: bool | None = None
+        try:
+            async with self.limiter.slot(url) as slot:
+                try:
+                    response = await self._pool.request("POST", url, headers=headers, body=body, timeout=self.timeout)
+                except TransportError as err:
+                    slot.fail()
+                    healthy = False
+                    raise ClientError.connection_failed(WEBHOOK_SERVICE, str(err)) from err
+                slot.record(response)
+            # Throttling is the limiter's concern; only server errors say the endpoint is unhealthy.
+            if response.status not in THROTTLE_STATUSES:
+                healthy = response.status < 500  # noqa: PLR2004
+        finally:
+            self.breaker.release(url, healthy)
+        if not response.ok:
+            detail = response.body.decode(errors="replace")[:200] or "no response body"
+            raise ClientError.api_error(WEBHOOK_SERVICE, response.status, detail)
+
+    def endpoint_limits(self) -> list[dict[str, Any]]:
+        """Return the rate and concurrency limits, plus counters, for each webhook URL used so far."""
+        return self.limiter.snapshot()
+
+    def circuits(self) -> list[dict[str, Any]]:
+        """Return the circuit breaker state for each webhook URL used so far."""
+        return self.breaker.snapshot()
+
+    async def publish(
+        self,
+        event: CreateArgoEventInput,
+        additional_payload: dict[str, Any] | None = None,
+    ) -> PublishResult:
+        """Publish a single event, honouring its ``force`` and ``ignore_errors`` flags."""
+        if not should_publish(event):
+            if not event.ignore_errors:
+                raise ClientError.not_published(event.name)
+            return PublishResult(success=False, error_message=f"Argo Event ({event.name}) was not published")
+
+        url = self._resolve_url(event)
+        if url is None:
+            return PublishResult(success=False, error_message="No webhook URL configured")
+        if self.dedup is None:
+            return await self._publish(event, url, additional_payload)
+
+        key = _event_key(event, additional_payload)
+        while (pending := self._publishing.get(key)) is not None:
+            # An identical event is being published right now; share its outcome, or try again
+            # ourselves if that attempt raised.
+            result = await asyncio.shield(pending)
+            if result is not None:
+                self.metrics.inc("events_deduplicated_total", event=event.name)
+                return result
+        duplicate = self._duplicate_result(event, key)
+        if duplicate is not None:
+            return duplicate
+        future: asyncio.Future[PublishResult | None] = asyncio.get_running_loop().create_future()
+        self._publishing[key] = future
+        result = None
+        try:
+            result = await self._publish(event, url, additional_payload)
+            if result.event_id is not None:
+                self.dedup.put(key, result.event_id, delivered=result.success)
+        finally:
+            del self._publishing[key]
+            future.set_result(result)
+        return result
+
+    def _duplicate_result(self, event: CreateArgoEventInput, key: str) -> PublishResult | None:
+        entry = self.dedup.get(key) if self.dedup is not None else None
+        if entry is None:
+            return None
+        logger.debug("Argo Event ({}) already published as {}", event.name, entry.event_id)
+        self.metrics.inc("events_deduplicated_total", event=event.name)
+        if entry.delivered:
+            return PublishResult(success=True, event_id=entry.event_id)
+        return PublishResult(success=False, event_id=entry.event_id, error_message="Already spooled to outbox")
+
+    async def _publish(
+        self,
+        event: CreateArgoEventInput,
+        url: str,
+        additional_payload: dict[str, Any] | None,
+    ) -> PublishResult:
+        payload = build_event_payload(event, additional_payload)
+        try:
+            elapsed = await self._deliver(url, encode_event_body(payload), self._request_headers(event.access_token))
+        except ClientError as err:
+            self.metrics.inc("events_failed_total", endpoint=url, event=event.name)
+            if self.outbox is not None:
+                self.outbox.append(url, payload, event.access_token)
+                self.metrics.inc("events_spooled_total", endpoint=url, event=event.name)
+                self._record(payload, "spooled")
+                err.hint = "The event was spooled to the outbox; run `metaflow-events outbox drain` to replay it."
+                if not event.ignore_errors:
+                    raise
+                return PublishResult(success=False, event_id=payload.id, error_message=f"{err.message} (spooled)")
+            self._record(payload, "failed")
+            if not event.ignore_errors:
+                raise
+            return PublishResult(success=False, error_message=err.message)
+        self._record(payload, "published")
+        self.metrics.observe("publish_latency_seconds", elapsed, endpoint=url, event=event.name)
+        self.metrics.inc("events_published_total", endpoint=url, event=event.name)
+        logger.debug("Argo Event ({}) published", event.name)
+        return PublishResult(success=True, event_id=payload.id)
+
+    async def _deliver(self, url: str, body: bytes, headers: Mapping[str, str]) -> float:
+        """Send one event body, on its own or in a batch, and return how long delivery took."""
+        if self._batcher is not None:
+            # A batch is one request, so batched events are bounded by the limiter, not by permits.
+            with self.metrics.gauge("publish_in_flight"):
+                started = time.perf_counter()
+                await self._batcher.submit(url, body, headers)
+                return time.perf_counter() - started
+        with self.metrics.gauge("publish_queued"):
+            await self._in_flight.acquire()
+        try:
+            with self.metrics.gauge("publish_in_flight"):
+                started = time.perf_counter()
+                await self._send(url, body, headers)
+                return time.perf_counter() - started
+        finally:
+            self._in_flight.release()
+
+    def _record(self, payload: ArgoEventPayload, status: str) -> None:
+        if self.history is not None:
+            self.history.record(payload, status)
+
+    def _resolve_url(self, event: CreateArgoEventInput) -> str | None:
+        url = event.url or self.default_url
+        if not url and not event.ignore_errors:
+            raise ClientError.webhook_url_missing()
+        return url
+
+    def defer(
+        self,
+        event: CreateArgoEventInput,
+        additional_payload: dict[str, Any] | None = None,
+    ) -> PublishResult:
+        """
+        Spool ``event`` to the outbox without touching the network.
+
+        The returned result carries the event id; delivery happens on the next outbox drain.
+        """
+        if self.outbox is None:
+            raise ClientError.outbox_missing()
+        url = self._resolve_url(event)
+        if url is None:
+            return PublishResult(success=False, error_message="No webhook URL configured")
+        key = _event_key(event, additional_payload) if self.dedup is not None else None
+        if key is not None:
+            duplicate = self._duplicate_result(event, key)
+            if duplicate is not None:
+                return duplicate
+        payload = build_event_payload(event, additional_payload)
+        self.outbox.append(url, payload, event.access_token)
+        self.metrics.inc("events_spooled_total", endpoint=url, event=event.name)
+        self._record(payload, "spooled")
+        if key is not None and self.dedup is not None:
+            self.dedup.put(key, payload.id, delivered=False)
+        return PublishResult(success=False, event_id=payload.id, error_message="Deferred to outbox")
+
+    async def drain_outbox(self, outbox: Outbox | None = None, *, limit: int | None = None) -> DrainResult:
+        """Replay spooled events through this publisher's connection pool."""
+        outbox = outbox or self.outbox
+        if outbox is None:
+            raise ClientError.outbox_missing()
+
+        async def send(record: OutboxRecord) -> bool:
+            url, name = record.url, record.payload.name
+            self.metrics.inc("events_retried_total", endpoint=url, event=name)
+            started = time.perf_counter()
+            try:
+                await self.send_payload(record.url, record.payload, self._request_headers(record.access_token))
+            except ClientError:
+                self.metrics.inc("events_failed_total", endpoint=url, event=name)
+                return False
+            self.metrics.observe("publish_latency_seconds", time.perf_counter() - started, endpoint=url, event=name)
+            self.metrics.inc("events_published_total", endpoint=url, event=name)
+            self._record(record.payload, "published")
+            return True
+
+        return await outbox.drain(send, limit=limit)
+
+    async def publish_many(
+        self,
+        events: Iterable[CreateArgoEventInput] | AsyncIterable[CreateArgoEventInput],
+    ) -> list[PublishResult]:
+        """
+        Publish a stream of events and return one ``PublishResult`` per event, in input order.
+
+        The input is consumed lazily: at most ``max_in_flight`` events are pending at once (or
+        two full batches when batching), so long or slow iterators never have to be materialized
+        up front.
+        """
+        window = self.max_in_flight if self.batch is None else max(self.max_in_flight, 2 * self.batch.max_events)
+        results: list[PublishResult | None] = []
+        pending: set[asyncio.Task[None]] = set()
+        stream = events if isinstance(events, AsyncIterable) else _aiter(events)
+
+        async def run(index: int, event: CreateArgoEventInput) -> None:
+            results[index] = await self.publish(event)
+
+        async def submit(event: CreateArgoEventInput) -> None:
+            if len(pending) >= window:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                for task in done:
+                    task.result()
+            results.append(None)
+            pending.add(asyncio.create_task(run(len(results) - 1, event)))
+
+        try:
+            async for event in stream:
+                await submit(event)
+            if pending:
+                await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+        return [result for result in results if result is not None]
+
+
+def _event_key(event: CreateArgoEventInput, additional_payload: dict[str, Any] | None) -> str:
+    return dedup_key(event.name, {**event.payload, **additional_payload} if additional_payload else event.payload)
+
+
+async def _aiter(events: Iterable[CreateArgoEventInput]) -> AsyncIterator[CreateArgoEventInput]:
+    for event in events:
+        yield event
+
+
+def publish_events(
+    events: Iterable[CreateArgoEventInput],
+    **publisher_options: Any,
+) -> list[PublishResult]:
+    """Blocking helper that publishes ``events`` with a short-lived ``EventPublisher``."""
+
+    async def run() -> list[PublishResult]:
+        async with EventPublisher(**publisher_options) as publisher:
+            return await publisher.publish_many(events)
+
+    return asyncio.run(run())
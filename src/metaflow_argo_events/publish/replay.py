@@ -0,0 +1,258 @@
+"""
+Streaming, order-preserving replay of recorded events.
+
+Records are read one line at a time from NDJSON files (optionally gzipped), each line being an
+``ArgoEventOutput``, an ``ArgoEventPayload`` or a ``{"name": ..., "payload": ...}`` webhook
+body. Matching events are republished with their original ids and timestamps. Every event is
+routed to one of ``concurrency`` lanes by a hash of its partition key. Each lane sends
+strictly in file order, so events sharing a key arrive in order while different keys proceed
+in parallel. Lanes hold at most ``lane_buffer`` events, so memory stays bounded whatever the
+input size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import gzip
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from pydantic import ValidationError as PydanticValidationError
+
+from metaflow_argo_events.exceptions import ClientError
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.argo_events import ArgoEventOutput, ArgoEventPayload
+from metaflow_argo_events.models.lazy_json import loads_json
+from metaflow_argo_events.models.trusted import encode_webhook_body
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from metaflow_argo_events.publish.publisher import EventPublisher
+
+logger = get_logger("replay")
+
+STDIN = "-"
+PARTITION_BY_NAME = "name"
+NO_PARTITION = "none"
+
+_YIELD_EVERY = 64
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayFilter:
+    """
+    Which recorded events to replay.
+
+    ``names`` are shell-style patterns matched against the event name; ``since`` and ``until``
+    bound ``utc_date`` (YYYYMMDD, inclusive). Empty criteria match everything.
+    """
+
+    names: tuple[str, ...] = ()
+    since: str | None = None
+    until: str | None = None
+
+    def matches(self, payload: ArgoEventPayload) -> bool:
+        if self.since is not None and payload.utc_date < self.since:
+            return False
+        if self.until is not None and payload.utc_date > self.until:
+            return False
+        return not self.names or any(fnmatch.fnmatchcase(payload.name, pattern) for pattern in self.names)
+
+
+@dataclass(slots=True)
+class ReplayProgress:
+    read: int = 0
+    matched: int = 0
+    replayed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        elapsed = self.elapsed
+        return self.replayed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "read": self.read,
+            "matched": self.matched,
+            "replayed": self.replayed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_s": round(self.elapsed, 3),
+            "events_per_s": round(self.throughput, 1),
+        }
+
+
+def to_payload(record: dict[str, Any]) -> ArgoEventPayload:
+    """Turn one recorded line into the payload to republish; raises pydantic's ValidationError."""
+    if "event_id" in record:
+        output = ArgoEventOutput.model_validate(record)
+        utc_date = datetime.fromtimestamp(output.timestamp, UTC).strftime("%Y%m%d")
+        return ArgoEventPayload.model_validate(
+            {
+                **(output.payload or {}),
+                "name": output.name,
+                "id": output.event_id,
+                "timestamp": output.timestamp,
+                "utc_date": utc_date,
+            }
+        )
+    if "id" not in record and isinstance(record.get("payload"), dict):
+        return ArgoEventPayload.model_validate(record["payload"])
+    return ArgoEventPayload.model_validate(record)
+
+
+@contextmanager
+def _open_records(path: str) -> Iterator[IO[bytes]]:
+    if path == STDIN:
+        yield sys.stdin.buffer
+    elif path.endswith(".gz"):
+        with gzip.open(path, "rb") as compressed:
+            yield cast("IO[bytes]", compressed)
+    else:
+        with Path(path).open("rb") as handle:
+            yield handle
+
+
+def iter_recorded_events(
+    paths: Iterable[str],
+    event_filter: ReplayFilter | None = None,
+    progress: ReplayProgress | None = None,
+) -> Iterator[ArgoEventPayload]:
+    """Yield the matching events from NDJSON ``paths`` one at a time, skipping malformed lines."""
+    event_filter = event_filter or ReplayFilter()
+    progress = progress if progress is not None else ReplayProgress()
+    for path in paths:
+        with _open_records(path) as handle:
+            for line_number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                progress.read += 1
+                try:
+                    record = loads_json(line)
+                    if not isinstance(record, dict):
+                        msg = "not a JSON object"
+                        raise TypeError(msg)  # noqa: TRY301
+                    payload = to_payload(record)
+                except (ValueError, TypeError, PydanticValidationError) as err:
+                    progress.skipped += 1
+                    logger.warning("Skipping {}:{}: {}", path, line_number, str(err).splitlines()[0])
+                    continue
+                if event_filter.matches(payload):
+                    progress.matched += 1
+                    yield payload
+
+
+def partition_key(payload: ArgoEventPayload, key: str) -> str | None:
+    """
+    Return the ordering key of ``payload``.
+
+    ``key`` is ``"name"``, ``"none"`` (no ordering) or ``"payload.<field>"`` for a payload field;
+    events missing the field share one partition.
+    """
+    if key == NO_PARTITION:
+        return None
+    if key == PARTITION_BY_NAME:
+        return payload.name
+    field_name = key.removeprefix("payload.")
+    value = (payload.model_extra or {}).get(field_name, getattr(payload, field_name, None))
+    return "" if value is None else str(value)
+
+
+@dataclass(frozen=True, slots=True)
+class _LaneSender:
+    publisher: EventPublisher
+    url: str
+    retries: int
+    retry_delay: float
+    progress: ReplayProgress
+    on_failure: Callable[[ArgoEventPayload, ClientError], None] | None
+
+    async def send(self, payload: ArgoEventPayload) -> None:
+        for attempt in range(self.retries + 1):
+            try:
+                await self.publisher.send_payload(self.url, payload)
+            except ClientError as err:
+                if attempt == self.retries:
+                    self.progress.failed += 1
+                    if self.on_failure is not None:
+                        self.on_failure(payload, err)
+                    return
+                await asyncio.sleep(self.retry_delay * 2**attempt)
+            else:
+                self.progress.replayed += 1
+                return
+
+    async def run(self, lane: asyncio.Queue[ArgoEventPayload | None]) -> None:
+        while (payload := await lane.get()) is not None:
+            await self.send(payload)
+
+
+async def replay_events(  # noqa: PLR0913
+    publisher: EventPublisher,
+    events: Iterable[ArgoEventPayload],
+    url: str,
+    *,
+    concurrency: int = 16,
+    partition: str = PARTITION_BY_NAME,
+    retries: int = 3,
+    retry_delay: float = 1.0,
+    lane_buffer: int = 256,
+    progress: ReplayProgress | None = None,
+    on_failure: Callable[[ArgoEventPayload, ClientError], None] | None = None,
+) -> ReplayProgress:
+    """
+    Republish ``events`` to ``url``, keeping order within each partition.
+
+    A failing event is retried ``retries`` times with exponential backoff before its lane moves
+    on; events that still fail are counted and passed to ``on_failure``.
+    """
+    if concurrency < 1:
+        msg = "concurrency must be at least 1"
+        raise ValueError(msg)
+    progress = progress if progress is not None else ReplayProgress()
+    sender = _LaneSender(publisher, url, retries, retry_delay, progress, on_failure)
+    lanes: list[asyncio.Queue[ArgoEventPayload | None]] = [
+        asyncio.Queue(maxsize=lane_buffer) for _ in range(concurrency)
+    ]
+    workers = [asyncio.create_task(sender.run(lane)) for lane in lanes]
+    try:
+        for index, payload in enumerate(events):
+            key = partition_key(payload, partition)
+            lane = index % concurrency if key is None else zlib.crc32(key.encode()) % concurrency
+            await lanes[lane].put(payload)
+            if index % _YIELD_EVERY == 0:
+                # Reading is synchronous and put() only suspends on a full lane; let the lanes run.
+                await asyncio.sleep(0)
+        for queue in lanes:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+        raise
+    return progress
+
+
+def failure_writer(handle: IO[bytes]) -> Callable[[ArgoEventPayload, ClientError], None]:
+    """Return an ``on_failure`` callback that appends failed events to ``handle`` as NDJSON."""
+
+    def write(payload: ArgoEventPayload, err: ClientError) -> None:
+        handle.write(encode_webhook_body(payload) + b"\n")
+        logger.debug("Replay of {} failed: {}", payload.id, err.message)
+
+    return write
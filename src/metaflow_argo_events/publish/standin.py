@@ -0,0 +1,267 @@
+"""
+Local stand-in for an Argo Events webhook, for benchmarking and testing the publish path.
+
+``StandInWebhook`` is a small asyncio HTTP/1.1 server with keep-alive. It accepts ``POST``
+requests carrying one webhook body or a batch envelope of them, checks that each body wraps
+an ``ArgoEventPayload``, and can inject latency, server errors and 429 throttling according to
+``Faults``. ``GET /stats`` returns its counters as JSON and ``GET /healthz`` returns 200.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.lazy_json import DEFAULT_MAX_JSON_BYTES
+from metaflow_argo_events.publish.batch import BatchDecodeError, decode_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = get_logger("standin")
+
+_CRLF = b"\r\n"
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+_REQUIRED_FIELDS = (("name", str), ("id", str), ("timestamp", int), ("utc_date", str))
+
+
+@dataclass(frozen=True, slots=True)
+class Faults:
+    """
+    Faults to inject into every request.
+
+    Each request first waits ``latency`` seconds plus up to ``jitter`` more, then is answered
+    with 429 (and ``Retry-After: retry_after`` when set) with probability ``throttle_rate``,
+    or with 500 with probability ``error_rate``.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency < 0 or self.jitter < 0:
+            msg = "latency and jitter must not be negative"
+            raise ValueError(msg)
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.throttle_rate <= 1:
+            msg = "error_rate and throttle_rate must be between 0 and 1"
+            raise ValueError(msg)
+
+
+@dataclass(slots=True)
+class StandInStats:
+    requests: int = 0
+    events: int = 0
+    batches: int = 0
+    errors: int = 0
+    throttled: int = 0
+    rejected: int = 0
+    bytes_received: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def payload_error(body: Mapping[str, Any]) -> str | None:
+    """Return why a webhook body is not ``{"name": ..., "payload": ArgoEventPayload}``, or None."""
+    if not isinstance(body.get("name"), str):
+        return "'name' must be a str"
+    payload = body.get("payload")
+    if not isinstance(payload, dict):
+        return "'payload' must be an object"
+    for name, expected in _REQUIRED_FIELDS:
+        value = payload.get(name)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            return f"'payload.{name}' must be a {expected.__name__}"
+    return None
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+    keep_alive: bool
+
+
+class StandInWebhook:
+    """
+    Stand-in webhook receiver.
+
+    Use as an async context manager, or call ``start`` and ``close``. ``keep`` is how many of
+    the most recently accepted webhook bodies to retain in ``received`` for inspection.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Faults | None = None,
+        *,
+        keep: int = 0,
+        seed: int | None = None,
+        max_body_bytes: int = DEFAULT_MAX_JSON_BYTES,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.faults = faults or Faults()
+        self.max_body_bytes = max_body_bytes
+        self.stats = StandInStats()
+        self.received: deque[dict[str, Any]] = deque(maxlen=keep)
+        self._random = random.Random(seed)  # noqa: S311 - fault injection, not security
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    async def start(self) -> str:
+        """Start listening and return the webhook URL; port 0 picks a free port."""
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Stand-in webhook listening on {}", self.url)
+        return self.url
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None  # noqa: S101
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Closing the sockets ends each connection's read loop; wait_closed waits for them.
+            for writer in self._connections:
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as err:
+                    # A malformed request line or Content-Length; the rest of the stream cannot
+                    # be framed, so answer and hang up.
+                    logger.warning("Rejecting malformed request: {}", err)
+                    writer.write(_response(400, {}, b"malformed request", keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                status, headers, body = await self._handle(request)
+                writer.write(_response(status, headers, body, keep_alive=request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> _Request | None:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, path, version = request_line.decode("latin-1").split(" ", 2)
+        headers: dict[str, str] = {}
+        while (line := await reader.readuntil(_CRLF)) != _CRLF:
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", "0"))
+        if length < 0:
+            msg = f"negative Content-Length {length}"
+            raise ValueError(msg)
+        if length > self.max_body_bytes:
+            logger.warning("Dropping connection: request body of {} bytes exceeds {}", length, self.max_body_bytes)
+            return None
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version.strip() == "HTTP/1.1" or connection == "keep-alive")
+        return _Request(method.upper(), path, headers, body, keep_alive)
+
+    async def _handle(self, request: _Request) -> tuple[int, dict[str, str], bytes]:
+        if request.method == "GET":
+            if request.path.startswith("/stats"):
+                return 200, {"Content-Type": "application/json"}, json.dumps(self.stats.to_dict()).encode()
+            if request.path.startswith("/healthz"):
+                return 200, {}, b"ok"
+            return 404, {}, b""
+        if request.method != "POST":
+            return 404, {}, b""
+        return await self._receive(request)
+
+    async def _receive(self, request: _Request) -> tuple[int, dict[str, str], bytes]:
+        self.stats.requests += 1
+        self.stats.bytes_received += len(request.body)
+        faults = self.faults
+        if faults.latency or faults.jitter:
+            await asyncio.sleep(faults.latency + self._random.uniform(0, faults.jitter))
+        if faults.throttle_rate and self._random.random() < faults.throttle_rate:
+            self.stats.throttled += 1
+            headers = {"Retry-After": f"{faults.retry_after:g}"} if faults.retry_after is not None else {}
+            return 429, headers, b"throttled"
+        if faults.error_rate and self._random.random() < faults.error_rate:
+            self.stats.errors += 1
+            return 500, {}, b"injected error"
+
+        try:
+            events = decode_batch(
+                request.body,
+                request.headers.get("content-encoding"),
+                request.headers.get("content-type", "application/json"),
+                max_bytes=self.max_body_bytes,
+            )
+        except BatchDecodeError as err:
+            self.stats.rejected += 1
+            return 400, {}, str(err).encode()
+        for event in events:
+            if (error := payload_error(event)) is not None:
+                self.stats.rejected += 1
+                return 400, {}, f"Invalid event payload: {error}".encode()
+        self.stats.events += len(events)
+        self.stats.batches += len(events) > 1
+        self.received.extend(events)
+        return 200, {}, b"success"
+
+
+def _response(status: int, headers: dict[str, str], body: bytes, *, keep_alive: bool) -> bytes:
+    head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}", f"Content-Length: {len(body)}"]
+    head.extend(f"{key}: {value}" for key, value in headers.items())
+    head.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def run_standin(
+    host: str = "127.0.0.1", port: int = 12000, faults: Faults | None = None, seed: int | None = None
+) -> None:
+    """Serve a stand-in webhook until interrupted."""
+
+    async def serve() -> None:
+        await StandInWebhook(host, port, faults, seed=seed).serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
@@ -0,0 +1,226 @@
+"""Minimal asyncio HTTP/1.1 client with per-origin keep-alive connection pooling."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from metaflow_argo_events.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = get_logger("transport")
+
+_CRLF = b"\r\n"
+
+
+class TransportError(OSError):
+    """Raised when a request cannot be completed at the connection level."""
+
+
+@dataclass(frozen=True, slots=True)
+class Origin:
+    scheme: str
+    host: str
+    port: int
+
+    @classmethod
+    def from_url(cls, url: str) -> Origin:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            msg = f"Unsupported webhook URL: {url}"
+            raise TransportError(msg)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return cls(parts.scheme, parts.hostname, port)
+
+    @property
+    def host_header(self) -> str:
+        default_port = 443 if self.scheme == "https" else 80
+        return self.host if self.port == default_port else f"{self.host}:{self.port}"
+
+
+@dataclass(frozen=True, slots=True)
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300  # noqa: PLR2004
+
+
+@dataclass(slots=True)
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+    def close(self) -> None:
+        self.writer.close()
+
+    @property
+    def is_usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+
+@dataclass
+class _OriginPool:
+    limit: asyncio.Semaphore
+    idle: deque[_Connection] = field(default_factory=deque)
+
+
+class ConnectionPool:
+    """
+    Keep-alive connection pool shared by all requests to the same origin.
+
+    At most ``max_connections_per_origin`` sockets are open per scheme/host/port; idle
+    sockets are reused in LIFO order so that warm connections are preferred.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_origin: int = 32,
+        connect_timeout: float = 10.0,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.max_connections_per_origin = max_connections_per_origin
+        self.connect_timeout = connect_timeout
+        self._ssl_context = ssl_context
+        self._pools: dict[Origin, _OriginPool] = {}
+        self._closed = False
+
+    def _pool_for(self, origin: Origin) -> _OriginPool:
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = _OriginPool(limit=asyncio.Semaphore(self.max_connections_per_origin))
+            self._pools[origin] = pool
+        return pool
+
+    async def _open(self, origin: Origin) -> _Connection:
+        ssl_arg: ssl.SSLContext | None = None
+        if origin.scheme == "https":
+            ssl_arg = self._ssl_context or ssl.create_default_context()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(origin.host, origin.port, ssl=ssl_arg),
+                timeout=self.connect_timeout,
+            )
+        except (OSError, TimeoutError) as err:
+            msg = f"Unable to connect to {origin.host_header}: {err}"
+            raise TransportError(msg) from err
+        logger.debug("Opened connection to {}", origin.host_header)
+        return _Connection(reader, writer)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        body: bytes = b"",
+        timeout: float = 60.0,  # noqa: ASYNC109
+    ) -> HttpResponse:
+        if self._closed:
+            msg = "Connection pool is closed"
+            raise TransportError(msg)
+        origin = Origin.from_url(url)
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        head = [f"{method} {target} HTTP/1.1", f"Host: {origin.host_header}", f"Content-Length: {len(body)}"]
+        head.extend(f"{key}: {value}" for key, value in (headers or {}).items())
+        request = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        pool = self._pool_for(origin)
+        async with pool.limit:
+            # A pooled socket may have been closed by the server while idle; retry once on a fresh one.
+            for attempt in range(2):
+                reused = bool(pool.idle)
+                conn = pool.idle.pop() if reused else await self._open(origin)
+                if not conn.is_usable:
+                    conn.close()
+                    conn = await self._open(origin)
+                    reused = False
+                try:
+                    response, keep_alive = await asyncio.wait_for(
+                        self._exchange(conn, request, head_only=method == "HEAD"), timeout=timeout
+                    )
+                except (OSError, asyncio.IncompleteReadError, TimeoutError) as err:
+                    conn.close()
+                    if reused and attempt == 0 and not isinstance(err, TimeoutError):
+                        continue
+                    msg = f"Request to {origin.host_header} failed: {err or type(err).__name__}"
+                    raise TransportError(msg) from err
+                if keep_alive and not self._closed:
+                    pool.idle.append(conn)
+                else:
+                    conn.close()
+                return response
+        msg = f"Request to {origin.host_header} failed"  # pragma: no cover
+        raise TransportError(msg)  # pragma: no cover
+
+    @staticmethod
+    async def _exchange(conn: _Connection, request: bytes, *, head_only: bool) -> tuple[HttpResponse, bool]:
+        conn.writer.write(request)
+        await conn.writer.drain()
+
+        status_line = await conn.reader.readuntil(_CRLF)
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        response_headers: dict[str, str] = {}
+        while True:
+            line = await conn.reader.readuntil(_CRLF)
+            if line == _CRLF:
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        keep_alive = version == "HTTP/1.1"
+        connection_header = response_headers.get("connection", "").lower()
+        if connection_header == "close":
+            keep_alive = False
+        elif connection_header == "keep-alive":
+            keep_alive = True
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = await _read_chunked(conn.reader)
+        elif "content-length" in response_headers:
+            payload = await conn.reader.readexactly(int(response_headers["content-length"]))
+        elif head_only or int(status) in {204, 304}:
+            payload = b""
+        else:
+            payload = await conn.reader.read()
+            keep_alive = False
+        return HttpResponse(int(status), response_headers, payload), keep_alive
+
+    @property
+    def idle_connections(self) -> int:
+        return sum(len(pool.idle) for pool in self._pools.values())
+
+    async def close(self) -> None:
+        self._closed = True
+        for pool in self._pools.values():
+            while pool.idle:
+                pool.idle.pop().close()
+        self._pools.clear()
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size_line = await reader.readuntil(_CRLF)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Skip optional trailers.
+            while await reader.readuntil(_CRLF) != _CRLF:
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
@@ -0,0 +1,13 @@
+from metaflow_argo_events.schema.cache import CacheStats, SchemaCache
+from metaflow_argo_events.schema.extract import extract_flow_parameters, load_flow_module, parameter_response
+from metaflow_argo_events.schema.manifest import BuildManifest, local_dependencies
+
+__all__ = [
+    "BuildManifest",
+    "CacheStats",
+    "extract_flow_parameters",
+    "load_flow_module",
+    "local_dependencies",
+    "parameter_response",
+    "SchemaCache",
+]
@@ -0,0 +1,208 @@
+"""
+Persistent cache of extracted flow parameter schemas.
+
+Entries are keyed by the SHA-256 of the flow file (and of the local modules it imports) together
+with the installed Metaflow version and this package's version, so a cache hit never needs to
+import Metaflow or the flow itself.
+The cache is bounded in bytes; the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.metadata
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from metaflow_argo_events import __version__
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.parameters import FlowParameters
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger("schema.cache")
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("METAFLOW_EVENTS_CACHE_DIR", Path.home() / ".cache" / "metaflow-events" / "schemas")
+)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".schema.json"
+_STATS_FILE = "stats.json"
+FLOWS_ADAPTER: TypeAdapter[list[FlowParameters]] = TypeAdapter(list[FlowParameters])
+
+
+def metaflow_version() -> str:
+    try:
+        return importlib.metadata.version("metaflow")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def hash_file(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evictions": self.evictions}
+
+
+class SchemaCache:
+    def __init__(self, directory: str | Path = DEFAULT_CACHE_DIR, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def key_for(self, flow_file: str | Path) -> str:
+        from metaflow_argo_events.schema.manifest import local_dependencies
+
+        # Sibling modules the flow imports shape its parameters as much as the flow file does.
+        sources = "|".join(hash_file(path) for path in [flow_file, *local_dependencies(flow_file)])
+        parts = f"{sources}|metaflow={metaflow_version()}|metaflow-argo-events={__version__}"
+        return hashlib.sha256(parts.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> list[FlowParameters] | None:
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+            flows = FLOWS_ADAPTER.validate_json(data)
+        except FileNotFoundError:
+            flows = None
+        except ValueError:
+            logger.warning("Discarding unreadable schema cache entry {}", path.name)
+            path.unlink(missing_ok=True)
+            flows = None
+        with self._lock:
+            if flows is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        # Touch the entry so eviction sees it as recently used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return flows
+
+    def put(self, key: str, flows: list[FlowParameters]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(FLOWS_ADAPTER.dump_json(flows))
+        tmp.replace(path)
+        with self._lock:
+            self.stats.stores += 1
+        self.evict()
+
+    def get_or_extract(
+        self,
+        flow_file: str | Path,
+        extract: Callable[[Path], list[FlowParameters]] | None = None,
+    ) -> list[FlowParameters]:
+        """Return cached parameters for ``flow_file``, importing the flow only on a miss."""
+        key = self.key_for(flow_file)
+        flows = self.get(key)
+        if flows is None:
+            if extract is None:
+                from metaflow_argo_events.schema.extract import extract_flow_parameters
+
+                extract = extract_flow_parameters
+            flows = extract(Path(flow_file))
+            self.put(key, flows)
+        return flows
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        if not self.directory.is_dir():
+            return []
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(_ENTRY_SUFFIX)]
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                Path(path).unlink()
+            total -= size
+            evicted += 1
+        with self._lock:
+            self.stats.evictions += evicted
+        return evicted
+
+    def clear(self) -> int:
+        removed = 0
+        for entry in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                Path(entry.path).unlink()
+                removed += 1
+        (self.directory / _STATS_FILE).unlink(missing_ok=True)
+        return removed
+
+    def _stats_path(self) -> Path:
+        return self.directory / _STATS_FILE
+
+    def persisted_stats(self) -> CacheStats:
+        """Counters accumulated by every process that called ``save_stats``."""
+        try:
+            return CacheStats(**json.loads(self._stats_path().read_text()))
+        except (FileNotFoundError, ValueError, TypeError):
+            return CacheStats()
+
+    def save_stats(self) -> None:
+        """Fold this instance's counters into the persisted totals."""
+        with self._lock:
+            current, self.stats = self.stats, CacheStats()
+        if current == CacheStats():
+            return
+        totals = self.persisted_stats()
+        for name, value in current.to_dict().items():
+            setattr(totals, name, getattr(totals, name) + value)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._stats_path().with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(totals.to_dict()))
+        tmp.replace(self._stats_path())
+
+    def summary(self) -> dict[str, Any]:
+        entries = self._entries()
+        totals = self.persisted_stats()
+        for name, value in self.stats.to_dict().items():
+            setattr(totals, name, getattr(totals, name) + value)
+        lookups = totals.hits + totals.misses
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "size_bytes": sum(entry.stat().st_size for entry in entries),
+            "max_bytes": self.max_bytes,
+            **totals.to_dict(),
+            "hit_rate": round(totals.hits / lookups, 4) if lookups else None,
+        }
@@ -0,0 +1,280 @@
+"""
+Client library generation with ``openapi-generator-cli``.
+
+Every invocation of the generator starts a JVM, which costs far more than generating a typical
+client. All targets that need work are therefore written as configs for the generator's
+``batch`` mode and generated by a single invocation, with ``--threads`` bounding how many run in
+parallel. Each output is keyed by the SHA-256 of its spec, the generator version and the
+language. Generated trees are kept in a cache directory under that key. An output directory
+records the key it was last written from, so regenerating an unchanged spec does nothing at all,
+and a spec that changes back is restored from the cache without running the generator.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events.exceptions import SchemaError
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.schema.cache import hash_file
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+logger = get_logger("schema.clients")
+
+DEFAULT_CLIENT_CACHE_DIR = Path(
+    os.environ.get("METAFLOW_EVENTS_CLIENT_CACHE_DIR", Path.home() / ".cache" / "metaflow-events" / "clients")
+)
+GENERATOR_COMMANDS = ("openapi-generator-cli", "openapi-generator")
+STAMP_FILE = ".metaflow-events-client.json"
+# Written by the generator once a target is complete; a failed target may leave other files behind.
+COMPLETION_MARKER = Path(".openapi-generator", "FILES")
+_VERSIONS_FILE = "generator-versions.json"
+
+UNCHANGED = "unchanged"
+CACHED = "cached"
+GENERATED = "generated"
+FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class ClientTarget:
+    spec: Path
+    language: str
+    output_dir: Path
+
+
+@dataclass(frozen=True, slots=True)
+class ClientResult:
+    target: ClientTarget
+    key: str
+    status: str
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "spec": str(self.target.spec),
+            "language": self.target.language,
+            "output_dir": str(self.target.output_dir),
+            "key": self.key,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+def find_generator(command: str | None = None) -> list[str]:
+    """Split ``command``, or find the generator on ``PATH`` when it is not given."""
+    if command:
+        return shlex.split(command)
+    for name in GENERATOR_COMMANDS:
+        if path := shutil.which(name):
+            return [path]
+    raise SchemaError.generator_missing()
+
+
+def generator_version(command: Sequence[str]) -> str:
+    try:
+        completed = subprocess.run([*command, "version"], capture_output=True, text=True, check=True)  # noqa: S603
+    except (OSError, subprocess.CalledProcessError) as err:
+        detail = getattr(err, "stderr", None) or str(err)
+        raise SchemaError.generator_failed(detail.strip()) from err
+    lines = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
+    if not lines:
+        detail = "`version` printed nothing"
+        raise SchemaError.generator_failed(detail)
+    return lines[-1]
+
+
+def cached_generator_version(command: Sequence[str], cache_dir: Path) -> str:
+    """
+    Return ``generator_version(command)``, remembered in ``cache_dir`` per executable.
+
+    Asking the generator for its version starts a JVM too. The answer is reused for as long as
+    the executable keeps its path, size and modification time, which an upgrade changes.
+    """
+    executable = shutil.which(command[0]) or command[0]
+    try:
+        stat = Path(executable).stat()
+    except OSError:
+        return generator_version(command)
+    identity = f"{shlex.join([executable, *command[1:]])}:{stat.st_size}:{stat.st_mtime_ns}"
+    path = cache_dir / _VERSIONS_FILE
+    try:
+        versions = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        versions = {}
+    if not isinstance(versions, dict):
+        versions = {}
+    if identity not in versions:
+        versions[identity] = generator_version(command)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(versions, indent=2))
+        tmp.replace(path)
+    return str(versions[identity])
+
+
+def target_key(spec_digest: str, version: str, language: str) -> str:
+    return hashlib.sha256(f"{spec_digest}\0{version}\0{language}".encode()).hexdigest()
+
+
+def _read_stamp(output_dir: Path) -> str | None:
+    try:
+        key = json.loads((output_dir / STAMP_FILE).read_text()).get("key")
+    except (FileNotFoundError, ValueError, AttributeError):
+        return None
+    return key if isinstance(key, str) else None
+
+
+def _install(source: Path, target: ClientTarget, key: str, version: str) -> None:
+    # A directory carrying our stamp was written by us and is replaced wholesale, so files the
+    # generator no longer emits disappear; anything else is only written over.
+    if _read_stamp(target.output_dir) is not None:
+        shutil.rmtree(target.output_dir)
+    shutil.copytree(source, target.output_dir, dirs_exist_ok=True)
+    stamp = {"key": key, "spec": str(target.spec), "language": target.language, "generator_version": version}
+    (target.output_dir / STAMP_FILE).write_text(json.dumps(stamp, indent=2))
+
+
+def _run_batch(command: Sequence[str], jobs: int, configs: list[Path]) -> int:
+    argv = [*command, "batch", "--threads", str(jobs), *map(str, configs)]
+    logger.info("Generating {} clients in one generator run with {} threads", len(configs), jobs)
+    completed = subprocess.run(argv, capture_output=True, text=True, check=False)  # noqa: S603
+    if completed.returncode:
+        # Targets that did succeed are still used; the others are reported as failed.
+        logger.warning("Client generator exited with {}: {}", completed.returncode, completed.stderr[-2000:])
+    else:
+        logger.debug("Client generator output: {}", completed.stdout[-2000:])
+    return completed.returncode
+
+
+def _output_error(output: Path, *, batch_failed: bool) -> str | None:
+    if not output.is_dir() or not any(output.iterdir()):
+        return "the generator produced no output; its errors are in the log"
+    if batch_failed and not (output / COMPLETION_MARKER).is_file():
+        # After a failed run, only targets the generator finished are trusted.
+        return "the generator failed before finishing this client; its errors are in the log"
+    return None
+
+
+def _generate(
+    pending: dict[str, ClientTarget],
+    command: Sequence[str],
+    cache_dir: Path,
+    jobs: int,
+) -> dict[str, str | None]:
+    """Generate every pending key into ``cache_dir``; returns an error, or None, per key."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = {key: cache_dir / f"{key}.{os.getpid()}.tmp" for key in pending}
+    with tempfile.TemporaryDirectory(prefix="metaflow-events-clients-") as config_dir:
+        configs = []
+        for key, target in pending.items():
+            config = Path(config_dir, f"{key}.json")
+            config.write_text(
+                json.dumps(
+                    {
+                        "generatorName": target.language,
+                        "inputSpec": str(target.spec.resolve()),
+                        "outputDir": str(staging[key]),
+                    }
+                )
+            )
+            configs.append(config)
+        batch_failed = _run_batch(command, jobs, configs) != 0
+
+    errors: dict[str, str | None] = {}
+    for key in pending:
+        output = staging[key]
+        if error := _output_error(output, batch_failed=batch_failed):
+            errors[key] = error
+            shutil.rmtree(output, ignore_errors=True)
+            continue
+        try:
+            output.rename(cache_dir / key)
+        except OSError:
+            # Another process cached the same key first; its output is equivalent.
+            shutil.rmtree(output, ignore_errors=True)
+        errors[key] = None
+    return errors
+
+
+def _target_keys(targets: list[ClientTarget], version: str) -> list[str]:
+    digests: dict[Path, str] = {}
+    keys = []
+    for target in targets:
+        if target.spec not in digests:
+            if not target.spec.is_file():
+                msg = f"OpenAPI spec not found: {target.spec}"
+                raise SchemaError(msg)
+            digests[target.spec] = hash_file(target.spec)
+        keys.append(target_key(digests[target.spec], version, target.language))
+    return keys
+
+
+def generate_clients(
+    targets: Iterable[ClientTarget],
+    *,
+    command: Sequence[str],
+    cache_dir: str | os.PathLike[str] = DEFAULT_CLIENT_CACHE_DIR,
+    jobs: int = 4,
+    force: bool = False,
+) -> list[ClientResult]:
+    """
+    Bring every target's output directory up to date, running the generator at most once.
+
+    With ``force``, the stamps, the cache and the remembered generator version are ignored and
+    every target is regenerated.
+    """
+    cache_dir = Path(cache_dir)
+    targets = list(targets)
+    version = generator_version(command) if force else cached_generator_version(command, cache_dir)
+    keys = _target_keys(targets, version)
+    statuses: dict[int, str] = {}
+    pending: dict[str, ClientTarget] = {}
+    for index, (target, key) in enumerate(zip(targets, keys, strict=True)):
+        if force:
+            shutil.rmtree(cache_dir / key, ignore_errors=True)
+        elif _read_stamp(target.output_dir) == key:
+            statuses[index] = UNCHANGED
+            continue
+        elif (cache_dir / key).is_dir():
+            statuses[index] = CACHED
+            continue
+        # Targets that differ only in output directory share one generation.
+        pending.setdefault(key, target)
+
+    errors = _generate(pending, command, cache_dir, jobs) if pending else {}
+    results = []
+    for index, (target, key) in enumerate(zip(targets, keys, strict=True)):
+        status = statuses.get(index, GENERATED)
+        if error := errors.get(key):
+            results.append(ClientResult(target, key, FAILED, error))
+            continue
+        if status != UNCHANGED:
+            _install(cache_dir / key, target, key, version)
+        results.append(ClientResult(target, key, status))
+    return results
+
+
+def clear_client_cache(cache_dir: str | os.PathLike[str] = DEFAULT_CLIENT_CACHE_DIR) -> int:
+    """Remove every cached client tree and the remembered generator versions."""
+    cache_dir = Path(cache_dir)
+    if not cache_dir.is_dir():
+        return 0
+    removed = 0
+    for entry in cache_dir.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+            removed += 1
+    (cache_dir / _VERSIONS_FILE).unlink(missing_ok=True)
+    return removed
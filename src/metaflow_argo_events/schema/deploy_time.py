@@ -0,0 +1,182 @@
+"""
+Concurrent, memoized evaluation of Metaflow deploy-time parameter fields.
+
+A parameter whose default is a function gets a ``DeployTimeField`` that Metaflow evaluates
+once per deployed flow, one parameter after another. Flows in a monorepo often share the same
+helper (today's date, the git SHA, a config lookup), so deploying many of them repeats that
+work. ``DeployTimeResolver`` evaluates the fields on a thread pool and memoizes each result for
+the life of the resolver. By default results are keyed by function, flow and parameter name,
+since a function may read ``ctx.flow_name`` or ``ctx.parameter_name``. Sharing one result
+across flows is opt-in: mark a function that ignores its context with ``shared_deploy_time``,
+or pass ``scope="function"`` to key every result by function alone. Every field is then
+checked against its own parameter type.
+
+Fields are evaluated with a ``ParameterContext`` built for each field rather than Metaflow's
+process-wide context, which is only set inside the Metaflow CLI and is not thread-safe.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.parameters import DeployTimeFieldModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+logger = get_logger("schema.deploy_time")
+
+SCOPE_FUNCTION = "function"
+SCOPE_PARAMETER = "parameter"
+SCOPES = (SCOPE_PARAMETER, SCOPE_FUNCTION)
+_SHARED_ATTRIBUTE = "__metaflow_events_shared__"
+
+
+def shared_deploy_time[F: Callable[..., Any]](function: F) -> F:
+    """
+    Mark a deploy-time ``function`` whose result does not depend on its ``ParameterContext``.
+
+    One evaluation of a marked function then serves every flow and parameter that uses it.
+    """
+    setattr(function, _SHARED_ATTRIBUTE, True)
+    return function
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedField:
+    """
+    Outcome of one deploy-time field.
+
+    ``seconds`` is the time the deploy-time function ran; it is 0 for a ``cached`` field,
+    which reused the result of an earlier evaluation.
+    """
+
+    flow_name: str
+    field: DeployTimeFieldModel
+    value: Any = None
+    seconds: float = 0.0
+    cached: bool = False
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "flow_name": self.flow_name,
+            **self.field.model_dump(),
+            "value": self.value,
+            "seconds": round(self.seconds, 6),
+            "cached": self.cached,
+            "error": self.error,
+        }
+
+
+def _echo(*args: Any, **_: Any) -> None:
+    logger.info(" ".join(map(str, args)))
+
+
+def parameter_context(flow_name: str, parameter_name: str) -> Any:
+    """Build the ``ParameterContext`` passed to a deploy-time function outside of Metaflow's CLI."""
+    from metaflow.parameters import ParameterContext
+    from metaflow.util import get_username
+
+    values: dict[str, Any] = {
+        "flow_name": flow_name,
+        "user_name": get_username(),
+        "parameter_name": parameter_name,
+        "logger": _echo,
+        "ds_type": "local",
+        "configs": None,
+    }
+    # The set of fields differs between Metaflow versions.
+    context: Any = ParameterContext
+    return context(**{name: values.get(name) for name in ParameterContext._fields})
+
+
+class DeployTimeResolver:
+    """
+    Resolve ``metaflow.parameters.DeployTimeField`` values on up to ``max_workers`` threads.
+
+    One resolver should span a whole deploy session; results are reused across ``resolve``
+    calls until it is closed. ``scope="function"`` shares every function's result across flows
+    and parameters, which is only correct when none of them read their context.
+    """
+
+    def __init__(self, *, max_workers: int = 8, scope: str = SCOPE_PARAMETER) -> None:
+        if scope not in SCOPES:
+            msg = f"scope must be one of {', '.join(SCOPES)}"
+            raise ValueError(msg)
+        self.scope = scope
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deploy-time")
+        self._lock = threading.Lock()
+        self._memo: dict[Hashable, Future[tuple[Any, float]]] = {}
+        self.evaluations = 0
+        self.hits = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _key(self, flow_name: str, field: Any) -> Hashable:
+        function: Hashable = field.fun
+        if self.scope == SCOPE_FUNCTION or getattr(field.fun, _SHARED_ATTRIBUTE, False):
+            return function
+        return (function, flow_name, field.parameter_name)
+
+    def _submit(self, flow_name: str, field: Any) -> tuple[Future[tuple[Any, float]], bool]:
+        key = self._key(flow_name, field)
+        with self._lock:
+            future = self._memo.get(key)
+            if future is not None:
+                self.hits += 1
+                return future, True
+            future = self._memo[key] = self._pool.submit(_evaluate, flow_name, field)
+            self.evaluations += 1
+            return future, False
+
+    def resolve(self, fields: Iterable[tuple[str, Any]]) -> list[ResolvedField]:
+        """
+        Resolve ``(flow_name, DeployTimeField)`` pairs, returning results in input order.
+
+        Failures are reported on the field rather than raised, so one broken function does not
+        hide the results of the others.
+        """
+        submitted = [(flow_name, field, *self._submit(flow_name, field)) for flow_name, field in fields]
+        return [_result(flow_name, field, future, cached) for flow_name, field, future, cached in submitted]
+
+    def summary(self) -> dict[str, Any]:
+        return {"scope": self.scope, "evaluations": self.evaluations, "cache_hits": self.hits}
+
+
+def _evaluate(flow_name: str, field: Any) -> tuple[Any, float]:
+    context = parameter_context(flow_name, field.parameter_name)
+    started = time.perf_counter()
+    # Same calling convention as DeployTimeField.__call__: most functions only accept the context.
+    try:
+        value = field.fun(context, True)
+    except TypeError:
+        value = field.fun(context)
+    return value, time.perf_counter() - started
+
+
+def _result(flow_name: str, field: Any, future: Future[tuple[Any, float]], cached: bool) -> ResolvedField:
+    model = DeployTimeFieldModel(
+        parameter_name=field.parameter_name,
+        field=field.field,
+        print_representation=field.user_print_representation,
+    )
+    try:
+        raw, seconds = future.result()
+        # Type checks are per parameter, since a shared function can serve parameters of several types.
+        value = field._check_type(raw, True)  # noqa: SLF001
+    except Exception as err:  # noqa: BLE001 - deploy-time functions are user code
+        return ResolvedField(flow_name, model, cached=cached, error=f"{type(err).__name__}: {err}")
+    return ResolvedField(flow_name, model, value, 0.0 if cached else seconds, cached)
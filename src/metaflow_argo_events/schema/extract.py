@@ -0,0 +1,149 @@
+"""Extract ``FlowParameters`` from Metaflow flow files by importing them."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events.exceptions import SchemaError
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.models.parameters import DeployTimeFieldModel, FlowParameters, ParameterResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+    from metaflow import FlowSpec
+
+logger = get_logger("schema.extract")
+
+_TYPE_NAMES = {str: "str", int: "int", float: "float", bool: "bool"}
+
+
+@contextlib.contextmanager
+def _flow_import_path(flow_file: Path) -> Iterator[None]:
+    # Flow files routinely import sibling modules, exactly as `python flow.py run` would allow.
+    directory = str(flow_file.parent)
+    sys.path.insert(0, directory)
+    try:
+        yield
+    finally:
+        with contextlib.suppress(ValueError):
+            sys.path.remove(directory)
+
+
+def load_flow_module(flow_file: str | Path) -> ModuleType:
+    """Import ``flow_file`` under a unique module name without running its ``__main__`` block."""
+    path = Path(flow_file).resolve()
+    if not path.is_file():
+        raise SchemaError.flow_not_found(str(path))
+    digest = hashlib.sha1(str(path).encode(), usedforsecurity=False).hexdigest()[:12]
+    module_name = f"_metaflow_events_flow_{path.stem}_{digest}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise SchemaError.flow_not_found(str(path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        with _flow_import_path(path):
+            spec.loader.exec_module(module)
+    except Exception as err:
+        sys.modules.pop(module_name, None)
+        raise SchemaError.flow_import_failed(path.name, err) from err
+    return module
+
+
+def find_flow_classes(module: ModuleType) -> list[type[FlowSpec]]:
+    """Return the ``FlowSpec`` subclasses defined (not merely imported) in ``module``."""
+    from metaflow import FlowSpec
+
+    return [
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, FlowSpec)
+        and obj is not FlowSpec
+        and obj.__module__ == module.__name__
+    ]
+
+
+def _initialized_kwargs(parameter: Any) -> dict[str, Any]:
+    init = getattr(parameter, "init", None)
+    if callable(init):
+        # Metaflow >= 2.13 resolves config-dependent kwargs lazily in `init`.
+        try:
+            init(ignore_errors=True)
+        except TypeError:
+            init()
+    return dict(parameter.kwargs)
+
+
+def parameter_response(parameter: Any) -> ParameterResponse:
+    """Convert a ``metaflow.Parameter`` into a ``ParameterResponse``."""
+    from metaflow.parameters import DeployTimeField, JSONTypeClass
+
+    kwargs = _initialized_kwargs(parameter)
+    param_type = kwargs.get("type", str)
+    if isinstance(param_type, JSONTypeClass):
+        type_name = "json"
+    else:
+        type_name = _TYPE_NAMES.get(param_type, getattr(param_type, "__name__", str(param_type)))
+
+    additional: dict[str, Any] = {}
+    default = kwargs.get("default")
+    if isinstance(default, DeployTimeField):
+        additional["deploy_time_field"] = DeployTimeFieldModel(
+            parameter_name=default.parameter_name,
+            field=default.field,
+            print_representation=default.user_print_representation,
+        ).model_dump()
+        default = None
+
+    return ParameterResponse(
+        name=parameter.name,
+        type=type_name,
+        help=kwargs.get("help"),
+        default=default,
+        required=bool(kwargs.get("required", False)),
+        show_default=bool(kwargs.get("show_default", True)),
+        is_string_type=bool(parameter.is_string_type),
+        separator=getattr(parameter, "separator", None),
+        additional_properties=additional or None,
+    )
+
+
+def deploy_time_fields(flow_class: type[FlowSpec]) -> list[Any]:
+    """Return the ``metaflow.parameters.DeployTimeField`` defaults of ``flow_class``'s parameters."""
+    from metaflow.parameters import DeployTimeField
+
+    fields = []
+    for _, parameter in flow_class._get_parameters():  # noqa: SLF001
+        if getattr(parameter, "IS_CONFIG_PARAMETER", False):
+            continue
+        default = _initialized_kwargs(parameter).get("default")
+        if isinstance(default, DeployTimeField):
+            fields.append(default)
+    return fields
+
+
+def flow_parameters(flow_class: type[FlowSpec]) -> FlowParameters:
+    parameters = [
+        parameter_response(parameter)
+        for _, parameter in flow_class._get_parameters()  # noqa: SLF001
+        if not getattr(parameter, "IS_CONFIG_PARAMETER", False)
+    ]
+    return FlowParameters(flow_name=flow_class.__name__, parameters=parameters)
+
+
+def extract_flow_parameters(flow_file: str | Path) -> list[FlowParameters]:
+    """Import ``flow_file`` and return the parameters of every flow it defines."""
+    module = load_flow_module(flow_file)
+    flows = find_flow_classes(module)
+    if not flows:
+        raise SchemaError.no_flows(str(flow_file))
+    logger.debug("Extracted {} flows from {}", len(flows), flow_file)
+    return [flow_parameters(flow) for flow in flows]
@@ -0,0 +1,155 @@
+"""
+Discover flow files and extract their parameters in parallel.
+
+Every flow file is imported in its own freshly spawned interpreter (one task per worker
+process), so flows that define modules, globals or Metaflow decorators with the same names
+cannot interfere with each other. Results are always returned in the order of the input files,
+independent of which worker finishes first.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from metaflow_argo_events.exceptions import SchemaError
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.schema.cache import FLOWS_ADAPTER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from metaflow_argo_events.models.parameters import FlowParameters
+    from metaflow_argo_events.schema.cache import SchemaCache
+
+logger = get_logger("schema.generate")
+
+_SKIP_DIRECTORIES = frozenset({".git", ".hg", ".tox", ".nox", ".venv", "venv", "__pycache__", "node_modules"})
+_FLOW_MARKER = b"FlowSpec"
+
+
+@dataclass
+class ExtractionResult:
+    flow_file: Path
+    flows: list[FlowParameters] = field(default_factory=list)
+    error: str | None = None
+    cached: bool = False
+
+
+def discover_flow_files(paths: Iterable[str | Path]) -> list[Path]:
+    """
+    Expand ``paths`` into the sorted list of Python files that mention ``FlowSpec``.
+
+    Directories are walked recursively, skipping VCS metadata and virtual environments; the
+    text check is a cheap filter that avoids spawning an interpreter for unrelated modules.
+    Files that cannot be read, such as broken symlinks, are skipped with a warning.
+    """
+    found: set[Path] = set()
+    for entry in map(Path, paths):
+        if entry.is_file():
+            found.add(entry.resolve())
+            continue
+        for root, directories, files in os.walk(entry):
+            directories[:] = [name for name in directories if name not in _SKIP_DIRECTORIES]
+            for name in files:
+                if not name.endswith(".py"):
+                    continue
+                path = Path(root, name)
+                try:
+                    source = path.read_bytes()
+                except OSError as err:
+                    logger.warning("Skipping unreadable file {}: {}", path, err)
+                    continue
+                if _FLOW_MARKER in source:
+                    found.add(path.resolve())
+    return sorted(found)
+
+
+def _extract_in_worker(flow_file: str) -> tuple[bytes | None, str | None]:
+    # Runs in a spawned interpreter. Results cross the process boundary as JSON so that
+    # nothing from the flow module itself has to be pickled.
+    from metaflow_argo_events.schema.extract import extract_flow_parameters
+
+    try:
+        flows = extract_flow_parameters(flow_file)
+    except SchemaError as err:
+        return None, "; ".join([err.message, *err.errors])
+    except Exception as err:  # noqa: BLE001
+        return None, f"{type(err).__name__}: {err}"
+    return FLOWS_ADAPTER.dump_json(flows), None
+
+
+def extract_many(
+    flow_files: Iterable[Path],
+    *,
+    jobs: int | None = None,
+    cache: SchemaCache | None = None,
+    refresh: bool = False,
+) -> list[ExtractionResult]:
+    """
+    Extract parameters for every file in ``flow_files`` using up to ``jobs`` worker processes.
+
+    Files with a cache hit are answered without spawning a worker. With ``refresh``, every file
+    is extracted again and its cache entry replaced. The returned list follows the order of
+    ``flow_files``.
+    """
+    results = {path: ExtractionResult(path) for path in flow_files}
+    keys: dict[Path, str] = {}
+    pending: list[Path] = []
+    for path, result in results.items():
+        if cache is not None:
+            keys[path] = cache.key_for(path)
+            flows = None if refresh else cache.get(keys[path])
+            if flows is not None:
+                result.flows, result.cached = flows, True
+                continue
+        pending.append(path)
+
+    if pending:
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        logger.info("Extracting {} flow files with {} workers", len(pending), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        ) as pool:
+            futures = {pool.submit(_extract_in_worker, str(path)): path for path in pending}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    data, error = future.result()
+                except Exception as err:  # noqa: BLE001
+                    data, error = None, f"Worker failed: {type(err).__name__}: {err}"
+                result = results[path]
+                if data is None:
+                    result.error = error
+                    continue
+                result.flows = FLOWS_ADAPTER.validate_json(data)
+                if cache is not None:
+                    cache.put(keys[path], result.flows)
+    return list(results.values())
+
+
+def ordered_flows(results: Iterable[ExtractionResult]) -> list[FlowParameters]:
+    """
+    Flatten ``results`` into a deterministic flow list, rejecting duplicate flow names.
+
+    Flows are ordered by file, then by flow name within a file.
+    """
+    flows: list[FlowParameters] = []
+    owners: dict[str, Path] = {}
+    duplicates: list[str] = []
+    for result in results:
+        for flow in sorted(result.flows, key=lambda flow: flow.flow_name):
+            if flow.flow_name in owners:
+                duplicates.append(f"{flow.flow_name}: {owners[flow.flow_name]} and {result.flow_file}")
+                continue
+            owners[flow.flow_name] = result.flow_file
+            flows.append(flow)
+    if duplicates:
+        raise SchemaError.duplicate_flows(duplicates)
+    return flows
@@ -0,0 +1,225 @@
+"""
+Build manifest for incremental OpenAPI generation.
+
+For every flow file the manifest records the hash of its inputs (the flow source together with
+every local module it imports, transitively) and the hash of each generated flow fragment. A later
+run only re-extracts files whose inputs changed or whose previous output no longer matches, and
+reuses every other fragment from the existing output.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events import __version__
+from metaflow_argo_events.logger import get_logger
+from metaflow_argo_events.schema.cache import hash_file, metaflow_version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = get_logger("schema.manifest")
+
+MANIFEST_VERSION = 1
+
+
+def _resolve_module(base: Path, parts: list[str]) -> list[Path]:
+    # Every package along a dotted import is executed, so each `__init__.py` is an input too.
+    found: list[Path] = []
+    for depth in range(1, len(parts) + 1):
+        stem = base.joinpath(*parts[:depth])
+        candidate = next((path for path in (stem / "__init__.py", stem.with_suffix(".py")) if path.is_file()), None)
+        if candidate is None:
+            break
+        found.append(candidate)
+    return found
+
+
+def _imported_files(source: Path, root: Path) -> set[Path]:
+    try:
+        tree = ast.parse(source.read_bytes(), filename=str(source))
+    except (SyntaxError, ValueError):
+        return set()
+    found: set[Path] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                found.update(_resolve_module(root, alias.name.split(".")))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = source.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+                init = base / "__init__.py"
+                if init.is_file():
+                    found.add(init)
+            else:
+                base = root
+            module = node.module.split(".") if node.module else []
+            found.update(_resolve_module(base, module))
+            # `from package import name` may import a submodule rather than an attribute.
+            for alias in node.names:
+                found.update(_resolve_module(base, [*module, alias.name]))
+    return found
+
+
+def local_dependencies(flow_file: str | Path) -> list[Path]:
+    """
+    Return the local modules ``flow_file`` imports, directly or through other local modules.
+
+    Imports are found statically and resolved the way ``load_flow_module`` would see them: relative
+    to the flow's own directory. Anything that does not resolve to a file there (the standard
+    library, installed packages) is not an input of the flow file.
+    """
+    flow_file = Path(flow_file).resolve()
+    root = flow_file.parent
+    seen: set[Path] = {flow_file}
+    pending = [flow_file]
+    while pending:
+        for path in _imported_files(pending.pop(), root):
+            resolved = path.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                pending.append(resolved)
+    seen.discard(flow_file)
+    return sorted(seen)
+
+
+def fragment_hash(fragment: Mapping[str, Any]) -> str:
+    canonical = json.dumps(fragment, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def build_environment() -> dict[str, str]:
+    """Versions that shape every fragment; a change invalidates the whole manifest."""
+    return {"metaflow": metaflow_version(), "metaflow-argo-events": __version__}
+
+
+@dataclass
+class FileRecord:
+    input_hash: str
+    inputs: dict[str, str] = field(default_factory=dict)
+    flows: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"input_hash": self.input_hash, "inputs": self.inputs, "flows": self.flows}
+
+
+@dataclass
+class BuildManifest:
+    path: Path
+    environment: dict[str, str] = field(default_factory=dict)
+    files: dict[str, FileRecord] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | Path) -> BuildManifest:
+        """Read the manifest at ``path``; a missing or unreadable manifest is an empty one."""
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != MANIFEST_VERSION:
+                return cls(path)
+            files = {key: FileRecord(**record) for key, record in data["files"].items()}
+            return cls(path, environment=dict(data["environment"]), files=files)
+        except FileNotFoundError:
+            return cls(path)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Ignoring unreadable build manifest {}", path)
+            return cls(path)
+
+    def save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "environment": self.environment,
+            "files": {key: self.files[key].to_dict() for key in sorted(self.files)},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
+        tmp.replace(self.path)
+
+    def key_for(self, path: str | Path) -> str:
+        """Manifest paths are relative to the manifest so that a checkout can be moved."""
+        return Path(os.path.relpath(Path(path).resolve(), self.path.parent.resolve())).as_posix()
+
+    def hash_inputs(self, flow_file: Path) -> FileRecord:
+        """Hash the current inputs of ``flow_file`` into a record that has no flows yet."""
+        inputs = {self.key_for(path): hash_file(path) for path in [flow_file, *local_dependencies(flow_file)]}
+        digest = hashlib.sha256()
+        for key in sorted(inputs):
+            digest.update(f"{key}\0{inputs[key]}\n".encode())
+        return FileRecord(input_hash=digest.hexdigest(), inputs=inputs)
+
+
+def rebuild_reason(
+    key: str,
+    current: FileRecord,
+    previous: FileRecord | None,
+    outputs: Iterable[Mapping[str, Mapping[str, Any]]],
+) -> str | None:
+    """
+    Explain why the flow file ``key`` has to be rebuilt, or return ``None`` to reuse its output.
+
+    ``outputs`` holds the fragments found in each existing output, keyed by flow name; the file
+    is only reused if every one of them still contains exactly what the manifest recorded.
+    """
+    if previous is None:
+        return "new file"
+    if previous.input_hash != current.input_hash:
+        if previous.inputs.get(key) != current.inputs.get(key):
+            return "source changed"
+        changed = sorted(
+            name
+            for name in previous.inputs.keys() | current.inputs.keys()
+            if name != key and previous.inputs.get(name) != current.inputs.get(name)
+        )
+        return f"dependency changed: {', '.join(changed)}"
+    for fragments in outputs:
+        for flow_name, digest in previous.flows.items():
+            fragment = fragments.get(flow_name)
+            if fragment is None:
+                return f"output missing for {flow_name}"
+            if fragment_hash(fragment) != digest:
+                return f"output modified for {flow_name}"
+    return None
+
+
+@dataclass
+class RebuildPlan:
+    records: dict[Path, FileRecord]
+    reasons: dict[Path, str]
+    removed: dict[str, FileRecord]
+
+
+def plan_rebuild(
+    manifest: BuildManifest,
+    flow_files: Iterable[Path],
+    outputs: Iterable[Mapping[str, Mapping[str, Any]]],
+    *,
+    force: bool = False,
+) -> RebuildPlan:
+    """Hash the inputs of ``flow_files`` and decide which of them must be extracted again."""
+    outputs = list(outputs)
+    environment_changed = manifest.environment != build_environment()
+    plan = RebuildPlan(records={}, reasons={}, removed={})
+    for flow_file in flow_files:
+        key = manifest.key_for(flow_file)
+        plan.records[flow_file] = current = manifest.hash_inputs(flow_file)
+        previous = manifest.files.get(key)
+        if force:
+            reason: str | None = "forced"
+        elif environment_changed and previous is not None:
+            reason = "environment changed"
+        else:
+            reason = rebuild_reason(key, current, previous, outputs)
+        if reason is not None:
+            plan.reasons[flow_file] = reason
+    current_keys = {manifest.key_for(path) for path in plan.records}
+    plan.removed = {key: record for key, record in manifest.files.items() if key not in current_keys}
+    return plan
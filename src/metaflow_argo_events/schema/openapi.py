@@ -0,0 +1,162 @@
+"""Build OpenAPI 3.1 documents describing the events that trigger Metaflow flows."""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import json
+from typing import TYPE_CHECKING, Any
+
+from metaflow_argo_events import __version__
+from metaflow_argo_events.models.argo_events import PublishResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from metaflow_argo_events.models.parameters import FlowParameters, ParameterResponse
+
+OPENAPI_VERSION = "3.1.0"
+DEFAULT_TITLE = "Metaflow Argo Events"
+
+_JSON_TYPES: dict[str, dict[str, Any]] = {
+    "str": {"type": "string"},
+    "int": {"type": "integer"},
+    "float": {"type": "number"},
+    "bool": {"type": "boolean"},
+    "json": {"type": ["object", "array"]},
+}
+
+
+def parameter_schema(parameter: ParameterResponse) -> dict[str, Any]:
+    schema = dict(_JSON_TYPES.get(parameter.type, {"type": "string"}))
+    if parameter.help:
+        schema["description"] = parameter.help
+    if parameter.default is not None and parameter.show_default:
+        schema["default"] = parameter.default
+        if parameter.type == "json" and isinstance(parameter.default, str):
+            with contextlib.suppress(ValueError):
+                schema["default"] = json.loads(parameter.default)
+    if parameter.separator:
+        schema["x-separator"] = parameter.separator
+    if parameter.additional_properties and "deploy_time_field" in parameter.additional_properties:
+        schema["x-deploy-time-field"] = parameter.additional_properties["deploy_time_field"]
+    return schema
+
+
+def parameters_component(flow: FlowParameters) -> dict[str, Any]:
+    component: dict[str, Any] = {
+        "title": f"{flow.flow_name} Parameters",
+        "type": "object",
+        "properties": {parameter.name: parameter_schema(parameter) for parameter in flow.parameters},
+        "additionalProperties": True,
+    }
+    required = [parameter.name for parameter in flow.parameters if parameter.required and parameter.default is None]
+    if required:
+        component["required"] = required
+    return component
+
+
+def flow_operation(flow: FlowParameters) -> dict[str, Any]:
+    return {
+        "post": {
+            "operationId": f"trigger{flow.flow_name}",
+            "summary": f"Publish an event that triggers {flow.flow_name}",
+            "tags": [flow.flow_name],
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "required": ["name", "payload"],
+                            "properties": {
+                                "name": {"type": "string", "description": "Event name the flow is triggered by"},
+                                "payload": {"$ref": f"#/components/schemas/{component_name(flow.flow_name)}"},
+                            },
+                        }
+                    }
+                },
+            },
+            "responses": {
+                "200": {
+                    "description": "Event accepted",
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/PublishResult"}}},
+                }
+            },
+        }
+    }
+
+
+def flow_path(flow: FlowParameters) -> str:
+    return f"/flows/{flow.flow_name}/events"
+
+
+def component_name(flow_name: str) -> str:
+    return f"{flow_name}Parameters"
+
+
+def flow_fragment(flow: FlowParameters) -> dict[str, Any]:
+    """Return the parts of a spec that belong to ``flow``: its path item and parameters schema."""
+    return {
+        "flow_name": flow.flow_name,
+        "path": flow_path(flow),
+        "operation": flow_operation(flow),
+        "schema_name": component_name(flow.flow_name),
+        "schema": parameters_component(flow),
+    }
+
+
+def spec_fragments(spec: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Recover the per-flow fragments of a previously generated ``spec``, keyed by flow name."""
+    fragments: dict[str, dict[str, Any]] = {}
+    schemas = spec.get("components", {}).get("schemas", {})
+    for path, operation in spec.get("paths", {}).items():
+        prefix, _, rest = path.partition("/flows/")
+        flow_name, _, suffix = rest.partition("/")
+        if prefix or suffix != "events" or component_name(flow_name) not in schemas:
+            continue
+        fragments[flow_name] = {
+            "flow_name": flow_name,
+            "path": path,
+            "operation": operation,
+            "schema_name": component_name(flow_name),
+            "schema": schemas[component_name(flow_name)],
+        }
+    return fragments
+
+
+def patch_openapi_spec(spec: dict[str, Any], fragments: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Return ``spec`` with its flow paths and schemas replaced by ``fragments``, in the order given.
+
+    Anything in ``spec`` that does not belong to a flow (``info``, shared schemas, extensions)
+    is kept as is.
+    """
+    previous = spec_fragments(spec)
+    stale_paths = {fragment["path"] for fragment in previous.values()}
+    stale_schemas = {fragment["schema_name"] for fragment in previous.values()}
+    paths = {path: item for path, item in spec.get("paths", {}).items() if path not in stale_paths}
+    components = dict(spec.get("components", {}))
+    schemas = {name: item for name, item in components.get("schemas", {}).items() if name not in stale_schemas}
+    for fragment in fragments:
+        paths[fragment["path"]] = fragment["operation"]
+        schemas[fragment["schema_name"]] = fragment["schema"]
+    components["schemas"] = schemas
+    return {**spec, "paths": paths, "components": components}
+
+
+def build_openapi_spec(
+    flows: Iterable[FlowParameters],
+    *,
+    title: str = DEFAULT_TITLE,
+    version: str = __version__,
+) -> dict[str, Any]:
+    """Build one OpenAPI document covering ``flows``, in the order given."""
+    result_schema = copy.deepcopy(PublishResult.model_json_schema())
+    spec: dict[str, Any] = {
+        "openapi": OPENAPI_VERSION,
+        "info": {"title": title, "version": version},
+        "paths": {},
+        "components": {"schemas": {"PublishResult": result_schema}},
+    }
+    return patch_openapi_spec(spec, map(flow_fragment, flows))
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from metaflow_argo_events.models import CreateArgoEventInput, PublishResult
+from metaflow_argo_events.publish import EventPublisher
+from metaflow_argo_events.publish.batch import (
+    BATCH_CONTENT_TYPE,
+    BatchDecodeError,
+    BatchSettings,
+    decode_batch,
+    encode_batch,
+)
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.standin import StandInStats, StandInWebhook
+
+EVENTS = [{"name": "batched", "payload": {"id": f"id-{i}", "note": "é\n"}} for i in range(20)]
+BODIES = [json.dumps(event).encode() for event in EVENTS]
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "identity", "zstd"])
+def test_envelope_round_trip(encoding: str) -> None:
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    envelope = encode_batch(BODIES, encoding)
+    assert decode_batch(envelope, encoding, BATCH_CONTENT_TYPE) == EVENTS
+
+
+def test_single_events_decode_as_a_batch_of_one() -> None:
+    assert decode_batch(gzip.compress(BODIES[0]), "gzip", "application/json; charset=utf-8") == EVENTS[:1]
+
+
+@pytest.mark.parametrize(
+    ("body", "encoding", "error"),
+    [
+        (b"not gzip", "gzip", "Corrupt gzip body"),
+        (encode_batch(BODIES, "gzip"), "br", "Unsupported Content-Encoding"),
+        (encode_batch([b"[1]"], "identity"), "identity", "must be a JSON object"),
+        (gzip.compress(b" " * 2048), "gzip", "exceeds 1024 bytes"),
+    ],
+)
+def test_bad_envelopes_are_rejected(body: bytes, encoding: str, error: str) -> None:
+    with pytest.raises(BatchDecodeError, match=error):
+        decode_batch(body, encoding, BATCH_CONTENT_TYPE, max_bytes=1024)
+
+
+def test_publisher_flushes_on_max_events_and_on_close() -> None:
+    async def run() -> tuple[list[PublishResult], StandInStats]:
+        settings = BatchSettings(max_events=10, max_linger=60, compression="gzip")
+        async with StandInWebhook() as webhook:
+            async with EventPublisher(batch=settings, breaker=CircuitBreaker(), history=None) as publisher:
+                events = [
+                    CreateArgoEventInput(name="batched", payload={"i": str(i)}, url=webhook.url, force=True)
+                    for i in range(25)
+                ]
+                results = await asyncio.gather(*(publisher.publish(event) for event in events[:20]))
+                pending = asyncio.gather(*(publisher.publish(event) for event in events[20:]))
+                await asyncio.sleep(0)
+            results.extend(await pending)
+            return results, webhook.stats
+
+    results, stats = asyncio.run(run())
+    assert all(result.success for result in results)
+    assert (stats.requests, stats.batches, stats.events) == (3, 3, 25)
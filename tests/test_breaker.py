@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import socket
+
+import pytest
+from loguru import logger
+
+from metaflow_argo_events.exceptions import CircuitOpenError
+from metaflow_argo_events.logger import configure_logging
+from metaflow_argo_events.models import CreateArgoEventInput
+from metaflow_argo_events.publish import publish_events
+from metaflow_argo_events.publish.breaker import CircuitBreaker, CircuitState
+
+URL = "http://webhook/"
+
+
+def _request(breaker: CircuitBreaker, healthy: bool | None) -> None:
+    breaker.acquire(URL)
+    breaker.release(URL, healthy)
+
+
+def test_failures_open_the_circuit() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    _request(breaker, healthy=False)
+    _request(breaker, healthy=True)
+    _request(breaker, healthy=False)
+    assert breaker.state(URL) is CircuitState.CLOSED
+
+    _request(breaker, healthy=False)
+    assert breaker.state(URL) is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.acquire(URL)
+    assert (raised.value.url, raised.value.failures) == (URL, 2)
+    assert raised.value.retry_in > 0
+    assert breaker.state("http://other/") is CircuitState.CLOSED
+
+
+def test_half_open_trial_closes_or_reopens() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _request(breaker, healthy=False)
+    assert breaker.state(URL) is CircuitState.OPEN
+
+    # Once reset_timeout has passed, one trial goes through and the rest fail fast.
+    breaker.acquire(URL)
+    assert breaker.state(URL) is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire(URL)
+    breaker.release(URL, None)
+    breaker.acquire(URL)
+    breaker.release(URL, False)
+    assert breaker.state(URL) is CircuitState.OPEN
+
+    _request(breaker, healthy=True)
+    assert breaker.state(URL) is CircuitState.CLOSED
+    assert [(c["state"], c["consecutive_failures"], c["rejected"]) for c in breaker.snapshot()] == [("closed", 0, 1)]
+
+
+def test_open_circuit_logs_only_the_state_change() -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        dead_url = f"http://127.0.0.1:{probe.getsockname()[1]}/"
+    events = [
+        CreateArgoEventInput(name="dead", payload={"i": str(i)}, url=dead_url, force=True, ignore_errors=True)
+        for i in range(200)
+    ]
+    messages: list[str] = []
+    # Install the default sink first; doing it lazily on the first log call would drop ours.
+    configure_logging()
+    handler = logger.add(lambda message: messages.append(message.record["message"]), level="INFO")
+    try:
+        results = publish_events(events, breaker=CircuitBreaker(failure_threshold=1), history=None)
+    finally:
+        logger.remove(handler)
+
+    assert not any(result.success for result in results)
+    assert messages == [f"Circuit for {dead_url} opened after 1 consecutive failures; failing fast for 30.0s"]
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from metaflow_argo_events.schema.clients import (
+    CACHED,
+    FAILED,
+    GENERATED,
+    UNCHANGED,
+    ClientTarget,
+    generate_clients,
+)
+
+# Stands in for openapi-generator-cli: every target gets a README first, like the real generator's
+# supporting files, and "go" then fails before the generator marks it complete.
+GENERATOR = """
+import json
+import pathlib
+import sys
+
+if sys.argv[1] == "version":
+    print("7.9.0")
+    sys.exit(0)
+with open(sys.argv[0] + ".log", "a") as log:
+    log.write("batch\\n")
+status = 0
+for config in sys.argv[4:]:
+    target = json.loads(pathlib.Path(config).read_text())
+    output = pathlib.Path(target["outputDir"])
+    output.mkdir(parents=True)
+    (output / "README.md").write_text(target["generatorName"])
+    if target["generatorName"] == "go":
+        status = 1
+        continue
+    (output / "api.txt").write_text(pathlib.Path(target["inputSpec"]).read_text())
+    (output / ".openapi-generator").mkdir()
+    (output / ".openapi-generator" / "FILES").write_text("README.md\\napi.txt\\n")
+sys.exit(status)
+"""
+
+
+@pytest.fixture
+def generator(tmp_path: Path) -> list[str]:
+    script = tmp_path / "generator.py"
+    script.write_text(textwrap.dedent(GENERATOR))
+    return [sys.executable, str(script)]
+
+
+@pytest.fixture
+def spec(tmp_path: Path) -> Path:
+    path = tmp_path / "flow.json"
+    path.write_text('{"openapi": "3.0.0"}')
+    return path
+
+
+def _batch_runs(generator: list[str]) -> int:
+    log = Path(generator[1] + ".log")
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def test_unchanged_specs_are_not_regenerated(tmp_path: Path, generator: list[str], spec: Path) -> None:
+    targets = [ClientTarget(spec, "python", tmp_path / "out" / "python")]
+    cache_dir = tmp_path / "cache"
+
+    assert [r.status for r in generate_clients(targets, command=generator, cache_dir=cache_dir)] == [GENERATED]
+    assert [r.status for r in generate_clients(targets, command=generator, cache_dir=cache_dir)] == [UNCHANGED]
+    (tmp_path / "out" / "python" / ".metaflow-events-client.json").unlink()
+    assert [r.status for r in generate_clients(targets, command=generator, cache_dir=cache_dir)] == [CACHED]
+    assert _batch_runs(generator) == 1
+
+
+def test_failed_target_is_never_cached(tmp_path: Path, generator: list[str], spec: Path) -> None:
+    targets = [
+        ClientTarget(spec, "python", tmp_path / "out" / "python"),
+        ClientTarget(spec, "go", tmp_path / "out" / "go"),
+    ]
+    cache_dir = tmp_path / "cache"
+
+    first = generate_clients(targets, command=generator, cache_dir=cache_dir)
+    assert [result.status for result in first] == [GENERATED, FAILED]
+    assert first[1].error is not None
+    assert not (tmp_path / "out" / "go").exists()
+    assert not (cache_dir / first[1].key).exists()
+
+    second = generate_clients(targets, command=generator, cache_dir=cache_dir)
+    assert [result.status for result in second] == [UNCHANGED, FAILED]
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import base64
+import json
+import threading
+import time
+
+from metaflow_argo_events.models import AuthConfig
+from metaflow_argo_events.publish.credentials import EMPTY_HEADERS, CredentialProvider, render_headers, token_expiry
+
+EXP = 1700000000
+
+
+def _jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{claims}.signature"
+
+
+def test_equal_configs_share_rendered_headers() -> None:
+    bearer = AuthConfig(method="bearer", bearer_token="abc")  # noqa: S106
+    assert render_headers(bearer) == {"Authorization": "Bearer abc"}
+    assert render_headers(bearer) is render_headers(bearer.model_copy())
+    service = AuthConfig(method="service", service_headers={"X-API-Key": "key"})
+    assert render_headers(service) == {"X-API-Key": "key"}
+    assert render_headers(AuthConfig()) is EMPTY_HEADERS
+
+
+def test_token_expiry_reads_the_exp_claim() -> None:
+    assert token_expiry(_jwt(EXP)) == float(EXP)
+    assert token_expiry("opaque-token") is None
+
+
+def test_due_token_is_refreshed_once_in_the_background() -> None:
+    release = threading.Event()
+    calls: list[int] = []
+
+    def refresh() -> str:
+        calls.append(1)
+        release.wait(5)
+        return _jwt(time.time() + 3600)
+
+    stale = _jwt(time.time() + 30)
+    provider = CredentialProvider(AuthConfig(method="bearer", bearer_token=stale), refresh=refresh, refresh_margin=60)
+
+    # Callers keep the current headers while the refresh runs, and start no second refresh.
+    assert [provider.headers() for _ in range(5)] == [{"Authorization": f"Bearer {stale}"}] * 5
+    release.set()
+    deadline = time.monotonic() + 5
+    while provider.headers()["Authorization"] == f"Bearer {stale}" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert calls == [1]
+    assert provider.headers()["Authorization"] == f"Bearer {provider.config.bearer_token}"
+    assert provider.config.bearer_token != stale
+    assert provider.expires_at is not None
+    assert provider.expires_at > time.time() + 60
+
+
+def test_failed_refresh_keeps_the_current_token() -> None:
+    def refresh() -> str:
+        msg = "token service unavailable"
+        raise RuntimeError(msg)
+
+    token = _jwt(time.time() + 30)
+    provider = CredentialProvider(
+        AuthConfig(method="bearer", bearer_token=token), refresh=refresh, refresh_margin=60, retry_interval=60
+    )
+    assert provider.refresh_now(timeout=5) == {"Authorization": f"Bearer {token}"}
+    assert provider.config.bearer_token == token
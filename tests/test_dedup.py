@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+from metaflow_argo_events.publish.dedup import EventDeduplicator, dedup_key
+
+
+def test_key_ignores_payload_order() -> None:
+    assert dedup_key("event", {"a": 1, "b": 2}) == dedup_key("event", {"b": 2, "a": 1})
+    assert dedup_key("event", {"a": 1}) != dedup_key("other", {"a": 1})
+
+
+def test_compaction_keeps_entries_evicted_from_memory(tmp_path: Path) -> None:
+    journal = tmp_path / "dedup.jsonl"
+    small = EventDeduplicator(journal, max_entries=1)
+    other = EventDeduplicator(journal)
+    small.put("a", "id-a")
+    other.put("b", "id-b")
+    small.put("c", "id-c")
+    small.put("a", "id-a2", delivered=False)
+    assert small.stats().entries == 1
+
+    small.compact()
+
+    assert len(journal.read_text().splitlines()) == len(["a", "b", "c"])
+    fresh = EventDeduplicator(journal)
+    assert {key: fresh.get(key) for key in ("a", "b", "c")} == {
+        "a": small.get("a"),
+        "b": other.get("b"),
+        "c": other.get("c"),
+    }
+    entry = fresh.get("a")
+    assert entry is not None
+    assert (entry.event_id, entry.delivered) == ("id-a2", False)
+
+
+def test_expired_entries_are_dropped(tmp_path: Path) -> None:
+    journal = tmp_path / "dedup.jsonl"
+    with EventDeduplicator(journal, ttl=1e-9) as expiring:
+        expiring.put("a", "id-a")
+    assert journal.read_text() == ""
+    assert EventDeduplicator(journal).get("a") is None
+
+
+def _append_and_read(path: str, writer: int, count: int, barrier: Any, misses: Any) -> None:
+    dedup = EventDeduplicator(path)
+    other = 1 - writer
+    for i in range(count):
+        dedup.put(f"{writer}-{i}", f"id-{writer}-{i}")
+        # A miss reads what the other writer appended so far.
+        dedup.get(f"{other}-{i}")
+    barrier.wait()
+    misses[writer] = sum(dedup.get(f"{other}-{i}") is None for i in range(count))
+
+
+def test_concurrent_appenders_see_each_others_entries(tmp_path: Path) -> None:
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(2)
+    misses = context.Array("i", [-1, -1])
+    writers = [
+        context.Process(target=_append_and_read, args=(str(tmp_path / "dedup.jsonl"), writer, 2000, barrier, misses))
+        for writer in (0, 1)
+    ]
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join(30)
+    assert [process.exitcode for process in writers] == [0, 0]
+    assert list(misses) == [0, 0]
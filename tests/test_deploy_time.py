@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import textwrap
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from metaflow_argo_events.schema.deploy_time import SCOPE_FUNCTION, DeployTimeResolver
+from metaflow_argo_events.schema.extract import deploy_time_fields, find_flow_classes, load_flow_module
+
+HELPERS = """
+from metaflow_argo_events.schema.deploy_time import shared_deploy_time
+
+def per_flow(ctx):
+    return ctx.flow_name
+
+@shared_deploy_time
+def shared(ctx):
+    return "constant"
+"""
+
+FLOW = """
+from metaflow import FlowSpec, Parameter, step
+
+import deploy_helpers
+
+class {name}(FlowSpec):
+    owner = Parameter("owner", default=deploy_helpers.per_flow)
+    release = Parameter("release", default=deploy_helpers.shared)
+
+    @step
+    def start(self):
+        self.next(self.end)
+
+    @step
+    def end(self):
+        pass
+"""
+
+
+@pytest.fixture
+def fields(tmp_path: Path) -> list[tuple[str, Any]]:
+    (tmp_path / "deploy_helpers.py").write_text(textwrap.dedent(HELPERS))
+    collected: list[tuple[str, Any]] = []
+    for name in ("FlowA", "FlowB", "FlowC"):
+        flow_file = tmp_path / f"{name.lower()}.py"
+        flow_file.write_text(textwrap.dedent(FLOW.format(name=name)))
+        for flow in find_flow_classes(load_flow_module(flow_file)):
+            collected.extend((flow.__name__, field) for field in deploy_time_fields(flow))
+    return collected
+
+
+def _values(resolved: list[Any]) -> dict[tuple[str, str], Any]:
+    return {(result.flow_name, result.field.parameter_name): result.value for result in resolved}
+
+
+def test_context_dependent_functions_resolve_per_flow(fields: list[tuple[str, Any]]) -> None:
+    with DeployTimeResolver() as resolver:
+        resolved = resolver.resolve(fields)
+
+    assert [result.error for result in resolved] == [None] * 6
+    values = _values(resolved)
+    assert [values[flow, "owner"] for flow in ("FlowA", "FlowB", "FlowC")] == ["FlowA", "FlowB", "FlowC"]
+    assert {values[flow, "release"] for flow in ("FlowA", "FlowB", "FlowC")} == {"constant"}
+    # Three per-flow evaluations plus one for the function marked as shared.
+    assert resolver.summary() == {"scope": "parameter", "evaluations": 4, "cache_hits": 2}
+
+
+def test_function_scope_shares_results_across_flows(fields: list[tuple[str, Any]]) -> None:
+    with DeployTimeResolver(scope=SCOPE_FUNCTION) as resolver:
+        resolved = resolver.resolve(fields)
+
+    assert resolver.summary() == {"scope": "function", "evaluations": 2, "cache_hits": 4}
+    assert [result.cached for result in resolved] == [False, False] + [True] * 4
+
+
+def test_unknown_scope_is_rejected() -> None:
+    with pytest.raises(ValueError, match="scope must be one of"):
+        DeployTimeResolver(scope="flow")
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+
+import pytest
+
+from metaflow_argo_events.models import ArgoEventPayload, EventBatch
+from metaflow_argo_events.models.trusted import dump_json_bytes, encode_webhook_body, trusted_event_payload
+
+
+@pytest.fixture
+def payloads() -> list[ArgoEventPayload]:
+    models = []
+    for i in range(12):
+        extra = {"status": "success", "count": i} if i % 3 else {}
+        models.append(trusted_event_payload(f"event_{i % 2}", f"id-{i}", 1684159845 + i, "20230515", extra))
+    models[4] = models[4].model_copy(update={"generated_by_metaflow": False})
+    return models
+
+
+def test_rows_round_trip(payloads: list[ArgoEventPayload]) -> None:
+    batch = EventBatch(payloads)
+    assert len(batch) == len(payloads)
+    assert list(batch) == payloads
+    assert batch[-1] == payloads[-1]
+
+
+def test_serializers_match_models(payloads: list[ArgoEventPayload]) -> None:
+    batch = EventBatch(payloads)
+    assert json.loads(batch.to_json()) == [json.loads(dump_json_bytes(p)) for p in payloads]
+    assert batch.to_ndjson() == b"".join(dump_json_bytes(p) + b"\n" for p in payloads)
+    assert list(batch.webhook_bodies()) == [encode_webhook_body(p) for p in payloads]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [slice(2, 9), slice(None, 5), slice(7, None), slice(None, None, -1), slice(10, 1, -3), slice(1, 11, 2)],
+)
+def test_slice_matches_list_slice(payloads: list[ArgoEventPayload], index: slice) -> None:
+    assert list(EventBatch(payloads)[index]) == payloads[index]
+
+
+@pytest.mark.parametrize("index", [slice(5, 2), slice(3, 3), slice(20, 30), slice(2, 5, -1)])
+def test_empty_slice_accepts_appends(payloads: list[ArgoEventPayload], index: slice) -> None:
+    batch = EventBatch(payloads)[index]
+    assert len(batch) == 0
+    batch.append("late", "id-late", 1684160000, "20230515", {"status": "late"})
+    assert list(batch) == [trusted_event_payload("late", "id-late", 1684160000, "20230515", {"status": "late"})]
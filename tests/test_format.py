@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import io
+import json
+from typing import Any
+
+import pytest
+import yaml
+
+from metaflow_argo_events.cli.format import format_output, iter_output, write_output
+
+RECORDS = [{"name": f"event-{i}", "payload": {"i": i, "tags": ["a", "b"]}, "ok": i % 2 == 0} for i in range(600)]
+
+
+def _written(data: Any, output_format: str) -> str:
+    stream = io.StringIO()
+    write_output(data, output_format, stream)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("items", [[], RECORDS[:1], RECORDS], ids=["empty", "one", "many"])
+def test_streamed_json_matches_json_dumps(items: list[dict[str, Any]]) -> None:
+    expected = json.dumps(items, indent=2)
+    assert "".join(iter_output(iter(items), "json")) == expected
+    assert "".join(iter_output(items, "json")) == expected
+    assert format_output(iter(items), "json") == expected
+
+
+def test_ndjson_writes_one_object_per_line() -> None:
+    lines = _written(iter(RECORDS), "ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+    assert _written(RECORDS[0], "ndjson") == json.dumps(RECORDS[0], separators=(",", ":")) + "\n"
+
+
+@pytest.mark.parametrize(
+    "data", [RECORDS[:10], RECORDS, {"key": RECORDS[:3]}, "text"], ids=["short", "long", "dict", "scalar"]
+)
+def test_yaml_matches_safe_dump(data: Any) -> None:
+    assert _written(data, "yaml") == yaml.safe_dump(data, sort_keys=False)
+
+
+def test_yaml_stream_is_one_document_per_item() -> None:
+    output = _written(iter(RECORDS[:5]), "yaml")
+    assert output == yaml.safe_dump_all(RECORDS[:5], sort_keys=False, explicit_start=True)
+    assert list(yaml.safe_load_all(output)) == RECORDS[:5]
+
+
+def test_long_yaml_lists_repeat_shared_objects_instead_of_aliasing() -> None:
+    shared = {"owner": "data"}
+    data = [[shared, shared] for _ in range(300)]
+
+    output = _written(data, "yaml")
+
+    assert "&id" not in output
+    assert yaml.safe_load(output) == data
+    # A single dump anchors shared objects; lists that fit in one chunk keep that behaviour.
+    assert _written(data[:2], "yaml") == yaml.safe_dump(data[:2], sort_keys=False)
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from metaflow_argo_events.models.trusted import trusted_event_payload
+from metaflow_argo_events.publish.history import EventHistory, HistoryQuery
+
+BASE = 1767225600
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> Iterator[EventHistory]:
+    history = EventHistory(tmp_path / "history.db", batch_size=10)
+    for i in range(30):
+        payload = trusted_event_payload(f"event_{i % 3}", f"id-{i}", BASE + i, "20260101", {"run": str(i)})
+        history.record(payload, "failed" if i % 10 == 0 else "published")
+    history.flush()
+    yield history
+    history.close()
+
+
+def test_query_filters_newest_first(history: EventHistory) -> None:
+    events = history.query(HistoryQuery(name="event_1", since=BASE + 10), limit=3)
+    assert [event.event_id for event in events] == ["id-28", "id-25", "id-22"]
+    assert events[0].payload == {"run": "28"}
+    assert history.count(HistoryQuery(status="failed")) == len(["id-0", "id-10", "id-20"])
+
+
+def test_later_status_wins(history: EventHistory) -> None:
+    history.record(trusted_event_payload("event_0", "id-0", BASE, "20260101"), "published")
+    history.flush()
+    event = history.get("id-0")
+    assert event is not None
+    assert event.status == "published"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        HistoryQuery(name="event_1"),
+        HistoryQuery(utc_date="20260101"),
+        HistoryQuery(status="failed"),
+        HistoryQuery(since=BASE, until=BASE + 5),
+    ],
+)
+def test_filters_use_an_index(history: EventHistory, query: HistoryQuery) -> None:
+    where, params = query.where()
+    with sqlite3.connect(history.path) as connection:
+        plan = connection.execute(f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM events{where}", params).fetchall()  # noqa: S608
+    assert all("USING" in detail for *_, detail in plan), plan
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous enough to absorb CI noise; a regression that pulls pydantic or the formatting stack
+# back into startup costs well over this on its own.
+CLI_IMPORT_BUDGET_US = 200_000
+
+HEAVY_MODULES = (
+    "loguru",
+    "metaflow",
+    "metaflow_argo_events.cli.format",
+    "metaflow_argo_events.models",
+    "metaflow_argo_events.publish",
+    "pydantic",
+    "rich.markdown",
+    "rich.table",
+    "yaml",
+)
+
+
+def import_times(*args: str) -> dict[str, int]:
+    """Run a fresh interpreter under ``-X importtime`` and return cumulative microseconds per module."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def version_imports() -> dict[str, int]:
+    return import_times("-c", "from metaflow_argo_events.cli.main import app; app()", "--version")
+
+
+def test_version_does_not_import_heavy_modules(version_imports: dict[str, int]) -> None:
+    loaded = sorted(
+        name
+        for name in version_imports
+        if name in HEAVY_MODULES or name.startswith(tuple(f"{m}." for m in HEAVY_MODULES))
+    )
+    assert loaded == []
+
+
+def test_cli_import_within_budget(version_imports: dict[str, int]) -> None:
+    assert version_imports["metaflow_argo_events.cli.main"] < CLI_IMPORT_BUDGET_US
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+
+import pytest
+
+from metaflow_argo_events.models import JSONParameterModel, LazyJSON, LazyJSONParameterModel
+from metaflow_argo_events.models.parameters import JSONTooLargeError
+
+RAW = '{"name": "café", "values": [1, 2, {"label": "\\"x\\""}], "note": "\\u0000 lazy-json"}'
+
+
+def test_json_dump_forwards_raw_text_without_parsing() -> None:
+    model = LazyJSONParameterModel(value=RAW)
+
+    dumped = model.model_dump_json()
+
+    assert not model.value.parsed
+    assert dumped == '{"value":' + RAW + "}"
+    assert json.loads(dumped) == json.loads(JSONParameterModel(value=RAW).model_dump_json())
+
+
+def test_python_dump_parses() -> None:
+    model = LazyJSONParameterModel(value=RAW)
+    assert model.model_dump() == {"value": json.loads(RAW)}
+    assert model.value.parsed
+
+
+def test_size_limit_counts_encoded_bytes() -> None:
+    text = '["' + "é" * 10 + '"]'
+    assert LazyJSON(text, max_bytes=len(text.encode())).to_bytes() == text.encode()
+    with pytest.raises(JSONTooLargeError):
+        LazyJSON(text, max_bytes=len(text))
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+from typing import Any
+
+from metaflow_argo_events.publish.limits import EndpointLimiter, EndpointLimits
+from metaflow_argo_events.publish.transport import HttpResponse
+
+URL = "http://webhook/events"
+
+
+def _respond(limiter: EndpointLimiter, *statuses: int | None, headers: dict[str, str] | None = None) -> None:
+    async def run() -> None:
+        for status in statuses:
+            async with limiter.slot(URL) as slot:
+                if status is None:
+                    slot.fail()
+                else:
+                    slot.record(HttpResponse(status, headers or {}, b""))
+
+    asyncio.run(run())
+
+
+def _state(limiter: EndpointLimiter, *keys: str) -> dict[str, Any]:
+    [snapshot] = limiter.snapshot()
+    return {key: snapshot[key] for key in keys}
+
+
+def test_server_errors_cut_the_limit_once_per_round_trip() -> None:
+    limiter = EndpointLimiter(EndpointLimits(initial_concurrency=8))
+    _respond(limiter, 500, None, 502)
+    assert _state(limiter, "concurrency_limit", "errors", "requests") == {
+        "concurrency_limit": 4,
+        "errors": 3,
+        "requests": 3,
+    }
+
+
+def test_throttling_honours_retry_after() -> None:
+    limiter = EndpointLimiter(EndpointLimits(initial_concurrency=8))
+    _respond(limiter, 429, headers={"retry-after": "30"})
+    assert _state(limiter, "concurrency_limit", "throttled") == {"concurrency_limit": 4, "throttled": 1}
+    assert _state(limiter, "paused_for")["paused_for"] > 0
+
+
+def test_successes_raise_the_limit_additively() -> None:
+    limiter = EndpointLimiter(EndpointLimits(initial_concurrency=4, max_concurrency=5))
+    _respond(limiter, *[200] * 5)
+    assert _state(limiter, "concurrency_limit") == {"concurrency_limit": 5}
+    _respond(limiter, *[200] * 5)
+    assert _state(limiter, "concurrency_limit") == {"concurrency_limit": 5}
+
+
+def test_in_flight_requests_stay_under_the_limit() -> None:
+    limiter = EndpointLimiter(overrides={"http://webhook/": EndpointLimits(max_concurrency=2)})
+    in_flight: list[int] = []
+
+    async def request() -> None:
+        async with limiter.slot(URL) as slot:
+            in_flight.append(limiter.endpoint(URL).in_flight)
+            await asyncio.sleep(0.01)
+            slot.record(HttpResponse(200, {}, b""))
+
+    async def run() -> None:
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(run())
+    assert max(in_flight) == limiter.limits_for(URL).max_concurrency
+    assert limiter.limits_for("http://other/") == EndpointLimits()
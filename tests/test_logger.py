@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import io
+import json
+import subprocess
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from metaflow_argo_events import logger as logger_module
+from metaflow_argo_events.exceptions import ClientError
+from metaflow_argo_events.logger import RateLimitFilter, configure_logging, flush_logs, get_logger, log_queue_depth
+from metaflow_argo_events.publish.replay import iter_recorded_events
+
+# Logs through the background sink and exits without flushing; the atexit hook must write every record.
+QUEUED_WRITER = """
+from metaflow_argo_events.logger import configure_logging, get_logger
+
+configure_logging(json_lines=True, enqueue=True)
+logger = get_logger("queued")
+for i in range(500):
+    logger.info("record {}", i)
+"""
+
+
+@pytest.fixture
+def json_log() -> Iterator[io.StringIO]:
+    saved = configure_logging()
+    stream = io.StringIO()
+    configure_logging(json_lines=True, enqueue=False, rate_limit=0, stream=stream)
+    yield stream
+    flush_logs()
+    configure_logging(
+        json_lines=saved.json_lines,
+        enqueue=saved.enqueue,
+        rate_limit=saved.rate_limit,
+        stream=saved.stream or sys.stderr,
+    )
+
+
+def test_json_lines_message_is_interpolated(tmp_path: Path, json_log: io.StringIO) -> None:
+    recording = tmp_path / "events.ndjson"
+    recording.write_text("[1, 2]\n")
+
+    assert list(iter_recorded_events([str(recording)])) == []
+
+    records = [json.loads(line) for line in json_log.getvalue().splitlines()]
+    assert [(record["level"], record["msg"]) for record in records] == [
+        ("WARNING", f"Skipping {recording}:1: not a JSON object")
+    ]
+
+
+def test_background_sink_writes_every_record(json_log: io.StringIO) -> None:
+    configure_logging(enqueue=True)
+    logger = get_logger("queued")
+    for i in range(200):
+        logger.info("record {}", i)
+    flush_logs()
+
+    assert log_queue_depth() == 0
+    records = [json.loads(line) for line in json_log.getvalue().splitlines()]
+    assert [record["msg"] for record in records] == [f"record {i}" for i in range(200)]
+    assert {record["name"] for record in records} == {"queued"}
+
+
+def test_queued_records_are_flushed_at_exit() -> None:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", textwrap.dedent(QUEUED_WRITER)], capture_output=True, text=True, check=True
+    )
+    messages = [json.loads(line)["msg"] for line in completed.stderr.splitlines()]
+    assert messages == [f"record {i}" for i in range(500)]
+
+
+def test_rate_limit_filter_reports_suppressed_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(logger_module.time, "monotonic", lambda: now[0])
+    rate_filter = RateLimitFilter(per_second=2)
+
+    def record(line: int) -> dict[str, Any]:
+        return {"name": "module", "line": line, "extra": {}}
+
+    assert [rate_filter(record(10)) for _ in range(5)] == [True, True, False, False, False]
+    # Each call site has its own budget.
+    assert rate_filter(record(20))
+    now[0] += 1.0
+    summary = record(10)
+    assert rate_filter(summary)
+    assert summary["extra"] == {"suppressed": 3}
+    assert rate_filter(record(10))
+    assert not rate_filter(record(10))
+
+
+def test_creating_an_error_does_not_log(json_log: io.StringIO) -> None:
+    errors = [ClientError.api_error("webhook", 500, "boom", hint="retry later") for _ in range(10)]
+    assert errors[0].hint == "retry later"
+    assert json_log.getvalue() == ""
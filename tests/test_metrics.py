@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from metaflow_argo_events.metrics import (
+    METRICS_RETENTION,
+    MetricsRegistry,
+    collect_snapshot,
+    parse_prometheus,
+    write_textfile,
+)
+
+
+def _registry(published: int, latencies: list[float]) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.inc("events_published_total", published, {"event": "orders", "url": 'http://a/"x"\n'})
+    registry.set("publish_in_flight", 0)
+    for latency in latencies:
+        registry.observe("publish_latency_seconds", latency, {"event": "orders"})
+    return registry
+
+
+@pytest.fixture
+def dead_pid() -> int:
+    process = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, check=True)  # noqa: S603
+    return int(process.stdout)
+
+
+def test_prometheus_round_trip() -> None:
+    samples = {
+        (name, labels): value for name, labels, value in parse_prometheus(_registry(3, [0.02, 0.2]).to_prometheus())
+    }
+
+    published = ("metaflow_events_events_published_total", (("event", "orders"), ("url", 'http://a/"x"\n')))
+    event = (("event", "orders"),)
+    assert samples[published] == 3.0  # noqa: PLR2004
+    assert samples["metaflow_events_publish_in_flight", ()] == 0.0
+    assert samples["metaflow_events_publish_latency_seconds_count", event] == 2.0  # noqa: PLR2004
+    assert samples["metaflow_events_publish_latency_seconds_sum", event] == pytest.approx(0.22)
+    buckets = {labels[-1][1]: value for (name, labels), value in samples.items() if name.endswith("_bucket")}
+    assert (buckets["0.01"], buckets["0.025"], buckets["0.25"], buckets["+Inf"]) == (0.0, 1.0, 2.0, 2.0)
+
+
+def test_collect_snapshot_sums_processes(tmp_path: Path) -> None:
+    write_textfile(_registry(3, [0.01, 0.03]), tmp_path / f"{os.getpid()}.prom")
+    write_textfile(_registry(4, [0.02]), tmp_path / f"{os.getppid()}.prom")
+
+    rows = collect_snapshot(tmp_path)
+
+    assert rows == [
+        {"metric": "events_published_total", "event": "orders", "url": 'http://a/"x"\n', "value": 7},
+        {"metric": "publish_in_flight", "value": 0},
+        {"metric": "publish_latency_seconds", "event": "orders", "count": 3, "mean_ms": 20.0},
+    ]
+
+
+def test_collect_snapshot_prunes_expired_files_of_exited_processes(tmp_path: Path, dead_pid: int) -> None:
+    live = write_textfile(_registry(1, []), tmp_path / f"{os.getpid()}.prom")
+    expired = write_textfile(_registry(10, []), tmp_path / f"{dead_pid}.prom")
+    other = write_textfile(_registry(100, []), tmp_path / "node.prom")
+    stale = expired.stat().st_mtime - METRICS_RETENTION - 60
+    for path in (live, expired, other):
+        os.utime(path, (stale, stale))
+
+    rows = collect_snapshot(tmp_path)
+
+    assert rows[0]["value"] == 101  # noqa: PLR2004
+    assert sorted(tmp_path.glob("*.prom")) == sorted([live, other])
+
+
+def test_collect_snapshot_keeps_recent_files_of_exited_processes(tmp_path: Path, dead_pid: int) -> None:
+    recent = write_textfile(_registry(5, []), tmp_path / f"{dead_pid}.prom")
+
+    assert collect_snapshot(tmp_path)[0]["value"] == 5  # noqa: PLR2004
+    assert recent.exists()
+    assert collect_snapshot(tmp_path, retention=0) == []
+    assert not recent.exists()
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner, Result
+
+from metaflow_argo_events.cli.main import app
+from metaflow_argo_events.schema.manifest import BuildManifest, local_dependencies, plan_rebuild
+from metaflow_argo_events.schema.openapi import spec_fragments
+
+FLOW = """
+from metaflow import FlowSpec, Parameter, step
+{imports}
+
+class {name}(FlowSpec):
+    owner = Parameter("owner", default={default})
+
+    @step
+    def start(self):
+        self.next(self.end)
+
+    @step
+    def end(self):
+        pass
+"""
+
+
+def _write_flow(path: Path, name: str, default: str, imports: str = "") -> None:
+    path.write_text(textwrap.dedent(FLOW.format(name=name, default=default, imports=imports)))
+
+
+@pytest.fixture
+def flows(tmp_path: Path) -> Path:
+    directory = tmp_path / "flows"
+    (directory / "config").mkdir(parents=True)
+    (directory / "config" / "__init__.py").write_text("")
+    (directory / "config" / "owners.py").write_text('OWNER = "data"\n')
+    (directory / "helpers.py").write_text("from config.owners import OWNER\n")
+    _write_flow(directory / "flow_a.py", "FlowA", "helpers.OWNER", "import helpers")
+    _write_flow(directory / "flow_b.py", "FlowB", '"b"')
+    return directory
+
+
+def _generate(flows: Path, *options: str) -> Result:
+    output_dir = flows.parent / "out"
+    return CliRunner().invoke(
+        app, ["openapi", "generate", str(flows), "--output-dir", str(output_dir), "--no-cache", "-j", "1", *options]
+    )
+
+
+def _plan(flows: Path) -> dict[str, str]:
+    output_dir = flows.parent / "out"
+    manifest = BuildManifest.load(output_dir / ".manifest.json")
+    outputs = {}
+    for spec in output_dir.glob("Flow*.json"):
+        outputs.update(spec_fragments(json.loads(spec.read_text())))
+    plan = plan_rebuild(manifest, sorted(flows.glob("flow_*.py")), [outputs])
+    return {path.name: reason for path, reason in plan.reasons.items()}
+
+
+def _spec_text(flows: Path, flow_name: str) -> str:
+    return (flows.parent / "out" / f"{flow_name}.json").read_text()
+
+
+def test_local_dependencies_are_followed_transitively(flows: Path) -> None:
+    assert [path.relative_to(flows).as_posix() for path in local_dependencies(flows / "flow_a.py")] == [
+        "config/__init__.py",
+        "config/owners.py",
+        "helpers.py",
+    ]
+    assert local_dependencies(flows / "flow_b.py") == []
+
+
+def test_unchanged_sources_are_skipped(flows: Path) -> None:
+    assert "Rebuilt 2 of 2 flow files" in _generate(flows).output
+    assert _plan(flows) == {}
+    assert "Rebuilt 0 of 2 flow files" in _generate(flows).output
+
+
+def test_changed_import_rebuilds_its_importers(flows: Path) -> None:
+    _generate(flows)
+    (flows / "config" / "owners.py").write_text('OWNER = "platform"\n')
+
+    assert _plan(flows) == {"flow_a.py": "dependency changed: ../flows/config/owners.py"}
+    assert "Rebuilt 1 of 2 flow files" in _generate(flows).output
+    assert '"platform"' in _spec_text(flows, "FlowA")
+
+
+def test_edited_output_is_rebuilt(flows: Path) -> None:
+    _generate(flows)
+    spec_path = flows.parent / "out" / "FlowB.json"
+    original = spec_path.read_text()
+    spec_path.write_text(original.replace('"b"', '"edited"'))
+
+    assert _plan(flows) == {"flow_b.py": "output modified for FlowB"}
+    assert "Rebuilt 1 of 2 flow files" in _generate(flows).output
+    assert spec_path.read_text() == original
+
+
+def test_removed_flow_file_deletes_its_spec(flows: Path) -> None:
+    _generate(flows)
+    (flows / "flow_b.py").unlink()
+
+    assert "Rebuilt 0 of 1 flow files" in _generate(flows).output
+    assert sorted(path.name for path in (flows.parent / "out").glob("Flow*.json")) == ["FlowA.json"]
+    manifest = BuildManifest.load(flows.parent / "out" / ".manifest.json")
+    assert sorted(manifest.files) == ["../flows/flow_a.py"]
+
+
+def test_force_rebuilds_everything(flows: Path) -> None:
+    _generate(flows)
+    assert "Rebuilt 2 of 2 flow files" in _generate(flows, "--force").output
+
+
+def test_duplicate_flow_names_are_rejected(flows: Path) -> None:
+    _generate(flows)
+    _write_flow(flows / "flow_c.py", "FlowA", '"copy"')
+
+    result = _generate(flows)
+    assert result.exit_code == 1
+    assert "Duplicate flow names" in result.output
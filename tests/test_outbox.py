@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from metaflow_argo_events.cli.main import app
+from metaflow_argo_events.models import ArgoEventPayload, CreateArgoEventInput
+from metaflow_argo_events.models.trusted import trusted_event_payload
+from metaflow_argo_events.publish import DrainResult, EventPublisher, Outbox, OutboxDrainer, OutboxRecord
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.standin import StandInWebhook, _Request
+
+# Appends records from a separate process that then dies without sealing its segment or
+# flushing anything, and leaves half a record behind, as a crash mid-write would.
+CRASHING_WRITER = """
+import os
+import sys
+
+from metaflow_argo_events.models.trusted import trusted_event_payload
+from metaflow_argo_events.publish import Outbox
+
+outbox = Outbox(sys.argv[1], fsync_every=1000, fsync_interval=60)
+for i in range(5):
+    outbox.append("http://webhook/", trusted_event_payload("crashed", f"id-{i}", 1700000000 + i, "20231114"))
+os.write(outbox._fd, b"\\x00\\x00\\x01\\x00torn")
+os._exit(1)
+"""
+
+
+class TokenWebhook(StandInWebhook):
+    """Stand-in that, like a webhook with auth enabled, rejects requests without its token."""
+
+    token = "event-token"  # noqa: S105
+
+    async def _handle(self, request: _Request) -> tuple[int, dict[str, str], bytes]:
+        if request.method == "POST" and request.headers.get("authorization") != f"Bearer {self.token}":
+            return 401, {}, b"unauthorized"
+        return await super()._handle(request)
+
+
+@pytest.fixture
+def webhook() -> Iterator[StandInWebhook]:
+    """Serve a stand-in from its own thread, for code that runs its own event loop."""
+    loop = asyncio.new_event_loop()
+    server = StandInWebhook(keep=100)
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(5)
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def _wait_for(condition: Any, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return bool(condition())
+
+
+def _payload(i: int) -> ArgoEventPayload:
+    return trusted_event_payload("spooled", f"id-{i}", 1700000000 + i, "20231114", {"run": str(i)})
+
+
+def _drain(outbox: Outbox, fail_at: str | None = None) -> tuple[list[str], DrainResult]:
+    sent: list[str] = []
+
+    async def send(record: OutboxRecord) -> bool:
+        if record.payload.id == fail_at:
+            return False
+        sent.append(record.payload.id)
+        return True
+
+    result = asyncio.run(outbox.drain(send, window=2))
+    return sent, result
+
+
+def test_record_round_trip() -> None:
+    # encode() frames the JSON behind an 8-byte length and checksum header.
+    record = OutboxRecord("http://webhook/", _payload(1), 1700000000.5, "secret")
+    assert OutboxRecord.decode(record.encode()[8:]) == record
+    anonymous = OutboxRecord("http://webhook/", _payload(2), 1700000000.5)
+    assert b"access_token" not in anonymous.encode()
+    assert OutboxRecord.decode(anonymous.encode()[8:]) == anonymous
+
+
+def test_records_from_a_crashed_writer_are_drained(tmp_path: Path) -> None:
+    subprocess.run([sys.executable, "-c", textwrap.dedent(CRASHING_WRITER), str(tmp_path)], check=False)  # noqa: S603
+    assert len(list(tmp_path.glob("*.open"))) == 1
+
+    outbox = Outbox(tmp_path)
+    assert outbox.stats().pending_records == len(range(5))
+    sent, result = _drain(outbox)
+    assert sent == [f"id-{i}" for i in range(5)]
+    assert result.to_dict() == {"replayed": 5, "failed": 0, "segments_removed": 1}
+    assert list(tmp_path.glob("*.open")) == []
+
+
+def test_interrupted_drain_resumes_after_last_ack(tmp_path: Path) -> None:
+    with Outbox(tmp_path) as outbox:
+        for i in range(6):
+            outbox.append("http://webhook/", _payload(i))
+
+    sent, result = _drain(outbox, fail_at="id-3")
+    assert sent == ["id-0", "id-1", "id-2"]
+    assert result.to_dict() == {"replayed": 3, "failed": 1, "segments_removed": 0}
+
+    sent, result = _drain(outbox)
+    assert sent == ["id-3", "id-4", "id-5"]
+    assert result.to_dict() == {"replayed": 3, "failed": 0, "segments_removed": 1}
+
+
+def test_spooled_event_is_replayed_with_its_access_token(tmp_path: Path) -> None:
+    async def run() -> tuple[DrainResult, list[dict[str, Any]]]:
+        async with TokenWebhook(keep=10) as webhook:
+            event = CreateArgoEventInput(
+                name="spooled", payload={"run": "1"}, url=webhook.url, access_token=webhook.token
+            )
+            async with EventPublisher(outbox=Outbox(tmp_path), history=None) as publisher:
+                deferred = publisher.defer(event)
+                assert deferred.event_id is not None
+                result = await publisher.drain_outbox()
+            return result, list(webhook.received)
+
+    result, received = asyncio.run(run())
+    assert result.to_dict() == {"replayed": 1, "failed": 0, "segments_removed": 1}
+    assert [body["payload"]["run"] for body in received] == ["1"]
+
+
+def test_idle_writer_is_synced_within_the_interval(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    synced: list[int] = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), fsync(fd)))
+    with Outbox(tmp_path, fsync_every=1000, fsync_interval=0.05) as outbox:
+        outbox.append("http://webhook/", _payload(1))
+        assert synced == []
+        # No further append arrives; the timer has to sync the record on its own.
+        assert _wait_for(lambda: synced)
+
+
+def test_background_drainer_replays_spooled_events(tmp_path: Path, webhook: StandInWebhook) -> None:
+    with Outbox(tmp_path) as outbox:
+        for i in range(3):
+            outbox.append(webhook.url, _payload(i))
+    drainer = OutboxDrainer(
+        Outbox(tmp_path), lambda: EventPublisher(breaker=CircuitBreaker(), history=None), interval=0.05
+    )
+    drainer.start()
+    try:
+        assert _wait_for(lambda: len(webhook.received) == len(range(3)))
+    finally:
+        drainer.stop(5)
+    assert Outbox(tmp_path).stats().pending_records == 0
+
+
+def test_drain_command(tmp_path: Path, webhook: StandInWebhook) -> None:
+    with Outbox(tmp_path) as outbox:
+        for i in range(4):
+            outbox.append(webhook.url, _payload(i))
+
+    result = CliRunner().invoke(app, ["outbox", "drain", "--dir", str(tmp_path), "--limit", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert "Replayed 3 events" in result.output
+    assert [body["payload"]["run"] for body in webhook.received] == ["0", "1", "2"]
+    assert Outbox(tmp_path).stats().pending_records == 1
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from metaflow_argo_events.cli.main import app
+from metaflow_argo_events.cli.profiling import expand_profile_flag
+
+COMMANDS = ["schema", "stats"]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--profile", "schema", "show"], ["--profile=cpu", "schema", "show"]),
+        (["--profile"], ["--profile=cpu"]),
+        (["--profile", "mem", "stats"], ["--profile", "mem", "stats"]),
+        (["--profile", "cpu", "stats"], ["--profile", "cpu", "stats"]),
+        (["--profile=mem", "stats"], ["--profile=mem", "stats"]),
+        (["--profile", "--profile-top", "5", "stats"], ["--profile=cpu", "--profile-top", "5", "stats"]),
+        (["--profile-top", "5", "--profile", "stats"], ["--profile-top", "5", "--profile=cpu", "stats"]),
+        (["stats", "--profile", "--dir", "x"], ["stats", "--profile", "--dir", "x"]),
+    ],
+)
+def test_expand_profile_flag(args: list[str], expected: list[str]) -> None:
+    assert expand_profile_flag(args, COMMANDS) == expected
+
+
+def _stats(tmp_path: Path, *options: str) -> str:
+    result = CliRunner().invoke(app, [*options, "stats", "--dir", str(tmp_path / "metrics"), "--format", "json"])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_bare_profile_writes_cpu_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    output = _stats(tmp_path, "--profile")
+
+    (path,) = tmp_path.glob("metaflow-events-stats-*.prof")
+    assert f"CPU profile written to {path.name}" in output
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_profile_output_and_top(tmp_path: Path) -> None:
+    path = tmp_path / "stats.prof"
+
+    output = _stats(tmp_path, "--profile", "--profile-output", str(path), "--profile-top", "3")
+
+    assert f"CPU profile written to {path}" in output
+    assert "List reduced from" in output
+    assert "to 3 due to restriction <3>" in output
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_memory_profile_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "stats.tracemalloc"
+
+    output = _stats(tmp_path, "--profile=mem", "--profile-output", str(path), "--profile-top", "3")
+
+    assert "Top 3 allocations by line" in output
+    assert f"Allocation snapshot written to {path}" in output
+    assert isinstance(tracemalloc.Snapshot.load(str(path)), tracemalloc.Snapshot)
+    assert not tracemalloc.is_tracing()
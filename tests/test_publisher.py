@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+
+import pytest
+
+from metaflow_argo_events.exceptions import ClientError
+from metaflow_argo_events.models import CreateArgoEventInput, PublishResult
+from metaflow_argo_events.publish import EventPublisher
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.standin import Faults, StandInWebhook
+
+MAX_IN_FLIGHT = 8
+
+
+class CountingWebhook(StandInWebhook):
+    """Stand-in that counts the connections it accepts."""
+
+    connections = 0
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await super()._serve(reader, writer)
+
+
+def _events(url: str, count: int, *, ignore_errors: bool = False) -> list[CreateArgoEventInput]:
+    return [
+        CreateArgoEventInput(name="pooled", payload={"i": str(i)}, url=url, force=True, ignore_errors=ignore_errors)
+        for i in range(count)
+    ]
+
+
+def test_publish_many_reuses_connections_and_keeps_input_order() -> None:
+    async def run() -> tuple[list[PublishResult], dict[str, str], int]:
+        async with CountingWebhook(keep=300) as webhook:
+            async with EventPublisher(max_in_flight=MAX_IN_FLIGHT, history=None) as publisher:
+                results = await publisher.publish_many(_events(webhook.url, 300))
+            sent = {body["payload"]["id"]: body["payload"]["i"] for body in webhook.received}
+            return results, sent, webhook.connections
+
+    results, sent, connections = asyncio.run(run())
+    assert all(result.success for result in results)
+    assert [sent[result.event_id or ""] for result in results] == [str(i) for i in range(300)]
+    assert 1 <= connections <= MAX_IN_FLIGHT
+
+
+def test_failures_are_reported_per_event() -> None:
+    async def run(*, ignore_errors: bool) -> list[PublishResult]:
+        async with (
+            StandInWebhook(faults=Faults(error_rate=1)) as webhook,
+            EventPublisher(breaker=CircuitBreaker(), history=None) as publisher,
+        ):
+            return await publisher.publish_many(_events(webhook.url, 2, ignore_errors=ignore_errors))
+
+    results = asyncio.run(run(ignore_errors=True))
+    assert [(result.success, result.event_id) for result in results] == [(False, None)] * 2
+    assert all("500" in (result.error_message or "") for result in results)
+    with pytest.raises(ClientError):
+        asyncio.run(run(ignore_errors=False))
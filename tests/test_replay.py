@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import gzip
+import io
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from metaflow_argo_events.cli.main import app
+from metaflow_argo_events.models import ArgoEventPayload
+from metaflow_argo_events.models.trusted import encode_webhook_body, trusted_event_payload
+from metaflow_argo_events.publish import EventPublisher
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.replay import (
+    ReplayFilter,
+    ReplayProgress,
+    failure_writer,
+    iter_recorded_events,
+    replay_events,
+)
+from metaflow_argo_events.publish.standin import Faults, StandInWebhook
+
+BASE = 1767225600  # 2026-01-01
+
+
+def _payloads(count: int) -> list[ArgoEventPayload]:
+    return [
+        trusted_event_payload(f"event_{i % 3}", f"id-{i}", BASE + i, "20260101", {"seq": str(i)}) for i in range(count)
+    ]
+
+
+def _replay(
+    faults: Faults, events: Iterable[ArgoEventPayload], **options: Any
+) -> tuple[ReplayProgress, list[dict[str, Any]]]:
+    async def run() -> tuple[ReplayProgress, list[dict[str, Any]]]:
+        async with (
+            StandInWebhook(faults=faults, keep=1000, seed=0) as webhook,
+            EventPublisher(breaker=CircuitBreaker(failure_threshold=1000), history=None) as publisher,
+        ):
+            progress = await replay_events(publisher, events, webhook.url, retry_delay=0, **options)
+            return progress, list(webhook.received)
+
+    return asyncio.run(run())
+
+
+def test_recorded_formats_are_read_and_filtered(tmp_path: Path) -> None:
+    first, second, third = _payloads(3)
+    output = {"event_id": second.id, "name": second.name, "timestamp": second.timestamp, "payload": {"seq": "1"}}
+    plain = tmp_path / "events.ndjson"
+    plain.write_bytes(encode_webhook_body(first) + b"\n\n" + json.dumps(output).encode() + b"\nnot json\n")
+    compressed = tmp_path / "events.ndjson.gz"
+    compressed.write_bytes(gzip.compress(third.model_dump_json().encode() + b"\n"))
+
+    progress = ReplayProgress()
+    events = iter_recorded_events([str(plain), str(compressed)], ReplayFilter(names=("event_[02]",)), progress)
+    assert [(event.id, event.model_extra) for event in events] == [("id-0", {"seq": "0"}), ("id-2", {"seq": "2"})]
+    assert {key: progress.to_dict()[key] for key in ("read", "matched", "skipped")} == {
+        "read": 4,
+        "matched": 2,
+        "skipped": 1,
+    }
+
+
+def test_order_is_kept_within_each_partition() -> None:
+    payloads = _payloads(90)
+    progress, received = _replay(Faults(jitter=0.005), payloads, concurrency=4)
+
+    assert progress.replayed == len(payloads)
+    for name in ("event_0", "event_1", "event_2"):
+        sent = [int(body["payload"]["seq"]) for body in received if body["name"] == name]
+        assert sent == sorted(sent)
+        assert len(sent) == len(payloads) // 3
+
+
+def test_failed_events_are_retried_then_written_out() -> None:
+    failures = io.BytesIO()
+    progress, _ = _replay(Faults(error_rate=1), _payloads(2), retries=1, on_failure=failure_writer(failures))
+
+    assert (progress.replayed, progress.failed) == (0, len(["id-0", "id-1"]))
+    assert sorted(json.loads(line)["payload"]["id"] for line in failures.getvalue().splitlines()) == ["id-0", "id-1"]
+
+
+@pytest.mark.parametrize("interval", ["0", "-1", "0.01"])
+def test_progress_interval_must_be_positive(tmp_path: Path, interval: str) -> None:
+    recorded = tmp_path / "events.ndjson"
+    recorded.write_text("")
+    result = CliRunner().invoke(app, ["replay", str(recorded), "--dry-run", "--progress-interval", interval])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--progress-interval" in result.output
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from metaflow_argo_events.models.parameters import FlowParameters
+from metaflow_argo_events.schema import cache as cache_module
+from metaflow_argo_events.schema.cache import CacheStats, SchemaCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ENTRY_SUFFIX = ".schema.json"
+
+
+def _flows(name: str) -> list[FlowParameters]:
+    return [FlowParameters(flow_name=name)]
+
+
+@pytest.fixture
+def flow_file(tmp_path: Path) -> Path:
+    (tmp_path / "helpers.py").write_text('OWNER = "data"\n')
+    path = tmp_path / "flow_a.py"
+    path.write_text("import helpers\n\n\nclass FlowA:\n    pass\n")
+    return path
+
+
+def test_key_follows_flow_source(flow_file: Path) -> None:
+    cache = SchemaCache(flow_file.parent / "cache")
+    before = cache.key_for(flow_file)
+    assert cache.key_for(flow_file) == before
+    flow_file.write_text(flow_file.read_text() + "# edited\n")
+    assert cache.key_for(flow_file) != before
+
+
+def test_key_follows_local_dependency(flow_file: Path) -> None:
+    cache = SchemaCache(flow_file.parent / "cache")
+    before = cache.key_for(flow_file)
+    (flow_file.parent / "helpers.py").write_text('OWNER = "platform"\n')
+    assert cache.key_for(flow_file) != before
+
+
+def test_key_follows_metaflow_version(flow_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = SchemaCache(flow_file.parent / "cache")
+    monkeypatch.setattr(cache_module, "metaflow_version", lambda: "2.0.0")
+    before = cache.key_for(flow_file)
+    monkeypatch.setattr(cache_module, "metaflow_version", lambda: "2.0.1")
+    assert cache.key_for(flow_file) != before
+
+
+def test_get_or_extract_extracts_once(flow_file: Path) -> None:
+    cache = SchemaCache(flow_file.parent / "cache")
+    calls: list[Path] = []
+
+    def extract(path: Path) -> list[FlowParameters]:
+        calls.append(path)
+        return _flows("FlowA")
+
+    first = cache.get_or_extract(flow_file, extract)
+    second = cache.get_or_extract(flow_file, extract)
+    assert first == second == _flows("FlowA")
+    assert calls == [flow_file]
+    assert cache.stats == CacheStats(hits=1, misses=1, stores=1)
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.put(key, _flows("Flow"))
+    for key, mtime in {"a": 1000, "b": 3000, "c": 2000}.items():
+        os.utime(tmp_path / f"{key}{ENTRY_SUFFIX}", (mtime, mtime))
+    cache.max_bytes = 2 * (tmp_path / f"a{ENTRY_SUFFIX}").stat().st_size
+
+    assert cache.evict() == 1
+    assert sorted(path.name for path in tmp_path.glob(f"*{ENTRY_SUFFIX}")) == [f"b{ENTRY_SUFFIX}", f"c{ENTRY_SUFFIX}"]
+    assert cache.stats.evictions == 1
+    assert cache.evict() == 0
+
+
+def test_get_marks_entry_recently_used(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    for key in ("a", "b"):
+        cache.put(key, _flows("Flow"))
+        os.utime(tmp_path / f"{key}{ENTRY_SUFFIX}", (1000, 1000))
+    assert cache.get("a") == _flows("Flow")
+    cache.max_bytes = (tmp_path / f"a{ENTRY_SUFFIX}").stat().st_size
+
+    assert cache.evict() == 1
+    assert [path.name for path in tmp_path.glob(f"*{ENTRY_SUFFIX}")] == [f"a{ENTRY_SUFFIX}"]
+
+
+def test_corrupt_entry_is_discarded(tmp_path: Path) -> None:
+    cache = SchemaCache(tmp_path)
+    entry = tmp_path / f"broken{ENTRY_SUFFIX}"
+    entry.write_text('[{"flow_name": ')
+
+    assert cache.get("broken") is None
+    assert not entry.exists()
+    assert cache.stats == CacheStats(misses=1)
+
+
+def test_save_stats_merges_counters(tmp_path: Path) -> None:
+    first, second = SchemaCache(tmp_path), SchemaCache(tmp_path)
+    first.put("a", _flows("Flow"))
+    first.get("a")
+    second.get("a")
+    second.get("missing")
+
+    first.save_stats()
+    second.save_stats()
+
+    assert first.stats == second.stats == CacheStats()
+    assert SchemaCache(tmp_path).persisted_stats() == CacheStats(hits=2, misses=1, stores=1)
+    summary = SchemaCache(tmp_path).summary()
+    assert (summary["entries"], summary["hit_rate"]) == (1, round(2 / 3, 4))
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+from loguru import logger
+
+from metaflow_argo_events.exceptions import SchemaError
+from metaflow_argo_events.logger import configure_logging
+from metaflow_argo_events.models.parameters import FlowParameters
+from metaflow_argo_events.schema import generate as generate_module
+from metaflow_argo_events.schema.cache import SchemaCache
+from metaflow_argo_events.schema.generate import ExtractionResult, discover_flow_files, extract_many, ordered_flows
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FLOW = """
+from metaflow import FlowSpec, Parameter, step
+
+class {name}(FlowSpec):
+    owner = Parameter("owner", default="data")
+
+    @step
+    def start(self):
+        self.next(self.end)
+
+    @step
+    def end(self):
+        pass
+"""
+
+
+def _write_flow(path: Path, name: str) -> Path:
+    path.write_text(textwrap.dedent(FLOW.format(name=name)))
+    return path
+
+
+def test_discover_walks_directories_and_filters_on_flowspec(tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    flow = _write_flow(tmp_path / "nested" / "flow_a.py", "FlowA").resolve()
+    (tmp_path / "utils.py").write_text("VALUE = 1\n")
+    (tmp_path / "notes.txt").write_text("FlowSpec\n")
+    (tmp_path / ".venv").mkdir()
+    _write_flow(tmp_path / ".venv" / "vendored.py", "Vendored")
+    explicit = tmp_path / "explicit.py"
+    explicit.write_text("VALUE = 2\n")
+
+    assert discover_flow_files([tmp_path, explicit]) == sorted([flow, explicit.resolve()])
+
+
+def test_discover_skips_broken_symlinks(tmp_path: Path) -> None:
+    flow = _write_flow(tmp_path / "flow_a.py", "FlowA")
+    (tmp_path / "dangling.py").symlink_to(tmp_path / "missing.py")
+    messages: list[str] = []
+    configure_logging()
+    sink = logger.add(lambda message: messages.append(message.record["message"]), level="WARNING")
+    try:
+        assert discover_flow_files([tmp_path]) == [flow.resolve()]
+    finally:
+        logger.remove(sink)
+    assert len(messages) == 1
+    assert messages[0].startswith(f"Skipping unreadable file {tmp_path / 'dangling.py'}")
+
+
+def test_extract_many_keeps_input_order_and_reports_errors(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.py"
+    broken.write_text("from metaflow import FlowSpec\nraise RuntimeError('boom')\n")
+    flow_b = _write_flow(tmp_path / "flow_b.py", "FlowB")
+    flow_a = _write_flow(tmp_path / "flow_a.py", "FlowA")
+    cache = SchemaCache(tmp_path / "cache")
+
+    results = extract_many([flow_b, broken, flow_a], jobs=2, cache=cache)
+
+    assert [result.flow_file for result in results] == [flow_b, broken, flow_a]
+    assert [[flow.flow_name for flow in result.flows] for result in results] == [["FlowB"], [], ["FlowA"]]
+    assert results[0].error is None
+    assert results[1].error is not None
+    assert "boom" in results[1].error
+    assert cache.stats.stores == len([flow_a, flow_b])
+
+
+def test_extract_many_answers_cache_hits_without_workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    flow = _write_flow(tmp_path / "flow_a.py", "FlowA")
+    cache = SchemaCache(tmp_path / "cache")
+    cache.put(cache.key_for(flow), [FlowParameters(flow_name="FlowA")])
+
+    def no_pool(*_: object, **__: object) -> None:
+        pytest.fail("a cache hit spawned a worker pool")
+
+    monkeypatch.setattr(generate_module, "ProcessPoolExecutor", no_pool)
+    (result,) = extract_many([flow], cache=cache)
+
+    assert (result.cached, result.flows) == (True, [FlowParameters(flow_name="FlowA")])
+
+
+def test_ordered_flows_sorts_within_files_and_keeps_file_order(tmp_path: Path) -> None:
+    results = [
+        ExtractionResult(tmp_path / "b.py", [FlowParameters(flow_name="Zeta"), FlowParameters(flow_name="Alpha")]),
+        ExtractionResult(tmp_path / "a.py", [FlowParameters(flow_name="Beta")]),
+        ExtractionResult(tmp_path / "c.py", error="failed"),
+    ]
+    assert [flow.flow_name for flow in ordered_flows(results)] == ["Alpha", "Zeta", "Beta"]
+
+
+def test_ordered_flows_rejects_duplicate_names(tmp_path: Path) -> None:
+    results = [
+        ExtractionResult(tmp_path / "a.py", [FlowParameters(flow_name="FlowA")]),
+        ExtractionResult(tmp_path / "b.py", [FlowParameters(flow_name="FlowA")]),
+    ]
+    with pytest.raises(SchemaError) as excinfo:
+        ordered_flows(results)
+    assert excinfo.value.errors == [f"FlowA: {tmp_path / 'a.py'} and {tmp_path / 'b.py'}"]
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from metaflow_argo_events.models.trusted import encode_webhook_body, trusted_event_payload
+from metaflow_argo_events.publish import EventPublisher
+from metaflow_argo_events.publish.breaker import CircuitBreaker
+from metaflow_argo_events.publish.loadtest import LoadTestResult, percentile, run_load_test
+from metaflow_argo_events.publish.standin import Faults, StandInWebhook
+from metaflow_argo_events.publish.transport import ConnectionPool
+
+BODY = encode_webhook_body(trusted_event_payload("standin", "id-1", 1700000000, "20231114"))
+
+
+def _post(faults: Faults, *bodies: bytes) -> tuple[list[tuple[int, str | None]], dict[str, Any]]:
+    async def run() -> tuple[list[tuple[int, str | None]], dict[str, Any]]:
+        async with StandInWebhook(faults=faults, seed=0) as webhook:
+            pool = ConnectionPool()
+            try:
+                responses = [
+                    await pool.request("POST", webhook.url, headers={"Content-Type": "application/json"}, body=body)
+                    for body in bodies
+                ]
+                stats = await pool.request("GET", webhook.url + "stats")
+            finally:
+                await pool.close()
+        return [(r.status, r.headers.get("retry-after")) for r in responses], json.loads(stats.body)
+
+    return asyncio.run(run())
+
+
+def test_valid_and_invalid_bodies() -> None:
+    responses, stats = _post(Faults(), BODY, b'{"name": "standin", "payload": {"id": 1}}', b"{")
+    assert responses == [(200, None), (400, None), (400, None)]
+    assert {key: stats[key] for key in ("requests", "events", "rejected")} == {
+        "requests": 3,
+        "events": 1,
+        "rejected": 2,
+    }
+
+
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        b"GARBAGE\r\n\r\n",
+        b"POST / HTTP/1.1\r\nContent-Length: lots\r\n\r\n",
+        b"POST / HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+    ],
+    ids=["request-line", "content-length", "negative-length"],
+)
+def test_malformed_request_gets_400_and_close(request_head: bytes) -> None:
+    async def run() -> tuple[bytes, int]:
+        async with StandInWebhook() as webhook:
+            reader, writer = await asyncio.open_connection(webhook.host, webhook.port)
+            writer.write(request_head)
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            pool = ConnectionPool()
+            try:
+                health = await pool.request("GET", webhook.url + "healthz")
+            finally:
+                await pool.close()
+        return response, health.status
+
+    response, health = asyncio.run(run())
+    assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close\r\n" in response
+    assert health == 200  # noqa: PLR2004
+
+
+def test_injected_faults() -> None:
+    responses, _ = _post(Faults(throttle_rate=1, retry_after=2), BODY)
+    assert responses == [(429, "2")]
+    responses, stats = _post(Faults(error_rate=1), BODY)
+    assert responses == [(500, None)]
+    assert {key: stats[key] for key in ("errors", "events")} == {"errors": 1, "events": 0}
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    ordered = [float(i) for i in range(1, 101)]
+    assert [percentile(ordered, fraction) for fraction in (0.5, 0.95, 0.99, 1.0)] == [50.0, 95.0, 99.0, 100.0]
+    assert percentile([], 0.5) == 0.0
+
+
+def test_load_test_delivers_every_scheduled_event() -> None:
+    async def run() -> LoadTestResult:
+        async with (
+            StandInWebhook() as webhook,
+            EventPublisher(breaker=CircuitBreaker(), history=None) as publisher,
+        ):
+            return await run_load_test(publisher, webhook.url, rate=400, duration=0.25)
+
+    result = asyncio.run(run()).to_dict()
+    assert {key: result[key] for key in ("sent", "succeeded", "failed", "dropped")} == {
+        "sent": 100,
+        "succeeded": 100,
+        "failed": 0,
+        "dropped": 0,
+    }
+    assert 0 < result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"] <= result["max_ms"]
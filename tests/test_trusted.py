@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from metaflow_argo_events.models import ArgoEventPayload, CreateArgoEventInput
+from metaflow_argo_events.models.trusted import (
+    dump_json_bytes,
+    encode_webhook_body,
+    trusted_create_event_input,
+    trusted_event_payload,
+)
+
+REQUIRED = {"name": "orders", "id": "id-1", "timestamp": 1700000000, "utc_date": "20231114"}
+
+
+def _assert_same(trusted: BaseModel, validated: BaseModel) -> None:
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_extra == validated.model_extra
+    assert trusted.model_dump() == validated.model_dump()
+    assert dump_json_bytes(trusted) == dump_json_bytes(validated)
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        None,
+        {},
+        {"run": "42", "step": "start"},
+        {"nested": {"a": [1, 2]}, "count": 3},
+        {"generated_by_metaflow": False},
+        {"timestamp": "1700000001", "run": "42"},
+        {"name": "renamed"},
+    ],
+    ids=["none", "empty", "extras", "non-string-extras", "override-flag", "override-coerced", "override-name"],
+)
+def test_trusted_payload_matches_model_validate(extra: dict[str, Any] | None) -> None:
+    trusted = trusted_event_payload(*REQUIRED.values(), extra)
+    validated = ArgoEventPayload.model_validate({**REQUIRED, **(extra or {})})
+
+    _assert_same(trusted, validated)
+    assert encode_webhook_body(trusted) == encode_webhook_body(validated)
+
+
+def test_generated_by_metaflow_defaults_to_true() -> None:
+    payload = trusted_event_payload(*REQUIRED.values())
+    assert payload.generated_by_metaflow is True
+    assert "generated_by_metaflow" not in payload.model_fields_set
+
+
+def test_invalid_override_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        trusted_event_payload(*REQUIRED.values(), {"timestamp": "yesterday"})
+
+
+def test_extra_is_copied() -> None:
+    extra = {"run": "42"}
+    payload = trusted_event_payload(*REQUIRED.values(), extra)
+    extra["run"] = "43"
+    assert payload.model_extra == {"run": "42"}
+
+
+@pytest.mark.parametrize(
+    ("payload", "fields"),
+    [
+        (None, {}),
+        ({"run": 42, "ok": True, "ratio": 0.5, "tag": "x"}, {}),
+        ({"run": "42"}, {"url": "http://webhook/", "force": True, "ignore_errors": True}),
+    ],
+    ids=["defaults", "stringified", "fields"],
+)
+def test_trusted_create_event_input_matches_model_validate(
+    payload: dict[str, Any] | None, fields: dict[str, Any]
+) -> None:
+    trusted = trusted_create_event_input("orders", payload, **fields)
+    validated = CreateArgoEventInput.model_validate({"name": "orders", "payload": payload or {}, **fields})
+
+    _assert_same(trusted, validated)
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2025-present Bryan Galvin <bcgalvin@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from metaflow_argo_events.models import validate_parameters
+
+
+def test_every_problem_is_reported_against_its_parameter() -> None:
+    definitions = [
+        {"name": "alpha", "type": "int", "required": "yes"},
+        {"name": "beta", "type": "map"},
+        "not a mapping",
+        {"type": "str"},
+        {"name": "tags"},
+        {"name": "gamma", "type": "int", "separator": ","},
+        {"name": "alpha"},
+        {"name": "delta", "show_default": "off", "owner": "data"},
+    ]
+
+    response, errors = validate_parameters(definitions)
+
+    assert [(error.error_code, error.parameter_name, error.field) for error in errors] == [
+        ("INVALID_TYPE", "beta", "type"),
+        ("INVALID_DEFINITION", None, None),
+        ("MISSING_FIELD", None, "name"),
+        ("RESERVED_NAME", "tags", "name"),
+        ("INVALID_SEPARATOR", "gamma", "separator"),
+        ("DUPLICATE_NAME", "alpha", "name"),
+    ]
+    # Valid definitions get pydantic's usual coercions and keep their extra keys.
+    assert [(p.name, p.required, p.show_default, p.additional_properties) for p in response.parameters] == [
+        ("alpha", True, True, None),
+        ("delta", False, False, {"owner": "data"}),
+    ]
+    assert response.count == len(response.parameters)